@@ -4,6 +4,7 @@ __all__ = [
     "__version__",
     "__version_tuple__",
     # Modules
+    "compile_cache",
     "coordinates",
     "potential",
     "dynamics",
@@ -21,6 +22,9 @@ from . import (
     typing,
     utils,
 )
+
+# isort: split
+from . import compile_cache
 from ._version import version as __version__, version_tuple as __version_tuple__
 
 # Optional dependencies
@@ -0,0 +1,219 @@
+"""Persistent compilation cache.
+
+Compiling the integrators, e.g. :meth:`galax.dynamics.DynamicsSolver.solve`
+with a high-order Runge-Kutta solver and dense output, can take much longer
+than integrating. :func:`enable` turns on JAX's persistent compilation cache so
+that the compiled programs are reused across processes, and :func:`warmup`
+compiles the integration for a set of batch shapes ahead of time.
+
+The cache can also be enabled by setting the ``GALAX_COMPILATION_CACHE_DIR``
+environment variable before importing :mod:`galax`.
+
+"""
+
+__all__ = ["CacheStats", "enable", "disable", "stats", "reset_stats", "warmup"]
+
+import os
+import pathlib
+import time
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+import jax
+from jax.experimental.compilation_cache import compilation_cache as jax_cc
+
+import unxt as u
+
+import galax.coordinates as gc
+import galax.dynamics as gd
+import galax.potential as gp
+from ._version import version
+
+_HITS = "/jax/compilation_cache/cache_hits"
+_REQUESTS = "/jax/compilation_cache/compile_requests_use_cache"
+_events: Counter[str] = Counter()
+
+
+def _count(event: str, **_: Any) -> None:
+    if event in (_HITS, _REQUESTS):
+        _events[event] += 1
+
+
+jax.monitoring.register_event_listener(_count)
+
+
+class CacheStats(NamedTuple):
+    """The number of compilations served from, and missing, the cache."""
+
+    hits: int
+    """Compilations loaded from the persistent cache."""
+
+    misses: int
+    """Compilations that were not in the persistent cache."""
+
+
+def enable(
+    path: str | os.PathLike[str], /, *, min_compile_time: float = 0.0
+) -> pathlib.Path:
+    """Enable the persistent compilation cache.
+
+    The compiled programs are stored in a subdirectory of ``path`` specific to
+    the version of galax, so upgrading galax does not reuse stale programs.
+    JAX further keys each program on the JAX version, the backend and the
+    compiled computation. Several processes may share the same directory.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The directory of the cache. It is created if it does not exist.
+    min_compile_time : float, optional
+        Programs that compile faster than this many seconds are not cached.
+
+    Returns
+    -------
+    pathlib.Path
+        The directory in which the programs are cached.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import galax.compile_cache
+
+    >>> tmpdir = tempfile.TemporaryDirectory()
+    >>> path = galax.compile_cache.enable(tmpdir.name)
+    >>> path.name.startswith("galax-")
+    True
+
+    >>> galax.compile_cache.disable()
+    >>> tmpdir.cleanup()
+
+    """
+    cache_dir = pathlib.Path(path).expanduser() / f"galax-{version}"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    jax.config.update("jax_persistent_cache_min_compile_time_secs", min_compile_time)
+    jax.config.update("jax_persistent_cache_min_entry_size_bytes", 0)
+    # JAX initializes its cache at the first compilation, so reset it in case
+    # anything was compiled before the cache directory was set.
+    jax_cc.reset_cache()
+    jax_cc.set_cache_dir(str(cache_dir))
+    return cache_dir
+
+
+def disable() -> None:
+    """Disable the persistent compilation cache.
+
+    Examples
+    --------
+    >>> import galax.compile_cache
+    >>> galax.compile_cache.disable()
+
+    """
+    jax_cc.reset_cache()
+    jax.config.update("jax_compilation_cache_dir", None)
+
+
+def stats() -> CacheStats:
+    """Return the number of cache hits and misses in this process.
+
+    Examples
+    --------
+    >>> import galax.compile_cache
+    >>> galax.compile_cache.reset_stats()
+    >>> galax.compile_cache.stats()
+    CacheStats(hits=0, misses=0)
+
+    """
+    hits = _events[_HITS]
+    return CacheStats(hits=hits, misses=_events[_REQUESTS] - hits)
+
+
+def reset_stats() -> None:
+    """Reset the number of cache hits and misses to zero."""
+    _events.clear()
+
+
+def warmup(
+    potential: gp.AbstractPotential,
+    batch_shapes: Iterable[tuple[int, ...]],
+    /,
+    solver: gd.DynamicsSolver | None = None,
+    *,
+    ts: Any,
+    dense: bool = False,
+) -> dict[tuple[int, ...], float]:
+    """Compile :func:`galax.dynamics.compute_orbit` ahead of time.
+
+    The orbits are integrated from :class:`~galax.coordinates.PhaseSpacePosition`
+    initial conditions of each batch shape, saved at times with the shape of
+    ``ts``. The compiled programs depend only on the types and shapes of the
+    inputs, so later calls with the same shapes, the same potential type and
+    the same solver reuse them. Each program is also stored in the persistent
+    cache if it is enabled.
+
+    Parameters
+    ----------
+    potential : AbstractPotential
+        The potential.
+    batch_shapes : Iterable[tuple[int, ...]]
+        The batch shapes of the initial conditions, e.g. ``[(), (1000,)]``.
+    solver : DynamicsSolver | None, optional
+        The solver, defaults to ``DynamicsSolver()``.
+    ts : Quantity[float, (T,), "time"]
+        The times at which the orbits will be saved. Only the shape is used.
+    dense : bool, optional
+        Whether the orbits will have dense output.
+
+    Returns
+    -------
+    dict[tuple[int, ...], float]
+        The wall-clock time, in seconds, spent on each batch shape.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.compile_cache
+    >>> import galax.coordinates as gc
+    >>> import galax.dynamics as gd
+    >>> import galax.potential as gp
+
+    >>> pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    >>> ts = u.Quantity(jnp.linspace(0, 1, 10), "Gyr")
+    >>> timings = galax.compile_cache.warmup(pot, [(2,)], ts=ts)
+    >>> list(timings)
+    [(2,)]
+
+    Integrations with these shapes are now already compiled:
+
+    >>> w0 = gc.PhaseSpacePosition(q=u.Quantity([[10, 0, 0], [8, 0, 0]], "kpc"),
+    ...                            p=u.Quantity([[0, 200, 0], [0, 220, 0]], "km/s"))
+    >>> orbit = gd.compute_orbit(pot, w0, ts)
+    >>> orbit.shape
+    (2, 10)
+
+    """
+    usys = potential.units
+    ts = u.Quantity.from_(ts, usys["time"])
+    # The compiled programs do not depend on the values of the times, so the
+    # integration is over a tiny interval, which takes few steps.
+    ts = ts[0] + (ts - ts[0]) * 1e-9
+
+    timings = {}
+    for shape in map(tuple, batch_shapes):
+        q = jax.numpy.broadcast_to(jax.numpy.array([1.0, 0, 0]), (*shape, 3))
+        p = jax.numpy.broadcast_to(jax.numpy.array([0, 1e-3, 0]), (*shape, 3))
+        w0 = gc.PhaseSpacePosition(
+            q=u.Quantity(q, usys["length"]), p=u.Quantity(p, usys["speed"])
+        )
+
+        tic = time.perf_counter()
+        orbit = gd.compute_orbit(potential, w0, ts, solver=solver, dense=dense)
+        jax.block_until_ready(orbit)
+        timings[shape] = time.perf_counter() - tic
+    return timings
+
+
+if (_path := os.environ.get("GALAX_COMPILATION_CACHE_DIR")) is not None:
+    enable(_path)
@@ -8,8 +8,10 @@ __all__ = [
     "mockstream",
     "plot",
     "cluster",
+    "parallel",
     # solve
     "compute_orbit",
+    "compute_orbit_chunks",
     "evaluate_orbit",  # TODO: deprecate
     "Orbit",
     "AbstractSolver",
@@ -35,10 +37,10 @@ from jaxtyping import install_import_hook
 from galax.setup_package import RUNTIME_TYPECHECKER
 
 with install_import_hook("galax.dynamics", RUNTIME_TYPECHECKER):
-    from . import cluster, fields, integrate, mockstream, plot
+    from . import cluster, fields, integrate, mockstream, parallel, plot
     from ._src.api import omega, specific_angular_momentum
     from ._src.cluster import lagrange_points, tidal_radius
-    from ._src.orbit import Orbit, compute_orbit
+    from ._src.orbit import Orbit, compute_orbit, compute_orbit_chunks
     from .integrate import evaluate_orbit
     from .mockstream import (
         AbstractStreamDF,
@@ -2,6 +2,13 @@
 
 __all__ = [
     "DynamicsSolver",
+    # Symplectic solvers
+    "AbstractSymplecticSolver",
+    "Leapfrog",
+    "Ruth3",
+    "Yoshida4",
+    "Yoshida6",
+    "Yoshida8",
     # Fields
     "AbstractDynamicsField",
     "HamiltonianField",
@@ -15,3 +22,11 @@ from .field_hamiltonian import HamiltonianField
 from .field_nbody import NBodyField
 from .parsetime import parse_time_specification
 from .solver import DynamicsSolver
+from .symplectic import (
+    AbstractSymplecticSolver,
+    Leapfrog,
+    Ruth3,
+    Yoshida4,
+    Yoshida6,
+    Yoshida8,
+)
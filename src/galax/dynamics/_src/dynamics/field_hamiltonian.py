@@ -20,6 +20,7 @@ import galax.dynamics._src.custom_types as gdt
 import galax.potential as gp
 import galax.typing as gt
 from .field_base import AbstractDynamicsField
+from .symplectic import AbstractSymplecticSolver
 
 
 @final
@@ -292,6 +293,30 @@ def terms(
     return (dfx.ODETerm(self._dqdt), dfx.ODETerm(self._dpdt))
 
 
+@AbstractDynamicsField.terms.dispatch  # type: ignore[misc]
+def terms(
+    self: HamiltonianField,
+    _: AbstractSymplecticSolver,
+    /,
+) -> tuple[dfx.AbstractTerm, dfx.AbstractTerm]:
+    r"""Return the AbstractTerm terms for the symplectic solvers.
+
+    Examples
+    --------
+    >>> import unxt as u
+    >>> import galax.potential as gp
+    >>> import galax.dynamics as gd
+
+    >>> pot = gp.KeplerPotential(m_tot=u.Quantity(1e12, "Msun"), units="galactic")
+    >>> field = gd.fields.HamiltonianField(pot)
+
+    >>> field.terms(gd.solve.Yoshida4())
+    (ODETerm( ... ), ODETerm( ... ))
+
+    """
+    return (dfx.ODETerm(self._dqdt), dfx.ODETerm(self._dpdt))
+
+
 # ===============================================
 # Call dispatches
 
@@ -7,13 +7,17 @@ This is private API.
 __all__ = ["DynamicsSolver"]
 
 
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import KW_ONLY
 from functools import partial
-from typing import Any, TypeAlias, final
+from typing import Any, Literal, TypeAlias, final
 
 import diffrax as dfx
 import equinox as eqx
+import jax
 import jax.tree as jtu
+import optimistix as optx
+from jax.sharding import Mesh
 from jaxtyping import PyTree
 from plum import convert, dispatch
 
@@ -21,6 +25,7 @@ import coordinax as cx
 import diffraxtra as dfxtra
 import quaxed.numpy as jnp
 import unxt as u
+from dataclassish import replace
 from unxt.quantity import BareQuantity as FastQ
 
 import galax.coordinates as gc
@@ -28,10 +33,12 @@ import galax.dynamics._src.custom_types as gdt
 import galax.typing as gt
 from .field_base import AbstractDynamicsField
 from galax.dynamics._src.compat import AllowValue
+from galax.dynamics._src.sharding import parse_mesh, shard_blocks, shard_vmap
 from galax.dynamics._src.solver import AbstractSolver, SolveState, Terms
-from galax.dynamics._src.utils import parse_saveat
+from galax.dynamics._src.utils import iter_chunks, parse_saveat
 
 BBtQParr: TypeAlias = tuple[gdt.BBtQarr, gdt.BBtParr]
+BatchMode: TypeAlias = Literal["shared", "vectorize", "bucketed"]
 
 default_saveat = dfx.SaveAt(t1=True)
 
@@ -395,6 +402,36 @@ class DynamicsSolver(AbstractSolver, strict=True):  # type: ignore[call-arg]
         - "vectorize_interpolation" (bool): If `True`, the interpolation is
           vectorized using
           `galax.dynamics.integrate.VectorizedDenseInterpolation`.
+        - "batch_mode" (str | None): How a batch of initial conditions with
+          scalar start and end times is integrated.
+
+          - `None` (default): as one ODE, with one step-size controller shared
+            by all the orbits.
+          - "shared": as `None`, but the error of a
+            `diffrax.PIDController` is measured with ``batch_norm``, so the
+            steps are set by the least accurate orbit.
+          - "vectorize": each orbit with its own steps, as for batched start
+            and end times. The output shape is (*batch, [time], *shape).
+          - "bucketed": the orbits are sorted by their dynamical time,
+            ``sqrt(|q| / |dp/dt|)``, and split into ``n_buckets``
+            buckets, each integrated as in "shared". Orbits with very
+            different timescales then do not all take the smallest steps.
+            Dense output is not supported.
+
+        - "batch_norm" (Callable): the norm of "shared" and "bucketed", default
+          `optimistix.max_norm`.
+        - "n_buckets" (int): the number of buckets of "bucketed", default 4.
+        - "devices" (int | Sequence[jax.Device]) or "mesh"
+          (`jax.sharding.Mesh`): the devices over which to shard a batch of
+          initial conditions. The flattened batch is padded, by repeating the
+          last initial condition, to equal shards, one per device, which are
+          solved independently with `jax.experimental.shard_map.shard_map`.
+          With scalar start and end times each shard shares its steps, and
+          ``stats`` are per shard. Dense output is then not supported. An
+          integer ``devices`` is the number of `jax.devices` to use. On CPU
+          the number of devices is set with
+          ``XLA_FLAGS=--xla_force_host_platform_device_count=N`` before JAX
+          is imported.
 
         The output shape aligns with `diffrax.diffeqsolve`: (*batch, [time],
         *shape), where [time] is >= 1. The `unbatch_time` keyword argument can
@@ -469,6 +506,22 @@ class DynamicsSolver(AbstractSolver, strict=True):  # type: ignore[call-arg]
         Solution( t0=f64[], t1=f64[], ts=f64[1],
                   ys=(f64[1,2,3], f64[1,2,3]), ... )
 
+        The orbits share their steps. With ``batch_mode="vectorize"`` each
+        orbit has its own steps, and the time dimension follows the batch.
+
+        >>> soln = solver.solve(field, w0s, t0, t1, batch_mode="vectorize")
+        >>> soln
+        Solution( t0=f64[2], t1=f64[2], ts=f64[2,1],
+                  ys=(f64[2,1,3], f64[2,1,3]), ... )
+
+        With ``batch_mode="bucketed"`` orbits with similar dynamical times
+        share their steps.
+
+        >>> soln = solver.solve(field, w0s, t0, t1, batch_mode="bucketed",
+        ...                     n_buckets=2)
+        >>> soln.ys[0].shape
+        (1, 2, 3)
+
         This can be batched with a set of times. The resulting
         `diffrax.Solution` has a `ys` shape of (*batch, [time], *shape, 3).
 
@@ -600,6 +653,41 @@ class DynamicsSolver(AbstractSolver, strict=True):  # type: ignore[call-arg]
         """
         raise NotImplementedError  # pragma: no cover
 
+    def solve_chunks(
+        self, field: Any, w0: Any, /, *args: Any, chunk_size: int, **solver_kw: Any
+    ) -> Iterator[dfx.Solution]:
+        """Solve the dynamics in chunks of the batch of initial conditions.
+
+        The batch of ``w0`` is flattened and split into chunks of
+        ``chunk_size`` initial conditions, except for the last. Each chunk is
+        solved with :meth:`solve`, with the other arguments, when the iterator
+        reaches it, so only one chunk's solution is held at a time. The
+        compiled program is reused for all the chunks of the same size, i.e.
+        it is compiled at most twice.
+
+        Examples
+        --------
+        >>> import unxt as u
+        >>> import galax.potential as gp
+        >>> import galax.dynamics as gd
+
+        >>> pot = gp.HernquistPotential(m_tot=u.Quantity(1e12, "Msun"),
+        ...                             r_s=u.Quantity(5, "kpc"), units="galactic")
+        >>> field = gd.fields.HamiltonianField(pot)
+        >>> solver = gd.DynamicsSolver()
+
+        >>> w0s = (u.Quantity([[8, 0, 0], [9, 0, 0], [10, 0, 0]], "kpc"),
+        ...        u.Quantity([0, 220, 0], "km/s"))
+        >>> t0, t1 = u.Quantity(0, "Gyr"), u.Quantity(1, "Gyr")
+        >>> for soln in solver.solve_chunks(field, w0s, t0, t1, chunk_size=2):
+        ...     print(soln.ys[0].shape)
+        (1, 2, 3)
+        (1, 1, 3)
+
+        """
+        for w in iter_chunks(w0, chunk_size):
+            yield self.solve(field, w, *args, **solver_kw)
+
 
 # ===============================================
 # Helper
@@ -877,9 +965,61 @@ def solve(
     saveat: Any = default_saveat,
     *,
     unbatch_time: bool = False,
+    batch_mode: BatchMode | None = None,
+    batch_norm: Callable[[PyTree], Any] = optx.max_norm,
+    n_buckets: int = 4,
+    devices: int | Sequence[jax.Device] | None = None,
+    mesh: Mesh | None = None,
     **solver_kw: Any,
 ) -> dfx.Solution:
     """Solve for batch position tuple, scalar start, end time."""
+    shape = jnp.broadcast_shapes(qp[0].shape[:-1], qp[1].shape[:-1])
+    if batch_mode not in (None, "shared", "vectorize", "bucketed"):
+        msg = f"unknown batch_mode {batch_mode!r}"
+        raise ValueError(msg)
+    mesh = parse_mesh(devices, mesh)
+    if batch_mode == "vectorize" and shape != ():
+        t0, t1 = jnp.broadcast_to(t0, shape), jnp.broadcast_to(t1, shape)
+        return self.solve(
+            field, qp, t0, t1, args=args, saveat=saveat, mesh=mesh, **solver_kw
+        )
+    if batch_mode == "bucketed" and shape != ():
+        if mesh is not None:
+            msg = "batch_mode='bucketed' does not support sharding over devices"
+            raise ValueError(msg)
+        return _solve_bucketed(
+            self,
+            field,
+            qp,
+            t0,
+            t1,
+            args=args,
+            saveat=saveat,
+            unbatch_time=unbatch_time,
+            batch_norm=batch_norm,
+            n_buckets=n_buckets,
+            solver_kw=solver_kw,
+        )
+    if batch_mode in ("shared", "bucketed") and isinstance(
+        self.stepsize_controller, dfx.PIDController
+    ):
+        self = replace(
+            self, stepsize_controller=replace(self.stepsize_controller, norm=batch_norm)
+        )
+    if mesh is not None and shape != ():
+        return _solve_sharded(
+            self,
+            field,
+            qp,
+            t0,
+            t1,
+            mesh=mesh,
+            args=args,
+            saveat=saveat,
+            unbatch_time=unbatch_time,
+            solver_kw=solver_kw,
+        )
+
     # Parse inputs
     terms = field.terms(self)
     usys = field.units
@@ -894,13 +1034,174 @@ def solve(
     )
 
     # Check to see if we should try to unbatch in the time dimension.
-    if unbatch_time and soln.ts.shape[soln.t0.ndim] == 1:
+    return _unbatch_time(soln) if unbatch_time else soln
+
+
+def _solve_bucketed(
+    self: DynamicsSolver,
+    field: AbstractDynamicsField,
+    qp: tuple[gdt.BBtQ, gdt.BBtP],
+    t0: gt.RealQuSz0,
+    t1: gt.RealQuSz0,
+    /,
+    *,
+    args: Any,
+    saveat: Any,
+    unbatch_time: bool,
+    batch_norm: Callable[[PyTree], Any],
+    n_buckets: int,
+    solver_kw: dict[str, Any],
+) -> dfx.Solution:
+    """Solve buckets of orbits with similar dynamical times, each shared-step."""
+    if solver_kw.get("dense", False):
+        msg = "batch_mode='bucketed' does not support dense output"
+        raise ValueError(msg)
+
+    usys = field.units
+    q, p = jnp.broadcast_arrays(*parse_to_y0(qp, usys))
+    shape = q.shape[:-1]
+    q, p = q.reshape(-1, 3), p.reshape(-1, 3)
+
+    order = jnp.argsort(
+        _dynamical_time(field, u.ustrip(AllowValue, usys["time"], t0), q, p, args)
+    )
+
+    solns = [
+        _solve_subbatch(
+            self,
+            field,
+            (FastQ(q[idx], usys["length"]), FastQ(p[idx], usys["speed"])),
+            t0,
+            t1,
+            args=args,
+            saveat=saveat,
+            batch_mode="shared",
+            batch_norm=batch_norm,
+            **solver_kw,
+        )
+        for idx in jnp.array_split(order, min(n_buckets, len(order)))
+    ]
+
+    # Undo the sorting, restoring the batch shape.
+    inv = jnp.argsort(order)
+    ys = jtu.map(
+        lambda *ys: (y := jnp.concat(ys, axis=-2)[..., inv, :]).reshape(
+            *y.shape[:-2], *shape, y.shape[-1]
+        ),
+        *(soln.ys for soln in solns),
+    )
+    result = solns[0].result
+    for soln in solns[1:]:
+        result = dfx.RESULTS.where(
+            result == dfx.RESULTS.successful, soln.result, result
+        )
+    soln = eqx.tree_at(
+        lambda tree: (tree.ys, tree.stats, tree.result),
+        solns[0],
+        (
+            ys,
+            jtu.map(lambda *xs: jnp.stack(xs), *(soln.stats for soln in solns)),
+            result,
+        ),
+    )
+
+    return _unbatch_time(soln) if unbatch_time else soln
+
+
+def _solve_sharded(
+    self: DynamicsSolver,
+    field: AbstractDynamicsField,
+    qp: tuple[gdt.BBtQ, gdt.BBtP],
+    t0: gt.RealQuSz0,
+    t1: gt.RealQuSz0,
+    /,
+    *,
+    mesh: Mesh,
+    args: Any,
+    saveat: Any,
+    unbatch_time: bool,
+    solver_kw: dict[str, Any],
+) -> dfx.Solution:
+    """Solve equal shards of the orbits on the devices of ``mesh``."""
+    if solver_kw.get("dense", False):
+        msg = "sharding over devices does not support dense output"
+        raise ValueError(msg)
+
+    usys = field.units
+    q, p = jnp.broadcast_arrays(*parse_to_y0(qp, usys))
+    shape = q.shape[:-1]
+    q, p = q.reshape(-1, 3), p.reshape(-1, 3)
+
+    def solve_shard(q: gdt.BtQarr, p: gdt.BtParr) -> dfx.Solution:
+        soln = _solve_subbatch(
+            self,
+            field,
+            (FastQ(q, usys["length"]), FastQ(p, usys["speed"])),
+            t0,
+            t1,
+            args=args,
+            saveat=saveat,
+            **solver_kw,
+        )
+        return jtu.map(lambda x: jnp.asarray(x)[None], soln)
+
+    # Each leaf has a leading axis over the shards.
+    solns = shard_blocks(solve_shard, mesh, q, p)
+
+    # Merge the shards, removing the padding and restoring the batch shape.
+    n = len(q)
+    ys = jtu.map(
+        lambda y: (y := jnp.moveaxis(y, 0, -3))
+        .reshape(*y.shape[:-3], -1, 3)[..., :n, :]
+        .reshape(*y.shape[:-3], *shape, 3),
+        solns.ys,
+    )
+    failed = solns.result != dfx.RESULTS.successful
+    result = jtu.map(lambda x: x[jnp.argmax(failed)], solns.result)
+    soln = eqx.tree_at(
+        lambda tree: (tree.ys, tree.stats, tree.result),
+        jtu.map(lambda x: x[0], solns),
+        (ys, solns.stats, result),
+    )
+
+    return _unbatch_time(soln) if unbatch_time else soln
+
+
+def _unbatch_time(soln: dfx.Solution, /) -> dfx.Solution:
+    """Squeeze the time dimension, if it is scalar."""
+    if soln.ts.shape[soln.t0.ndim] == 1:
         soln = eqx.tree_at(lambda tree: tree.ts, soln, soln.ts[0])
         soln = eqx.tree_at(lambda tree: tree.ys, soln, jtu.map(lambda y: y[0], soln.ys))
-
     return soln
 
 
+def _dynamical_time(
+    field: AbstractDynamicsField,
+    t: gt.RealSz0,
+    q: gdt.BBtQarr,
+    p: gdt.BBtParr,
+    args: Any,
+    /,
+) -> gt.BBtFloatSz0:
+    """Dynamical time, ``sqrt(|q| / |dp/dt|)``, of each orbit."""
+    _, a = field(t, (q, p), args)
+    return jnp.sqrt(jnp.linalg.norm(q, axis=-1) / jnp.linalg.norm(a, axis=-1))
+
+
+def _solve_subbatch(
+    self: DynamicsSolver,
+    field: AbstractDynamicsField,
+    qp: tuple[gdt.BBtQ, gdt.BBtP],
+    t0: gt.RealQuSz0,
+    t1: gt.RealQuSz0,
+    /,
+    **kwargs: Any,
+) -> dfx.Solution:
+    # A separate function call, so the shape checks of a batch of different
+    # shape do not clash with those of the whole batch.
+    return self.solve(field, qp, t0, t1, **kwargs)
+
+
 def _is_saveat_arr(saveat: Any, /) -> bool:
     return (
         isinstance(saveat, dfx.SaveAt)
@@ -924,6 +1225,12 @@ def solve(
     **solver_kw: Any,
 ) -> dfx.Solution:
     """Solve for batch position tuple, batched start, end time."""
+    if solver_kw.pop("batch_mode", None) not in (None, "vectorize"):
+        msg = "batch_mode 'shared' and 'bucketed' require scalar t0 and t1"
+        raise ValueError(msg)
+    solver_kw.pop("batch_norm", None)
+    solver_kw.pop("n_buckets", None)
+    mesh = parse_mesh(solver_kw.pop("devices", None), solver_kw.pop("mesh", None))
     # Because of how JAX does its tree building over vmaps, vectorizing the
     # interpolation within the loop does not work, it needs to be done after.
     vectorize_interpolation = solver_kw.pop("vectorize_interpolation", False)
@@ -935,7 +1242,16 @@ def solve(
         return self.solve(field, (q, p), t0, t1, args=args, saveat=saveat, **solver_kw)
 
     # Solve the batched problem
-    soln = call(qp[0], qp[1], t0, t1)
+    if mesh is None:
+        soln = call(qp[0], qp[1], t0, t1)
+    else:
+        q, p = qp
+        shape = jnp.broadcast_shapes(q.shape[:-1], p.shape[:-1], t0.shape, t1.shape)
+        q, p = jnp.broadcast_to(q, (*shape, 3)), jnp.broadcast_to(p, (*shape, 3))
+        t0, t1 = jnp.broadcast_to(t0, shape), jnp.broadcast_to(t1, shape)
+        xs = jtu.map(lambda x: x.reshape(-1, *x.shape[len(shape) :]), (q, p, t0, t1))
+        soln = shard_vmap(call, mesh, *xs)
+        soln = jtu.map(lambda x: x.reshape(*shape, *x.shape[1:]), soln)
 
     # NOTE: this is a heuristic that can be improved!
     # The saveat was not vmapped over, so it got erroneously broadcasted.
@@ -0,0 +1,326 @@
+"""Fixed-step symplectic integrators.
+
+This is private API.
+
+"""
+
+__all__ = [
+    "AbstractSymplecticSolver",
+    "Leapfrog",
+    "Ruth3",
+    "Yoshida4",
+    "Yoshida6",
+    "Yoshida8",
+]
+
+from collections.abc import Callable
+from itertools import pairwise
+from typing import Any, ClassVar
+
+import diffrax as dfx
+import jax
+import jax.numpy as jnp
+import jax.tree as jtu
+from jaxtyping import Array, PyTree
+
+import galax.typing as gt
+
+_Y = tuple[PyTree[Array], PyTree[Array]]
+
+
+def _compose(weights: tuple[float, ...], /) -> tuple[tuple[float, ...], ...]:
+    """Drift and kick coefficients of a symmetric composition of leapfrogs."""
+    ws = (*weights[:0:-1], *weights)  # (w_m, ..., w_1, w_0, w_1, ..., w_m)
+    drifts = (
+        ws[0] / 2,
+        *((a + b) / 2 for a, b in pairwise(ws)),
+        ws[-1] / 2,
+    )
+    return drifts, ws
+
+
+class AbstractSymplecticSolver(dfx.AbstractSolver):  # type: ignore[misc]
+    r"""ABC for fixed-step symplectic integrators of separable Hamiltonians.
+
+    A step of size :math:`h` alternates drifts, :math:`q \to q + c_i h p`, and
+    kicks, :math:`p \to p + d_i h a(q)`, starting and ending with a drift. The
+    integrators are explicit and time-reversible, and they conserve the energy
+    without secular drift.
+
+    The terms are the ``(dq/dt, dp/dt)`` pair of
+    `galax.dynamics.fields.HamiltonianField`, as for
+    `diffrax.SemiImplicitEuler`. These solvers do not estimate the error, so
+    they require a `diffrax.ConstantStepSize` controller. With
+    `galax.dynamics.DynamicsSolver` and no dense output, the integration runs
+    in a `jax.lax.scan` over the save times, without the bookkeeping of
+    `diffrax.diffeqsolve`.
+
+    """
+
+    term_structure: ClassVar = (dfx.AbstractTerm, dfx.AbstractTerm)
+    interpolation_cls: ClassVar[Callable[..., dfx.LocalLinearInterpolation]] = (
+        dfx.LocalLinearInterpolation
+    )
+
+    #: The drift coefficients, one more than the kick coefficients.
+    drifts: ClassVar[tuple[float, ...]]
+    #: The kick coefficients.
+    kicks: ClassVar[tuple[float, ...]]
+    #: The order of the integrator.
+    _order: ClassVar[int]
+
+    def order(self, terms: Any) -> int:  # noqa: ARG002
+        return self._order
+
+    def init(
+        self,
+        terms: tuple[dfx.AbstractTerm, dfx.AbstractTerm],
+        t0: gt.RealScalarLike,
+        t1: gt.RealScalarLike,
+        y0: _Y,
+        args: Any,
+    ) -> None:
+        del terms, t0, t1, y0, args
+
+    def step(
+        self,
+        terms: tuple[dfx.AbstractTerm, dfx.AbstractTerm],
+        t0: gt.RealScalarLike,
+        t1: gt.RealScalarLike,
+        y0: _Y,
+        args: Any,
+        solver_state: None,
+        made_jump: Any,
+    ) -> tuple[_Y, None, dict[str, _Y], None, dfx.RESULTS]:
+        del solver_state, made_jump
+        dqdt, dpdt = terms
+        h = t1 - t0
+
+        q, p = y0
+        t = t0
+        for c, d in zip(self.drifts[:-1], self.kicks, strict=True):
+            if c != 0:
+                q = jtu.map(lambda x, v, c=c: x + (c * h) * v, q, dqdt.vf(t, p, args))
+                t = t + c * h
+            p = jtu.map(lambda v, a, d=d: v + (d * h) * a, p, dpdt.vf(t, q, args))
+        c = self.drifts[-1]
+        q = jtu.map(lambda x, v: x + (c * h) * v, q, dqdt.vf(t, p, args))
+
+        y1 = (q, p)
+        return y1, None, {"y0": y0, "y1": y1}, None, dfx.RESULTS.successful
+
+    def func(
+        self,
+        terms: tuple[dfx.AbstractTerm, dfx.AbstractTerm],
+        t0: gt.RealScalarLike,
+        y0: _Y,
+        args: Any,
+    ) -> _Y:
+        dqdt, dpdt = terms
+        return dqdt.vf(t0, y0[1], args), dpdt.vf(t0, y0[0], args)
+
+
+class Leapfrog(AbstractSymplecticSolver):
+    """Second-order drift-kick-drift leapfrog, with one force evaluation.
+
+    Examples
+    --------
+    >>> import diffrax as dfx
+    >>> import unxt as u
+    >>> import galax.coordinates as gc
+    >>> import galax.potential as gp
+    >>> import galax.dynamics as gd
+
+    >>> pot = gp.HernquistPotential(m_tot=u.Quantity(1e12, "Msun"),
+    ...                             r_s=u.Quantity(5, "kpc"), units="galactic")
+    >>> field = gd.fields.HamiltonianField(pot)
+    >>> solver = gd.DynamicsSolver(gd.solve.Leapfrog(),
+    ...                            stepsize_controller=dfx.ConstantStepSize())
+
+    >>> w0 = gc.PhaseSpaceCoordinate(q=u.Quantity([8., 0, 0], "kpc"),
+    ...                              p=u.Quantity([0, 220, 0], "km/s"),
+    ...                              t=u.Quantity(0, "Gyr"))
+    >>> soln = solver.solve(field, w0, u.Quantity(200, "Myr"), dt0=0.1)
+    >>> w = gc.PhaseSpaceCoordinate.from_(soln, units=pot.units, frame=w0.frame)
+    >>> print(w)
+    PhaseSpaceCoordinate(
+        q=<CartesianPos3D (x[kpc], y[kpc], z[kpc])
+            [-2.781 -7.463  0.   ]>,
+        p=<CartesianVel3D (x[kpc / Myr], y[kpc / Myr], z[kpc / Myr])
+            [ 0.199 -0.114  0.   ]>,
+        t=Quantity['time'](Array(200., dtype=float64), unit='Myr'),
+        frame=SimulationFrame())
+
+    """
+
+    drifts: ClassVar = (0.5, 0.5)
+    kicks: ClassVar = (1.0,)
+    _order: ClassVar = 2
+
+
+class Ruth3(AbstractSymplecticSolver):
+    """Ruth's third-order integrator, with three force evaluations.
+
+    Examples
+    --------
+    >>> import galax.dynamics as gd
+    >>> gd.solve.Ruth3().order(None)
+    3
+
+    """
+
+    drifts: ClassVar = (0.0, -1 / 24, 3 / 4, 7 / 24)
+    kicks: ClassVar = (1.0, -2 / 3, 2 / 3)
+    _order: ClassVar = 3
+
+
+class Yoshida4(AbstractSymplecticSolver):
+    """Yoshida's fourth-order integrator, with three force evaluations.
+
+    A symmetric triple composition of `Leapfrog` steps.
+
+    Examples
+    --------
+    >>> import galax.dynamics as gd
+    >>> len(gd.solve.Yoshida4.kicks)
+    3
+
+    """
+
+    drifts, kicks = _compose(
+        (-(2 ** (1 / 3)) / (2 - 2 ** (1 / 3)), 1 / (2 - 2 ** (1 / 3)))
+    )
+    _order: ClassVar = 4
+
+
+_W6 = (-1.17767998417887, 0.235573213359357, 0.784513610477560)
+_W8 = (
+    0.102799849391985,
+    -1.96061023297549,
+    1.93813913762276,
+    -0.158240635368243,
+    -1.44485223686048,
+    0.253693336566229,
+    0.914844246229740,
+)
+
+
+class Yoshida6(AbstractSymplecticSolver):
+    """Yoshida's sixth-order integrator, with seven force evaluations.
+
+    A symmetric composition of `Leapfrog` steps, Yoshida (1990) solution A.
+
+    Examples
+    --------
+    >>> import galax.dynamics as gd
+    >>> len(gd.solve.Yoshida6.kicks)
+    7
+
+    """
+
+    drifts, kicks = _compose((1 - 2 * sum(_W6), *_W6))
+    _order: ClassVar = 6
+
+
+class Yoshida8(AbstractSymplecticSolver):
+    """Yoshida's eighth-order integrator, with fifteen force evaluations.
+
+    A symmetric composition of `Leapfrog` steps, Yoshida (1990) solution D.
+
+    Examples
+    --------
+    >>> import galax.dynamics as gd
+    >>> len(gd.solve.Yoshida8.kicks)
+    15
+
+    """
+
+    drifts, kicks = _compose((1 - 2 * sum(_W8), *_W8))
+    _order: ClassVar = 8
+
+
+# ===============================================
+# Scan
+
+_save_y = dfx.SaveAt(t1=True).subs.fn
+
+
+def can_scan(solver: Any, solver_kw: dict[str, Any], /) -> bool:
+    """Whether `scan_solve` can replace `diffrax.diffeqsolve`."""
+    if not isinstance(solver.solver, AbstractSymplecticSolver):
+        return False
+    if not isinstance(solver.stepsize_controller, dfx.ConstantStepSize):
+        return False
+    if solver.event is not None or solver_kw.get("dt0") is None:
+        return False
+    if not set(solver_kw) <= {"dt0", "saveat", "max_steps", "solver_state"}:
+        return False
+    saveat = solver_kw.get("saveat", dfx.SaveAt(t1=True))
+    subs = saveat.subs
+    return (
+        not (saveat.dense or saveat.solver_state or saveat.controller_state)
+        and not saveat.made_jump
+        and isinstance(subs, dfx.SubSaveAt)
+        and not subs.steps
+        and subs.fn is _save_y
+        and (subs.ts is None or subs.ts.ndim == 1)
+    )
+
+
+def scan_solve(
+    solver: AbstractSymplecticSolver,
+    terms: tuple[dfx.AbstractTerm, dfx.AbstractTerm],
+    t0: gt.RealScalarLike,
+    t1: gt.RealScalarLike,
+    y0: _Y,
+    args: Any,
+    *,
+    dt0: gt.RealScalarLike,
+    saveat: dfx.SaveAt,
+) -> dfx.Solution:
+    """Integrate with `jax.lax.scan` over the save times.
+
+    Each interval between save times is split into the fewest equal steps no
+    larger than ``|dt0|``, so the save times are hit exactly. Only the states
+    at the save times are stored.
+
+    """
+    subs = saveat.subs
+    t0, t1 = jnp.asarray(t0, dtype=float), jnp.asarray(t1, dtype=float)
+    ts = jnp.concatenate(
+        [
+            *([t0[None]] if subs.t0 else []),
+            *([jnp.asarray(subs.ts, dtype=float)] if subs.ts is not None else []),
+            *([t1[None]] if subs.t1 else []),
+        ]
+    )
+    dt = jnp.abs(jnp.asarray(dt0, dtype=float))
+
+    def interval(
+        carry: tuple[Array, _Y, Array], t_save: Array
+    ) -> tuple[tuple[Array, _Y, Array], _Y]:
+        t, y, nsteps = carry
+        n = jnp.ceil(jnp.abs(t_save - t) / dt).astype(int)
+        h = (t_save - t) / jnp.maximum(n, 1)
+
+        def step(i: Array, y: _Y) -> _Y:
+            ti = t + i * h
+            return solver.step(terms, ti, ti + h, y, args, None, False)[0]  # noqa: FBT003
+
+        y = jax.lax.fori_loop(0, n, step, y)
+        return (t_save, y, nsteps + n), y
+
+    (_, _, nsteps), ys = jax.lax.scan(interval, (t0, y0, jnp.asarray(0)), ts)
+    return dfx.Solution(
+        t0=t0,
+        t1=t1,
+        ts=ts,
+        ys=ys,
+        interpolation=None,
+        stats={"num_steps": nsteps},
+        result=dfx.RESULTS.successful,
+        solver_state=None,
+        controller_state=None,
+        made_jump=None,
+        event_mask=None,
+    )
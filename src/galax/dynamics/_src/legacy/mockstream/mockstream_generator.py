@@ -9,6 +9,7 @@ from typing import TypeAlias, cast, final
 import equinox as eqx
 import jax
 import jax.extend as jex
+from jax.sharding import Mesh
 from jaxtyping import PRNGKeyArray
 
 import quaxed.numpy as jnp
@@ -24,6 +25,7 @@ from galax.dynamics._src.legacy.integrator import Integrator
 from galax.dynamics._src.mockstream.arm import MockStreamArm
 from galax.dynamics._src.mockstream.core import MockStream
 from galax.dynamics._src.orbit import Orbit
+from galax.dynamics._src.sharding import parse_mesh, shard_vmap
 from galax.potential import AbstractPotential
 
 Carry: TypeAlias = tuple[gt.IntSz0, gt.SzN, gt.SzN]
@@ -131,20 +133,7 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
 
         Better for GPU usage.
         """
-        t_f = ts[-1] + u.Quantity(1e-3, ts.unit)  # TODO: not bump in the final time.
-
-        @partial(jax.jit, inline=True)
-        def one_pt_intg(
-            i: gt.IntSz0, w0_l_i: gt.Sz6, w0_t_i: gt.Sz6
-        ) -> tuple[gt.Sz6, gt.Sz6]:
-            tstep = jnp.asarray([ts[i], t_f])
-            w_lead = evaluate_orbit(
-                self.potential, w0_l_i, tstep, integrator=self.stream_integrator
-            ).w(units=self.potential.units)[-1]
-            w_trail = evaluate_orbit(
-                self.potential, w0_t_i, tstep, integrator=self.stream_integrator
-            ).w(units=self.potential.units)[-1]
-            return w_lead, w_trail
+        one_pt_intg = partial(self._one_pt_intg, ts)
 
         w0_lead = mock0_lead.w(units=self.units)
         w0_trail = mock0_trail.w(units=self.units)
@@ -152,7 +141,51 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
         lead_arm_w, trail_arm_w = jax.vmap(one_pt_intg)(pt_ids, w0_lead, w0_trail)
         return lead_arm_w, trail_arm_w
 
-    @partial(jax.jit, static_argnames=("vmapped",))
+    @partial(jax.jit, static_argnames=("mesh", "vmapped"))
+    def _run_sharded(
+        self,
+        ts: gt.QuSzTime,
+        mock0_lead: MockStreamArm,
+        mock0_trail: MockStreamArm,
+        *,
+        mesh: Mesh,
+        vmapped: bool,
+    ) -> tuple[gt.BtSz6, gt.BtSz6]:
+        """Generate stellar stream by sharding the release points over devices.
+
+        Each device integrates its points with `jax.vmap` if ``vmapped``, else
+        with `jax.lax.map`.
+        """
+        w0_lead = mock0_lead.w(units=self.units)
+        w0_trail = mock0_trail.w(units=self.units)
+        pt_ids = jnp.arange(len(w0_lead))
+        return cast(
+            tuple[gt.BtSz6, gt.BtSz6],
+            shard_vmap(
+                partial(self._one_pt_intg, ts),
+                mesh,
+                pt_ids,
+                w0_lead,
+                w0_trail,
+                vmapped=vmapped,
+            ),
+        )
+
+    def _one_pt_intg(
+        self, ts: gt.QuSzTime, i: gt.IntSz0, w0_l_i: gt.Sz6, w0_t_i: gt.Sz6
+    ) -> tuple[gt.Sz6, gt.Sz6]:
+        """Integrate the `i`-th leading and trailing points to the final time."""
+        t_f = ts[-1] + u.Quantity(1e-3, ts.unit)  # TODO: not bump in the final time.
+        tstep = jnp.asarray([ts[i], t_f])
+        w_lead = evaluate_orbit(
+            self.potential, w0_l_i, tstep, integrator=self.stream_integrator
+        ).w(units=self.potential.units)[-1]
+        w_trail = evaluate_orbit(
+            self.potential, w0_t_i, tstep, integrator=self.stream_integrator
+        ).w(units=self.potential.units)[-1]
+        return w_lead, w_trail
+
+    @partial(jax.jit, static_argnames=("vmapped", "devices", "mesh"))
     def run(
         self,
         rng: PRNGKeyArray,
@@ -161,6 +194,8 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
         prog_mass: gt.FloatQuSz0 | ProgenitorMassCallable,
         *,
         vmapped: bool | None = None,
+        devices: int | tuple[jax.Device, ...] | None = None,
+        mesh: Mesh | None = None,
     ) -> tuple[MockStream, gc.PhaseSpaceCoordinate]:
         """Generate mock stellar stream.
 
@@ -198,6 +233,18 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
             `None` (default), then `jax.vmap` is used on GPU and `jax.lax.scan`
             otherwise.
 
+        devices : int | tuple[jax.Device, ...] | None, optional keyword-only
+            The devices over which to shard the stream particles, or the
+            number of `jax.devices` to use. Each device integrates an equal
+            share of the particles, vectorized as set by ``vmapped``. On CPU
+            the number of devices is set with
+            ``XLA_FLAGS=--xla_force_host_platform_device_count=N`` before
+            JAX is imported. If `None` (default), the particles are not
+            sharded.
+        mesh : `jax.sharding.Mesh` | None, optional keyword-only
+            A 1D mesh over which to shard the stream particles, instead of
+            ``devices``.
+
         Returns
         -------
         mockstream : :class:`galax.dynamcis.MockStreamArm`
@@ -238,7 +285,11 @@ class MockStreamGenerator(eqx.Module):  # type: ignore[misc]
         # progenitor orbit. The release times are the stripping times.
         mock0 = self.df.sample(rng, self.potential, prog_o, prog_mass)
 
-        if use_vmap:
+        if (mesh := parse_mesh(devices, mesh)) is not None:
+            lead_arm_w, trail_arm_w = self._run_sharded(
+                ts, mock0["lead"], mock0["trail"], mesh=mesh, vmapped=use_vmap
+            )
+        elif use_vmap:
             lead_arm_w, trail_arm_w = self._run_vmap(ts, mock0["lead"], mock0["trail"])
         else:
             lead_arm_w, trail_arm_w = self._run_scan(ts, mock0["lead"], mock0["trail"])
@@ -4,12 +4,13 @@ __all__ = [
     "AbstractOrbit",
     "Orbit",
     "compute_orbit",
+    "compute_orbit_chunks",
     "plot_components",
     "PhaseSpaceInterpolation",
 ]
 
 from .base import AbstractOrbit
-from .compute import compute_orbit
+from .compute import compute_orbit, compute_orbit_chunks
 from .interp import PhaseSpaceInterpolation
 from .orbit import Orbit
 from .plot_helper import plot_components
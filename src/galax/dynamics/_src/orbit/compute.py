@@ -4,12 +4,15 @@ This is private API.
 
 """
 
-__all__ = ["compute_orbit"]
+__all__ = ["compute_orbit", "compute_orbit_chunks"]
 
 
+from collections.abc import Callable, Iterator, Sequence
 from typing import Any
 
 import equinox as eqx
+import jax
+from jax.sharding import Mesh
 from plum import dispatch
 
 import quaxed.numpy as jnp
@@ -21,6 +24,7 @@ from .orbit import Orbit
 from galax.dynamics._src.dynamics.field_base import AbstractDynamicsField
 from galax.dynamics._src.dynamics.field_hamiltonian import HamiltonianField
 from galax.dynamics._src.dynamics.solver import DynamicsSolver
+from galax.dynamics._src.utils import iter_chunks
 
 
 @dispatch.abstract
@@ -138,6 +142,19 @@ def compute_orbit(
       interpolant=None
     )
 
+    A batch of orbits can be split into equal shards over several devices,
+    given as ``devices`` (the number of devices or a sequence of them) or as
+    a 1D `jax.sharding.Mesh` ``mesh``. Each device integrates its shard
+    independently. On CPU, JAX has one device unless the environment
+    variable ``XLA_FLAGS=--xla_force_host_platform_device_count=N`` is set
+    before importing JAX.
+
+    >>> w0 = gc.PhaseSpacePosition(q=u.Quantity([[10, 0, 0], [9, 0, 0]], "kpc"),
+    ...                            p=u.Quantity([0, 200, 0], "km/s"))
+    >>> orbit = gd.compute_orbit(potential, w0, ts, devices=1)
+    >>> orbit.shape
+    (2, 4)
+
     """
     raise NotImplementedError  # pragma: no cover
 
@@ -152,6 +169,8 @@ def compute_orbit(
     *,
     solver: DynamicsSolver | None = None,
     dense: bool = False,
+    devices: int | Sequence[jax.Device] | None = None,
+    mesh: Mesh | None = None,
 ) -> Orbit:
     # Parse inputs
     thefield = field if isinstance(field, HamiltonianField) else HamiltonianField(field)
@@ -161,7 +180,15 @@ def compute_orbit(
 
     # Initial integration from `w0.t` to `ts[0]`
     # TODO: use `.init()`, `.run()` instead then can directly pass the state
-    soln0 = solver.solve(thefield, w0, ts[0], dense=False, unbatch_time=True)
+    soln0 = solver.solve(
+        thefield,
+        w0,
+        ts[0],
+        dense=False,
+        unbatch_time=True,
+        devices=devices,
+        mesh=mesh,
+    )
 
     # Integrate from `ts[0]` to `ts[-1]`
     # TODO: a dispatch for y0 w/out units
@@ -175,6 +202,8 @@ def compute_orbit(
         dense=dense,
         unbatch_time=True,
         vectorize_interpolation=True,
+        devices=devices,
+        mesh=mesh,
     )
 
     # Return the orbit
@@ -191,6 +220,8 @@ def compute_orbit(
     *,
     solver: DynamicsSolver | None = None,
     dense: bool = False,
+    devices: int | Sequence[jax.Device] | None = None,
+    mesh: Mesh | None = None,
 ) -> Orbit:
     # Parse inputs
     thefield = field if isinstance(field, HamiltonianField) else HamiltonianField(field)
@@ -208,7 +239,114 @@ def compute_orbit(
         dense=dense,
         unbatch_time=True,
         vectorize_interpolation=True,
+        devices=devices,
+        mesh=mesh,
     )
 
     # Return the orbit
     return Orbit.from_(soln, frame=w0.frame, potential=thefield.potential)
+
+
+# ===================================================================
+
+
+def compute_orbit_chunks(
+    field: HamiltonianField | gp.AbstractPotential,
+    w0: gc.PhaseSpacePosition | gc.AbstractBasicPhaseSpaceCoordinate,
+    ts: Any,
+    /,
+    *,
+    chunk_size: int,
+    solver: DynamicsSolver | None = None,
+    dense: bool = False,
+    reduce: Callable[[Orbit], Any] | None = None,
+    devices: int | Sequence[jax.Device] | None = None,
+    mesh: Mesh | None = None,
+) -> Iterator[Any]:
+    """Compute the orbits of a large batch in chunks.
+
+    :func:`compute_orbit` holds all the orbits at all the times ``ts`` at once.
+    This instead flattens the batch of ``w0``, splits it into chunks of
+    ``chunk_size`` initial conditions (the last may be smaller), and computes
+    the orbits of each chunk when the iterator reaches it. The peak memory is
+    set by ``chunk_size``, not the size of the batch. The integration is
+    compiled once for the chunks of size ``chunk_size``, and at most once more
+    for the last chunk.
+
+    Parameters
+    ----------
+    field : HamiltonianField | AbstractPotential
+        The field or potential.
+    w0 : PhaseSpacePosition | AbstractBasicPhaseSpaceCoordinate
+        The initial conditions, with any batch shape.
+    ts : Quantity[float, (T,), "time"]
+        The times at which to save the orbits.
+
+    chunk_size : int
+        The number of orbits in each chunk.
+    solver : DynamicsSolver | None, optional
+        The solver, as for :func:`compute_orbit`.
+    dense : bool, optional
+        Whether the orbits have dense output, as for :func:`compute_orbit`.
+    reduce : Callable[[Orbit], Any] | None, optional
+        A function applied to the `Orbit` of each chunk, compiled together
+        with the integration, e.g. to keep only summary statistics. If `None`
+        (default) the `Orbit` of each chunk is yielded.
+    devices, mesh : optional
+        The devices over which to shard each chunk, as for
+        :func:`compute_orbit`.
+
+    Yields
+    ------
+    Orbit | Any
+        The orbits of each chunk, with shape ``(n, T)``, or their reduction.
+
+    Examples
+    --------
+    >>> import quaxed.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.coordinates as gc
+    >>> import galax.potential as gp
+    >>> import galax.dynamics as gd
+
+    >>> pot = gp.KeplerPotential(m_tot=u.Quantity(1e12, "Msun"), units="galactic")
+    >>> x = jnp.linspace(8, 12, 5)
+    >>> q = jnp.stack([x, 0 * x, 0 * x], axis=-1)
+    >>> w0 = gc.PhaseSpacePosition(q=u.Quantity(q, "kpc"),
+    ...                            p=u.Quantity([0, 200, 0], "km/s"))
+    >>> ts = u.Quantity(jnp.linspace(0, 1, 4), "Gyr")
+
+    >>> orbits = gd.compute_orbit_chunks(pot, w0, ts, chunk_size=2)
+    >>> [orbit.shape for orbit in orbits]
+    [(2, 4), (2, 4), (1, 4)]
+
+    The orbits can be reduced as they are computed, e.g. to the smallest radius
+    of each orbit at the times ``ts``:
+
+    >>> def rmin(orbit):
+    ...     return jnp.min(jnp.linalg.vector_norm(orbit.q, axis=-1), axis=-1)
+    >>> rmins = gd.compute_orbit_chunks(pot, w0, ts, chunk_size=2, reduce=rmin)
+    >>> jnp.concat(list(rmins)).round(2)
+    BareQuantity(Array([ 3.43,  8.35,  5.91,  9.96, 11.83], dtype=float64), unit='kpc')
+
+    """
+    for w in iter_chunks(w0, chunk_size):
+        yield _compute_orbit_chunk(field, w, ts, solver, dense, reduce, devices, mesh)
+
+
+@eqx.filter_jit
+def _compute_orbit_chunk(
+    field: HamiltonianField | gp.AbstractPotential,
+    w0: gc.PhaseSpacePosition | gc.AbstractBasicPhaseSpaceCoordinate,
+    ts: Any,
+    solver: DynamicsSolver | None,
+    dense: bool,  # noqa: FBT001
+    reduce: Callable[[Orbit], Any] | None,
+    devices: int | Sequence[jax.Device] | None,
+    mesh: Mesh | None,
+    /,
+) -> Any:
+    orbit = compute_orbit(
+        field, w0, ts, solver=solver, dense=dense, devices=devices, mesh=mesh
+    )
+    return orbit if reduce is None else reduce(orbit)
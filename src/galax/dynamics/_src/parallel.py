@@ -0,0 +1,376 @@
+"""Process-pool orchestration of orbit and stream jobs.
+
+This is private API.
+
+"""
+
+__all__ = ["imap", "compute_orbits", "run_mockstreams"]
+
+import io
+import multiprocessing
+import os
+import pickle
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import jax
+import jax.numpy as jnp
+import jaxtyping
+import numpy as np
+
+# ===================================================================
+# Serialization
+
+
+def _any() -> Any:
+    return Any
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler that moves the arrays out of band.
+
+    The classes that `jaxtyping` creates for array annotations cannot be
+    pickled by reference. They are only used as annotations, so they are
+    pickled as `typing.Any`.
+
+    """
+
+    def __init__(self, file: io.BytesIO, /) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays: list[np.ndarray] = []
+
+    def persistent_id(self, obj: Any) -> tuple[int, Any] | None:
+        # The id is the index of the array and how to rebuild it: `False` for
+        # a NumPy array, `True` for a JAX array, or the implementation of a
+        # JAX array of PRNG keys, which is stored as its key data.
+        if isinstance(obj, np.ndarray) and obj.dtype != object:
+            kind: Any = False
+        elif isinstance(obj, jax.Array):
+            if jax.dtypes.issubdtype(obj.dtype, jax.dtypes.prng_key):
+                kind = jax.random.key_impl(obj)
+                obj = jax.random.key_data(obj)
+            else:
+                kind = True
+        else:
+            return None
+        self.arrays.append(np.asarray(obj))
+        return len(self.arrays) - 1, kind
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, type) and issubclass(obj, jaxtyping.AbstractArray):
+            return _any, ()
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, arrays: list[np.ndarray], /) -> None:
+        super().__init__(file)
+        self.arrays = arrays
+
+    def persistent_load(self, pid: tuple[int, Any]) -> Any:
+        i, kind = pid
+        if kind is False:
+            return self.arrays[i]
+        if kind is True:
+            return jnp.asarray(self.arrays[i])
+        return jax.random.wrap_key_data(self.arrays[i], impl=kind)
+
+
+def _dumps(obj: Any, /) -> tuple[bytes, list[np.ndarray]]:
+    """Serialize ``obj`` into a pickle and its arrays."""
+    file = io.BytesIO()
+    pickler = _Pickler(file)
+    pickler.dump(obj)
+    return file.getvalue(), pickler.arrays
+
+
+def _loads(data: bytes, arrays: list[np.ndarray], /) -> Any:
+    return _Unpickler(io.BytesIO(data), arrays).load()
+
+
+@dataclass(frozen=True, slots=True)
+class _Shared:
+    """A serialized object whose arrays are in a shared-memory block."""
+
+    data: bytes
+    name: str
+    layout: tuple[tuple[int, tuple[int, ...], str], ...]  # offset, shape, dtype
+
+    @classmethod
+    def dump(cls, obj: Any, /) -> "_Shared":
+        data, arrays = _dumps(obj)
+        layout, offset = [], 0
+        for arr in arrays:
+            layout.append((offset, arr.shape, arr.dtype.str))
+            offset += arr.nbytes
+        shm = SharedMemory(create=True, size=max(offset, 1))
+        for (start, _, _), arr in zip(layout, arrays, strict=True):
+            shm.buf[start : start + arr.nbytes] = np.ascontiguousarray(arr).tobytes()
+        shm.close()
+        return cls(data=data, name=shm.name, layout=tuple(layout))
+
+    def load(self) -> Any:
+        """Load the object and free the shared memory."""
+        shm = SharedMemory(name=self.name)
+        try:
+            arrays = [
+                np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start).copy()
+                for start, shape, dtype in self.layout
+            ]
+        finally:
+            shm.close()
+            shm.unlink()
+        return _loads(self.data, arrays)
+
+    def discard(self) -> None:
+        """Free the shared memory without loading the object."""
+        shm = SharedMemory(name=self.name)
+        shm.close()
+        shm.unlink()
+
+
+# ===================================================================
+# Workers
+
+
+def _init_worker(cache_dir: str | os.PathLike[str] | None, /) -> None:
+    import galax.compile_cache
+
+    if cache_dir is not None:
+        galax.compile_cache.enable(cache_dir)
+
+
+def _run_job(data: bytes, arrays: list[np.ndarray], /) -> _Shared:
+    fn, args = _loads(data, arrays)
+    return _Shared.dump(jax.block_until_ready(fn(*args)))
+
+
+def imap(
+    fn: Callable[..., Any],
+    /,
+    *iterables: Iterable[Any],
+    max_workers: int | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> Iterator[Any]:
+    """Map ``fn`` over the jobs in a pool of processes.
+
+    The jobs are the tuples of arguments from zipping ``iterables``. They are
+    serialized and sent to a `concurrent.futures.ProcessPoolExecutor`, whose
+    worker processes are started once and import :mod:`galax` once, so each
+    program is compiled at most once per process. With ``cache_dir``, the
+    workers also share the persistent compilation cache of
+    :mod:`galax.compile_cache`, so each program is compiled only once in
+    total. The arrays of the results are returned through shared memory.
+
+    The results are yielded in the order of the jobs, as they complete. At
+    most ``2 * max_workers`` jobs are in flight, so the jobs and results of a
+    long campaign are not all held at once.
+
+    Parameters
+    ----------
+    fn : Callable[..., Any]
+        The function of each job. It must be picklable, e.g. a module-level
+        function, and return a pytree.
+    *iterables : Iterable[Any]
+        The arguments of the jobs, one iterable per argument. They must have
+        the same length.
+    max_workers : int | None, optional
+        The number of worker processes, defaults to the number of CPUs.
+    cache_dir : str | os.PathLike | None, optional
+        The directory of the persistent compilation cache of the workers.
+
+    Yields
+    ------
+    Any
+        The result of each job.
+
+    Examples
+    --------
+    This starts new processes, so it is skipped here.
+
+    >>> import operator
+    >>> from galax.dynamics.parallel import imap
+    >>> list(imap(operator.add, [1, 2], [10, 20], max_workers=2))  # doctest: +SKIP
+    [11, 22]
+
+    """
+    max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+    ctx = multiprocessing.get_context("spawn")  # JAX is not fork-safe
+    with ProcessPoolExecutor(
+        max_workers, mp_context=ctx, initializer=_init_worker, initargs=(cache_dir,)
+    ) as pool:
+        pending: deque[Future[_Shared]] = deque()
+        try:
+            for args in zip(*iterables, strict=True):
+                pending.append(pool.submit(_run_job, *_dumps((fn, args))))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result().load()
+            while pending:
+                yield pending.popleft().result().load()
+        finally:
+            # Free the results that were not consumed.
+            for future in pending:
+                if not future.cancel() and future.exception() is None:
+                    future.result().discard()
+
+
+# ===================================================================
+# Jobs
+
+
+def _compute_orbit(
+    potential: Any,
+    w0: Any,
+    /,
+    *,
+    ts: Any,
+    solver: Any,
+    dense: bool,
+    reduce: Callable[[Any], Any] | None,
+) -> Any:
+    import galax.dynamics as gd
+
+    orbit = gd.compute_orbit(potential, w0, ts, solver=solver, dense=dense)
+    return orbit if reduce is None else reduce(orbit)
+
+
+def compute_orbits(
+    potentials: Iterable[Any],
+    w0s: Iterable[Any],
+    ts: Any,
+    /,
+    *,
+    solver: Any = None,
+    dense: bool = False,
+    reduce: Callable[[Any], Any] | None = None,
+    max_workers: int | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> Iterator[Any]:
+    """Compute orbits in a pool of processes.
+
+    Each job is :func:`galax.dynamics.compute_orbit` of a potential (or
+    `galax.dynamics.fields.HamiltonianField`) from ``potentials`` and initial
+    conditions from ``w0s``, saved at the times ``ts`` shared by all the jobs.
+    See :func:`imap` for the processes.
+
+    Parameters
+    ----------
+    potentials : Iterable[AbstractPotential | HamiltonianField]
+        The potential of each job.
+    w0s : Iterable[PhaseSpacePosition | PhaseSpaceCoordinate]
+        The initial conditions of each job, each with any batch shape.
+    ts : Quantity[float, (T,), "time"]
+        The times at which to save the orbits.
+
+    solver : DynamicsSolver | None, optional
+        The solver, as for :func:`galax.dynamics.compute_orbit`.
+    dense : bool, optional
+        Whether the orbits have dense output.
+    reduce : Callable[[Orbit], Any] | None, optional
+        A function applied to each `galax.dynamics.Orbit` in the worker, so
+        only its result is returned. It must be picklable.
+    max_workers, cache_dir : optional
+        As for :func:`imap`.
+
+    Yields
+    ------
+    Orbit | Any
+        The orbit of each job, or its reduction.
+
+    Examples
+    --------
+    This starts new processes, so it is skipped here.
+
+    >>> import unxt as u
+    >>> import galax.coordinates as gc
+    >>> import galax.potential as gp
+    >>> from galax.dynamics.parallel import compute_orbits
+
+    >>> pots = [gp.NFWPotential(m=m, r_s=20, units="galactic") for m in (1e11, 1e12)]
+    >>> w0 = gc.PhaseSpacePosition(q=u.Quantity([10, 0, 0], "kpc"),
+    ...                            p=u.Quantity([0, 200, 0], "km/s"))
+    >>> ts = u.Quantity([0, 1], "Gyr")
+    >>> orbits = compute_orbits(pots, [w0, w0], ts, max_workers=2)
+    >>> [orbit.shape for orbit in orbits]  # doctest: +SKIP
+    [(2,), (2,)]
+
+    """
+    return imap(
+        partial(_compute_orbit, ts=ts, solver=solver, dense=dense, reduce=reduce),
+        potentials,
+        w0s,
+        max_workers=max_workers,
+        cache_dir=cache_dir,
+    )
+
+
+def _run_mockstream(
+    generator: Any,
+    rng: Any,
+    prog_w0: Any,
+    prog_mass: Any,
+    /,
+    *,
+    ts: Any,
+    vmapped: bool | None,
+) -> Any:
+    return generator.run(rng, ts, prog_w0, prog_mass, vmapped=vmapped)
+
+
+def run_mockstreams(
+    generators: Iterable[Any],
+    rngs: Iterable[Any],
+    ts: Any,
+    prog_w0s: Iterable[Any],
+    prog_masses: Iterable[Any],
+    /,
+    *,
+    vmapped: bool | None = None,
+    max_workers: int | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+) -> Iterator[Any]:
+    """Generate mock streams in a pool of processes.
+
+    Each job is :meth:`galax.dynamics.MockStreamGenerator.run` of a generator
+    from ``generators``, with a key from ``rngs``, the stripping times ``ts``
+    shared by all the jobs, and a progenitor from ``prog_w0s`` and
+    ``prog_masses``. See :func:`imap` for the processes.
+
+    Parameters
+    ----------
+    generators : Iterable[MockStreamGenerator]
+        The generator of each job, e.g. with different potentials.
+    rngs : Iterable[PRNGKeyArray]
+        The random key of each job.
+    ts : Quantity[float, (time,), "time"]
+        The stripping times.
+    prog_w0s : Iterable[PhaseSpaceCoordinate]
+        The initial conditions of the progenitor of each job.
+    prog_masses : Iterable[Quantity[float, (), "mass"]]
+        The mass of the progenitor of each job.
+
+    vmapped : bool | None, optional
+        As for :meth:`galax.dynamics.MockStreamGenerator.run`.
+    max_workers, cache_dir : optional
+        As for :func:`imap`.
+
+    Yields
+    ------
+    tuple[MockStream, PhaseSpaceCoordinate]
+        The stream and the final progenitor of each job.
+
+    """
+    return imap(
+        partial(_run_mockstream, ts=ts, vmapped=vmapped),
+        generators,
+        rngs,
+        prog_w0s,
+        prog_masses,
+        max_workers=max_workers,
+        cache_dir=cache_dir,
+    )
@@ -0,0 +1,127 @@
+"""Sharding batches of orbits across devices.
+
+This is private API.
+
+"""
+
+__all__ = ["parse_mesh", "shard_blocks", "shard_vmap"]
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import jax
+import jax.numpy as jnp
+import jax.tree as jtu
+import numpy as np
+from jax.experimental.shard_map import shard_map
+from jax.sharding import Mesh, NamedSharding, PartitionSpec
+from jaxtyping import Array, PyTree
+
+#: The name of the mesh axis over which the orbits are sharded.
+AXIS = "orbits"
+
+
+def parse_mesh(
+    devices: int | Sequence[jax.Device] | None, mesh: Mesh | None, /
+) -> Mesh | None:
+    """Return the mesh over which to shard, or `None` to not shard.
+
+    Examples
+    --------
+    >>> import jax
+
+    >>> parse_mesh(None, None) is None
+    True
+
+    >>> mesh = parse_mesh(1, None)
+    >>> mesh.axis_names, mesh.size
+    (('orbits',), 1)
+
+    >>> parse_mesh(None, mesh) is mesh
+    True
+
+    """
+    if devices is not None and mesh is not None:
+        msg = "only one of `devices` and `mesh` can be given"
+        raise ValueError(msg)
+    if mesh is not None or devices is None:
+        return mesh
+
+    if isinstance(devices, int):
+        if not 0 < devices <= jax.device_count():
+            msg = (
+                f"cannot shard over {devices} devices, there are "
+                f"{jax.device_count()}. On CPU, set "
+                "XLA_FLAGS=--xla_force_host_platform_device_count=N "
+                "before importing JAX."
+            )
+            raise ValueError(msg)
+        devices = jax.devices()[:devices]
+    return Mesh(np.asarray(devices), (AXIS,))
+
+
+def _pad(x: Array, n: int, /) -> Array:
+    # Repeat the last element, so the padding is a valid input.
+    return jnp.concatenate([x, jnp.repeat(x[-1:], n, axis=0)]) if n else x
+
+
+def shard_blocks(
+    f: Callable[..., PyTree[Array]], mesh: Mesh, /, *xs: PyTree[Array]
+) -> PyTree[Array]:
+    """Apply ``f`` to equal blocks of ``xs`` on each device of ``mesh``.
+
+    The leading axis of the leaves of ``xs`` is split over all the devices of
+    the mesh, after padding it to a multiple of the number of devices by
+    repeating the last element. ``f`` is called on each device with the
+    local blocks and must return leaves with a leading block axis, which are
+    concatenated across the devices. The padding is not removed.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+
+    >>> mesh = parse_mesh(1, None)
+    >>> shard_blocks(lambda x: x.sum(keepdims=True), mesh, jnp.arange(5.0))
+    Array([10.], dtype=float64)
+
+    """
+    n = len(jtu.leaves(xs)[0])
+    # The inputs are first replicated, since XLA cannot always shard inputs
+    # with a single-device sharding, e.g. outputs of host callbacks.
+    replicated = NamedSharding(mesh, PartitionSpec())
+    xs = jtu.map(
+        lambda x: jax.lax.with_sharding_constraint(_pad(x, -n % mesh.size), replicated),
+        xs,
+    )
+    spec = PartitionSpec(mesh.axis_names)
+    return shard_map(f, mesh=mesh, in_specs=spec, out_specs=spec, check_rep=False)(*xs)
+
+
+def shard_vmap(
+    f: Callable[..., PyTree[Array]],
+    mesh: Mesh,
+    /,
+    *xs: PyTree[Array],
+    vmapped: bool = True,
+) -> PyTree[Array]:
+    """Map ``f`` over the leading axis of ``xs``, sharded over ``mesh``.
+
+    Each device maps ``f`` over its block of ``xs`` with `jax.vmap`, or with
+    `jax.lax.map` if ``vmapped=False``. The padding of `shard_blocks` is
+    removed.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+
+    >>> mesh = parse_mesh(1, None)
+    >>> shard_vmap(lambda x, y: x * y, mesh, jnp.arange(5.0), jnp.arange(5.0))
+    Array([ 0.,  1.,  4.,  9., 16.], dtype=float64)
+
+    """
+    n = len(jtu.leaves(xs)[0])
+
+    def block(*xs: Any) -> PyTree[Array]:
+        return jax.vmap(f)(*xs) if vmapped else jax.lax.map(lambda x: f(*x), xs)
+
+    return jtu.map(lambda x: x[:n], shard_blocks(block, mesh, *xs))
@@ -20,6 +20,7 @@ import diffraxtra as dfxtra
 import unxt as u
 
 import galax.typing as gt
+from .dynamics.symplectic import can_scan, scan_solve
 
 DenseInfo: TypeAlias = dict[str, PyTree[Array]]
 Terms: TypeAlias = PyTree
@@ -156,6 +157,18 @@ class AbstractSolver(dfxtra.AbstractDiffEqSolver, strict=True):  # type: ignore[
         solver_kw: dict[str, Any],
     ) -> dfx.Solution:
         solver_kw.setdefault("dt0", None)
+        # The symplectic solvers bypass `diffrax.diffeqsolve` when they can.
+        if can_scan(self, solver_kw):
+            return scan_solve(
+                self.solver,
+                terms,
+                state.t,
+                t1,
+                state.y,
+                args,
+                dt0=solver_kw["dt0"],
+                saveat=solver_kw.get("saveat", dfx.SaveAt(t1=True)),
+            )
         return self(
             terms,
             t0=state.t,
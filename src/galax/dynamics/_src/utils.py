@@ -4,17 +4,25 @@ This is private API.
 
 """
 
-__all__ = ["parse_saveat"]
+__all__ = ["parse_saveat", "iter_chunks"]
 
+import math
+from collections.abc import Iterator
 from dataclasses import replace
+from typing import Any
 
 import diffrax as dfx
+import jax.tree as jtu
 from plum import dispatch
 
 import quaxed.numpy as jnp
 import unxt as u
 from unxt.quantity import AbstractQuantity
 
+import galax.coordinates as gc
+import galax.dynamics._src.custom_types as gdt
+import galax.typing as gt
+
 
 @dispatch
 def parse_saveat(obj: dfx.SaveAt, /, *, dense: bool | None) -> dfx.SaveAt:
@@ -96,3 +104,84 @@ def parse_saveat(
         ts=jnp.atleast_1d(ts.ustrip(units["time"])),
         dense=False if dense is None else dense,
     )
+
+
+# ===================================================================
+
+
+def _chunk_slices(shape: tuple[int, ...], chunk_size: int, /) -> Iterator[slice]:
+    if chunk_size < 1:
+        msg = f"chunk_size must be positive, not {chunk_size}"
+        raise ValueError(msg)
+    n = math.prod(shape)
+    return (slice(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size))
+
+
+@dispatch
+def iter_chunks(
+    w0: gc.PhaseSpacePosition | gc.AbstractBasicPhaseSpaceCoordinate,
+    chunk_size: int,
+    /,
+) -> Iterator[Any]:
+    """Iterate over chunks of the flattened batch of a phase-space object.
+
+    The chunks are 1D, with ``chunk_size`` elements except for the last. A
+    scalar phase-space object is its own single chunk.
+
+    Examples
+    --------
+    >>> import unxt as u
+    >>> import galax.coordinates as gc
+
+    >>> w0 = gc.PhaseSpacePosition(q=u.Quantity([[[1., 0, 0]] * 3] * 2, "kpc"),
+    ...                            p=u.Quantity([0., 200, 0], "km/s"))
+    >>> w0.shape
+    (2, 3)
+    >>> [w.shape for w in iter_chunks(w0, 4)]
+    [(4,), (2,)]
+
+    """
+    # The components of the coordinates are arrays of the batch shape, or
+    # broadcastable to it.
+    shape = w0.shape
+    w0 = jtu.map(lambda x: jnp.broadcast_to(x, shape).reshape(-1), w0)
+    for slc in _chunk_slices(shape, chunk_size):
+        yield jtu.map(lambda x, slc=slc: x[slc], w0)
+
+
+@dispatch
+def iter_chunks(w0: tuple[gdt.BBtQ, gdt.BBtP], chunk_size: int, /) -> Iterator[Any]:
+    """Iterate over chunks of the flattened batch of a (q, p) tuple.
+
+    Examples
+    --------
+    >>> import unxt as u
+
+    >>> q = u.Quantity([[1., 0, 0], [2, 0, 0], [3, 0, 0]], "kpc")
+    >>> p = u.Quantity([0., 200, 0], "km/s")
+    >>> [qp[1].shape for qp in iter_chunks((q, p), 2)]
+    [(2, 3), (1, 3)]
+
+    """
+    q, p = jnp.broadcast_arrays(*w0)
+    q, p = q.reshape(-1, q.shape[-1]), p.reshape(-1, p.shape[-1])
+    for slc in _chunk_slices(q.shape[:1], chunk_size):
+        yield q[slc], p[slc]
+
+
+@dispatch
+def iter_chunks(w0: gt.BBtSz6 | gt.BBtSz7, chunk_size: int, /) -> Iterator[Any]:
+    """Iterate over chunks of the flattened batch of a phase-space array.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+
+    >>> w0 = jnp.zeros((2, 3, 6))
+    >>> [w.shape for w in iter_chunks(w0, 4)]
+    [(4, 6), (2, 6)]
+
+    """
+    w0 = w0.reshape(-1, w0.shape[-1])
+    for slc in _chunk_slices(w0.shape[:1], chunk_size):
+        yield w0[slc]
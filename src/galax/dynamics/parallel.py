@@ -0,0 +1,10 @@
+""":mod:`galax.dynamics.parallel`."""
+
+__all__ = ["imap", "compute_orbits", "run_mockstreams"]
+
+from jaxtyping import install_import_hook
+
+from galax.setup_package import RUNTIME_TYPECHECKER
+
+with install_import_hook("galax.dynamics.parallel", RUNTIME_TYPECHECKER):
+    from ._src.parallel import compute_orbits, imap, run_mockstreams
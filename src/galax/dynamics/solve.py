@@ -6,6 +6,12 @@ __all__ = [
     "AbstractSolver",
     "SolveState",
     "DynamicsSolver",
+    "AbstractSymplecticSolver",
+    "Leapfrog",
+    "Ruth3",
+    "Yoshida4",
+    "Yoshida6",
+    "Yoshida8",
     "DiffEqSolver",
     "VectorizedDenseInterpolation",
     "Orbit",
@@ -19,7 +25,16 @@ from galax.setup_package import RUNTIME_TYPECHECKER
 with install_import_hook("galax.dynamics.solve", RUNTIME_TYPECHECKER):
     from diffraxtra import DiffEqSolver, VectorizedDenseInterpolation
 
-    from ._src.dynamics import DynamicsSolver, parse_time_specification
+    from ._src.dynamics import (
+        AbstractSymplecticSolver,
+        DynamicsSolver,
+        Leapfrog,
+        Ruth3,
+        Yoshida4,
+        Yoshida6,
+        Yoshida8,
+        parse_time_specification,
+    )
     from ._src.orbit import Orbit, PhaseSpaceInterpolation, compute_orbit
     from ._src.solver import AbstractSolver, SolveState
 
@@ -5,6 +5,7 @@ __all__ = [
     "io",
     "params",
     "plot",
+    "raw",
     # base
     "AbstractPotential",
     # core
@@ -12,6 +13,10 @@ __all__ = [
     # composite
     "AbstractCompositePotential",
     "CompositePotential",
+    "StackedPotential",
+    "PotentialEnsemble",
+    "FrozenPotential",
+    "RadialProfiles",
     "BarPotential",
     "LongMuraliBarPotential",
     "KuzminPotential",
@@ -21,8 +26,12 @@ __all__ = [
     "HarmonicOscillatorPotential",
     "HenonHeilesPotential",
     "SatohPotential",
+    "SCFPotential",
+    "SubhaloPopulationPotential",
     "LMJ09LogarithmicPotential",
     "LogarithmicPotential",
+    "CylSplinePotential",
+    "InterpolatedPotential",
     "AbstractMultipolePotential",
     "MultipoleInnerPotential",
     "MultipoleOuterPotential",
@@ -52,6 +61,7 @@ __all__ = [
     # funcs
     "potential",
     "gradient",
+    "potential_and_gradient",
     "laplacian",
     "density",
     "hessian",
@@ -59,6 +69,10 @@ __all__ = [
     "tidal_tensor",
     "local_circular_velocity",
     "spherical_mass_enclosed",
+    "freeze",
+    "radial_profiles",
+    "density_grid",
+    "surface_density",
 ]
 
 from jaxtyping import install_import_hook
@@ -66,7 +80,7 @@ from jaxtyping import install_import_hook
 from galax.setup_package import RUNTIME_TYPECHECKER
 
 with install_import_hook("galax.potential", RUNTIME_TYPECHECKER):
-    from . import io, params, plot
+    from . import io, params, plot, raw
     from ._src.api import (
         acceleration,
         density,
@@ -75,6 +89,7 @@ with install_import_hook("galax.potential", RUNTIME_TYPECHECKER):
         laplacian,
         local_circular_velocity,
         potential,
+        potential_and_gradient,
         spherical_mass_enclosed,
         tidal_tensor,
     )
@@ -86,9 +101,11 @@ with install_import_hook("galax.potential", RUNTIME_TYPECHECKER):
         BarPotential,
         BovyMWPotential2014,
         BurkertPotential,
+        CylSplinePotential,
         HarmonicOscillatorPotential,
         HenonHeilesPotential,
         HernquistPotential,
+        InterpolatedPotential,
         IsochronePotential,
         JaffePotential,
         KeplerPotential,
@@ -111,12 +128,19 @@ with install_import_hook("galax.potential", RUNTIME_TYPECHECKER):
         PlummerPotential,
         PowerLawCutoffPotential,
         SatohPotential,
+        SCFPotential,
         StoneOstriker15Potential,
+        SubhaloPopulationPotential,
         TriaxialHernquistPotential,
         TriaxialNFWPotential,
         Vogelsberger08TriaxialNFWPotential,
     )
     from ._src.composite import CompositePotential
+    from ._src.ensemble import PotentialEnsemble
+    from ._src.frozen import FrozenPotential, freeze
+    from ._src.profiles import RadialProfiles, radial_profiles
+    from ._src.projection import density_grid, surface_density
+    from ._src.stacked import StackedPotential
     from ._src.xfm import (
         AbstractTransformedPotential,
         TransformedPotential,
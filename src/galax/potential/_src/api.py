@@ -3,6 +3,7 @@
 __all__ = [
     "potential",
     "gradient",
+    "potential_and_gradient",
     "laplacian",
     "density",
     "hessian",
@@ -279,6 +280,53 @@ def gradient(*args: Any, **kwargs: Any) -> cx.vecs.CartesianAcc3D:
     raise NotImplementedError  # pragma: no cover
 
 
+@dispatch.abstract
+def potential_and_gradient(
+    *args: Any, **kwargs: Any
+) -> tuple[u.Quantity["specific energy"], cx.vecs.CartesianAcc3D]:
+    """Compute the potential energy and its gradient at the given position(s).
+
+    This is equivalent to calling :func:`~galax.potential.potential` and
+    :func:`~galax.potential.gradient`, but evaluates the potential only once.
+    Potentials with a closed-form gradient use it; otherwise both values come
+    from a single :func:`jax.value_and_grad` pass.
+
+    Examples
+    --------
+    >>> import unxt as u
+    >>> import coordinax as cx
+    >>> import galax.potential as gp
+    >>> import galax.coordinates as gc
+
+    >>> pot = gp.KeplerPotential(m_tot=u.Quantity(1e12, "Msun"), units="galactic")
+
+    >>> w = gc.PhaseSpaceCoordinate(q=u.Quantity([1, 2, 3], "kpc"),
+    ...                             p=u.Quantity([4, 5, 6], "km/s"),
+    ...                             t=u.Quantity(0, "Gyr"))
+
+    >>> phi, grad = gp.potential_and_gradient(pot, w)
+    >>> phi
+    Quantity[...](Array(-1.20227527, dtype=float64), unit='kpc2 / Myr2')
+    >>> print(grad)
+    <CartesianAcc3D (x[kpc / Myr2], y[kpc / Myr2], z[kpc / Myr2])
+        [0.086 0.172 0.258]>
+
+    The same inputs as for :func:`~galax.potential.gradient` are accepted,
+    including batches of positions and a keyword-only time:
+
+    >>> q = cx.CartesianPos3D.from_([[1, 2, 3], [4, 5, 6]], "kpc")
+    >>> phi, grad = pot.potential_and_gradient(q, t=u.Quantity(0, "Gyr"))
+    >>> phi
+    Quantity[...](Array([-1.20227527, -0.5126519 ], dtype=float64), unit='kpc2 / Myr2')
+    >>> print(grad)
+    <CartesianAcc3D (x[kpc / Myr2], y[kpc / Myr2], z[kpc / Myr2])
+        [[0.086 0.172 0.258]
+         [0.027 0.033 0.04 ]]>
+
+    """
+    raise NotImplementedError  # pragma: no cover
+
+
 @dispatch.abstract
 def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
     """Compute the laplacian of the potential at the given position(s).
@@ -299,7 +347,7 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
     ...                             t=u.Quantity(0, "Gyr"))
 
     >>> pot.laplacian(w)
-    Quantity[...](Array(2.77555756e-17, dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array(-2.77555756e-17, dtype=float64), unit='1 / Myr2')
 
     We can also compute the potential energy at multiple positions and times:
 
@@ -307,7 +355,7 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
     ...                             p=u.Quantity([[4, 5, 6], [7, 8, 9]], "km/s"),
     ...                             t=u.Quantity([0, 1], "Gyr"))
     >>> pot.laplacian(w)
-    Quantity[...](Array([2.77555756e-17, 0.00000000e+00], dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array([-2.77555756e-17,  1.73472348e-18], dtype=float64), unit='1 / Myr2')
 
     This function is very flexible and can accept a broad variety of inputs. For
     example, instead of passing a
@@ -316,7 +364,7 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
 
     >>> w = cx.FourVector(q=u.Quantity([1, 2, 3], "kpc"), t=u.Quantity(0, "Gyr"))
     >>> pot.laplacian(w)
-    Quantity[...](Array(2.77555756e-17, dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array(-2.77555756e-17, dtype=float64), unit='1 / Myr2')
 
     Or using a `~coordinax.AbstractPos3D` and time `unxt.Quantity` (which can be
     positional or a keyword argument):
@@ -324,13 +372,13 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
     >>> q = cx.CartesianPos3D.from_([1, 2, 3], "kpc")
     >>> t = u.Quantity(0, "Gyr")
     >>> pot.laplacian(q, t=t)
-    Quantity[...](Array(2.77555756e-17, dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array(-2.77555756e-17, dtype=float64), unit='1 / Myr2')
 
     We can also compute the potential energy at multiple positions:
 
     >>> q = cx.CartesianPos3D.from_([[1, 2, 3], [4, 5, 6]], "kpc")
     >>> pot.laplacian(q, t=t)
-    Quantity[...](Array([2.77555756e-17, 0.00000000e+00], dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array([-2.77555756e-17,  1.73472348e-18], dtype=float64), unit='1 / Myr2')
 
     Instead of passing a `~coordinax.AbstractPos3D` (in this case a
     `~coordinax.CartesianPos3D`), we can instead pass a
@@ -338,7 +386,7 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
 
     >>> q = u.Quantity([1., 2, 3], "kpc")
     >>> pot.laplacian(q, t)
-    Quantity[...](Array(2.77555756e-17, dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array(-2.77555756e-17, dtype=float64), unit='1 / Myr2')
 
     Again, this can be batched.  If the input position object has no units (i.e.
     is an `~jax.Array`), it is assumed to be in the same unit system as the
@@ -347,7 +395,7 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
     >>> import jax.numpy as jnp
     >>> q = jnp.asarray([[1, 2, 3], [4, 5, 6]])
     >>> pot.laplacian(q, t)
-    Quantity[...](Array([2.77555756e-17, 0.00000000e+00], dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array([-2.77555756e-17,  1.73472348e-18], dtype=float64), unit='1 / Myr2')
 
     - - -
 
@@ -372,13 +420,13 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
     >>> q = apyc.CartesianRepresentation(apyu.Quantity([1, 2, 3], "kpc"))
     >>> t = 0 * apyu.Gyr
     >>> pot.laplacian(q, t)
-    Quantity[...](Array(2.77555756e-17, dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array(-2.77555756e-17, dtype=float64), unit='1 / Myr2')
 
     We can also compute the potential energy at multiple positions:
 
     >>> q = apyc.CartesianRepresentation(apyu.Quantity([[1, 4], [2, 5], [3, 6]], "kpc"))
     >>> pot.laplacian(q, t)
-    Quantity[...](Array([2.77555756e-17, 0.00000000e+00], dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array([-2.77555756e-17,  1.73472348e-18], dtype=float64), unit='1 / Myr2')
 
     Instead of passing a `~coordinax.AbstractPos3D` (in this case a
     `~coordinax.CartesianPos3D`), we can instead pass a
@@ -386,7 +434,7 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
 
     >>> q = [1., 2, 3] * apyu.kpc
     >>> pot.laplacian(q, t)
-    Quantity[...](Array(2.77555756e-17, dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array(-2.77555756e-17, dtype=float64), unit='1 / Myr2')
 
     Again, this can be batched.  If the input position object has no units (i.e.
     is a `~numpy.ndarray`), it is assumed to be in the same unit system
@@ -395,7 +443,7 @@ def laplacian(*args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
     >>> import numpy as np
     >>> q = jnp.asarray([[1, 2, 3], [4, 5, 6]])
     >>> pot.laplacian(q, t)
-    Quantity[...](Array([2.77555756e-17, 0.00000000e+00], dtype=float64), unit='1 / Myr2')
+    Quantity[...](Array([-2.77555756e-17,  1.73472348e-18], dtype=float64), unit='1 / Myr2')
 
     .. skip: end
 
@@ -17,7 +17,7 @@ from plum import dispatch
 import coordinax as cx
 import quaxed.numpy as jnp
 import unxt as u
-from unxt.quantity import AbstractQuantity
+from unxt.quantity import AbstractQuantity, BareQuantity
 from xmmutablemap import ImmutableMap
 
 import galax.typing as gt
@@ -31,6 +31,7 @@ from galax.utils.dataclasses import ModuleMeta
 
 if TYPE_CHECKING:
     import galax.dynamics  # noqa: ICN001
+    import galax.potential  # noqa: ICN001
 
 default_constants = ImmutableMap({"G": u.Quantity.from_(_CONST_G)})
 
@@ -187,13 +188,58 @@ class AbstractPotential(eqx.Module, metaclass=ModuleMeta, strict=True):  # type:
         """
         return api.gradient(self, *args, **kwargs)
 
+    # ---------------------------------------
+    # Potential and gradient
+
+    @partial(jax.jit)
+    @vectorize_method(signature="(3),()->(),(3)")
+    def _potential_and_gradient(
+        self, q: gt.FloatQuSz3, t: gt.RealQuSz0, /
+    ) -> tuple[gt.SpecificEnergySz0, gt.QuSz3]:
+        """See ``potential_and_gradient``.
+
+        Subclasses with a closed-form ``_gradient`` use it directly, otherwise
+        the potential and its gradient come from a single
+        :func:`jax.value_and_grad` pass.
+        """
+        if type(self)._gradient is not AbstractPotential._gradient:  # noqa: SLF001
+            return self._potential(q, t), self._gradient(q, t)
+
+        ulen, utime = self.units["length"], self.units["time"]
+        uenergy = self.units["specific energy"]
+
+        def potential_mag(x: gt.Sz3, tt: gt.RealSz0) -> gt.FloatSz0:
+            qq, ttq = BareQuantity(x, ulen), BareQuantity(tt, utime)
+            return u.ustrip(uenergy, self._potential(qq, ttq))
+
+        phi, grad = jax.value_and_grad(potential_mag)(
+            u.ustrip(ulen, q), u.ustrip(utime, t)
+        )
+        return u.Quantity(phi, uenergy), u.Quantity(grad, uenergy / ulen)
+
+    def potential_and_gradient(
+        self: "AbstractPotential", *args: Any, **kwargs: Any
+    ) -> tuple[u.Quantity["specific energy"], cx.vecs.CartesianAcc3D]:
+        """Compute the potential energy and its gradient at the given position(s).
+
+        See :func:`~galax.potential.potential_and_gradient` for details.
+        """
+        return api.potential_and_gradient(self, *args, **kwargs)
+
     # ---------------------------------------
     # Laplacian
 
     @partial(jax.jit)
     @vectorize_method(signature="(3),()->()")
     def _laplacian(self, q: gt.BtFloatQuSz3, /, t: gt.RealQuSz0) -> gt.FloatQuSz0:
-        """See ``laplacian``."""
+        """See ``laplacian``.
+
+        Subclasses with a closed-form ``_hessian`` use its trace, otherwise the
+        laplacian is the trace of the jacobian of the gradient.
+        """
+        if type(self)._hessian is not AbstractPotential._hessian:  # noqa: SLF001
+            return jnp.trace(self._hessian(q, t))
+
         jac_op = u.experimental.jacfwd(  # spatial jacobian
             self._gradient, argnums=0, units=(self.units["length"], self.units["time"])
         )
@@ -269,6 +315,19 @@ class AbstractPotential(eqx.Module, metaclass=ModuleMeta, strict=True):  # type:
 
     # ---------------------------------------
 
+    def radial_profiles(
+        self, *args: Any, **kwargs: Any
+    ) -> "galax.potential.RadialProfiles":
+        """Compute the radial profiles on a grid of radii.
+
+        See :func:`~galax.potential.radial_profiles` for details.
+        """
+        from .profiles import radial_profiles
+
+        return radial_profiles(self, *args, **kwargs)
+
+    # ---------------------------------------
+
     def local_circular_velocity(self, *args: Any, **kwargs: Any) -> u.Quantity["speed"]:
         """Compute the local circular velocity.
 
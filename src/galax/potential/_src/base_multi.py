@@ -38,6 +38,46 @@ class AbstractCompositePotential(AbstractPotential):
             axis=0,
         )
 
+    @partial(jax.jit, inline=True)
+    def _potential_and_gradient(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> tuple[gt.SpecificEnergyBtSz0, gt.BtQuSz3]:
+        phis, grads = zip(
+            *(p._potential_and_gradient(q, t) for p in self.values()),  # noqa: SLF001
+            strict=True,
+        )
+        return jnp.sum(jnp.array(phis), axis=0), jnp.sum(jnp.array(grads), axis=0)
+
+    @partial(jax.jit, inline=True)
+    def _gradient(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz3:
+        return jnp.sum(
+            jnp.array([p._gradient(q, t) for p in self.values()]),  # noqa: SLF001
+            axis=0,
+        )
+
+    @partial(jax.jit, inline=True)
+    def _laplacian(self, q: gt.BtQuSz3, /, t: gt.BBtRealQuSz0) -> gt.BtFloatQuSz0:
+        return jnp.sum(
+            jnp.array([p._laplacian(q, t) for p in self.values()]),  # noqa: SLF001
+            axis=0,
+        )
+
+    @partial(jax.jit, inline=True)
+    def _density(
+        self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
+    ) -> gt.BtFloatQuSz0:
+        return jnp.sum(
+            jnp.array([p._density(q, t) for p in self.values()]),  # noqa: SLF001
+            axis=0,
+        )
+
+    @partial(jax.jit, inline=True)
+    def _hessian(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz33:
+        return jnp.sum(
+            jnp.array([p._hessian(q, t) for p in self.values()]),  # noqa: SLF001
+            axis=0,
+        )
+
     # ===========================================
     # Collection Protocol
 
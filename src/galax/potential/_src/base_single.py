@@ -1,11 +1,14 @@
 __all__ = ["AbstractSinglePotential"]
 
 import abc
+import contextlib
 import uuid
-from dataclasses import KW_ONLY
-from typing import Any
+from dataclasses import KW_ONLY, fields
+from typing import Any, ClassVar
 
 import equinox as eqx
+import jax
+from jaxtyping import ArrayLike, PyTreeDef
 
 import unxt as u
 from xmmutablemap import ImmutableMap
@@ -24,9 +27,77 @@ class AbstractSinglePotential(AbstractPotential, strict=True):
         default=default_constants, converter=ImmutableMap
     )
 
+    _from_values_templates: ClassVar[
+        dict[tuple[Any, ...], tuple[PyTreeDef, list[Any], tuple[int, ...]]]
+    ] = {}
+
     def __post_init__(self) -> None:
         self._apply_unitsystem()
 
+    ###########################################################################
+    # Constructors
+
+    @classmethod
+    def from_values(
+        cls, units: Any, /, **values: ArrayLike
+    ) -> "AbstractSinglePotential":
+        """Construct the potential from trusted, already-converted raw arrays.
+
+        This is equivalent to ``cls(units=units, **values)`` with unitless
+        ``values``, i.e. each value is interpreted in ``units``, but skips the
+        unit-system parsing and the unit conversion of the parameters and
+        constants. The first call for a given class, unit system and set of
+        parameter names runs the regular constructor and caches the resulting
+        tree structure; later calls only unflatten the new values into it. The
+        result is therefore an identical pytree, and hits the same `jax.jit`
+        caches, as a regularly constructed potential.
+
+        The values are not validated. Potentials that compute derived state
+        at construction (e.g. interpolation tables) always use the regular
+        constructor.
+
+        Examples
+        --------
+        >>> import unxt as u
+        >>> import galax.potential as gp
+
+        >>> pot = gp.NFWPotential.from_values("galactic", m=1e12, r_s=15.0)
+        >>> pot.r_s(0)
+        Quantity['length'](Array(15., dtype=float64, weak_type=True), unit='kpc')
+
+        >>> import jax
+        >>> ref = gp.NFWPotential(m=1e12, r_s=15.0, units="galactic")
+        >>> jax.tree.structure(pot) == jax.tree.structure(ref)
+        True
+
+        """
+        key = (cls, units, tuple(values))
+        try:
+            treedef, leaves, slots = cls._from_values_templates[key]
+        except (KeyError, TypeError):  # uncached or unhashable units
+            pot = cls(units=units, **values)
+            derived = any(not f.init for f in fields(pot)) or (
+                cls.__post_init__ is not AbstractSinglePotential.__post_init__
+            )
+            if derived:
+                return pot
+
+            # Locate the leaf of each value in the flattened potential.
+            paths, treedef = jax.tree_util.tree_flatten_with_path(pot)
+            names = [path[0].name for path, _ in paths]
+            slots = tuple(names.index(k) for k in values)
+            if any(names.count(k) != 1 for k in values):
+                return pot  # e.g. non-constant parameters
+            leaves = [leaf for _, leaf in paths]
+            with contextlib.suppress(TypeError):  # unhashable units
+                cls._from_values_templates[key] = (treedef, leaves, slots)
+            return pot
+
+        leaves = list(leaves)
+        for i, v in zip(slots, values.values(), strict=True):
+            leaves[i] = jax.numpy.asarray(v)
+        return jax.tree.unflatten(treedef, leaves)
+
     ###########################################################################
     # Abstract methods that must be implemented by subclasses
 
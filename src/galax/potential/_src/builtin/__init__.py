@@ -17,6 +17,8 @@ __all__ = [
     "SatohPotential",
     "LMJ09LogarithmicPotential",
     "LogarithmicPotential",
+    "CylSplinePotential",
+    "InterpolatedPotential",
     "AbstractMultipolePotential",
     "MultipoleInnerPotential",
     "MultipoleOuterPotential",
@@ -26,6 +28,8 @@ __all__ = [
     "TriaxialNFWPotential",
     "Vogelsberger08TriaxialNFWPotential",
     "NullPotential",
+    "SCFPotential",
+    "SubhaloPopulationPotential",
     "BovyMWPotential2014",
     "LM10Potential",
     "MilkyWayPotential",
@@ -42,6 +46,7 @@ __all__ = [
 ]
 
 from .bars import BarPotential, LongMuraliBarPotential
+from .cylspline import CylSplinePotential
 from .disks import (
     KuzminPotential,
     MiyamotoNagaiPotential,
@@ -53,6 +58,7 @@ from .example import (
     HenonHeilesPotential,
 )
 from .flattened import SatohPotential
+from .interpolated import InterpolatedPotential
 from .logarithmic import (
     LMJ09LogarithmicPotential,
     LogarithmicPotential,
@@ -70,6 +76,7 @@ from .nfw import (
     Vogelsberger08TriaxialNFWPotential,
 )
 from .null import NullPotential
+from .scf import SCFPotential
 from .special import (
     BovyMWPotential2014,
     LM10Potential,
@@ -87,3 +94,4 @@ from .spherical import (
     StoneOstriker15Potential,
     TriaxialHernquistPotential,
 )
+from .subhalos import SubhaloPopulationPotential
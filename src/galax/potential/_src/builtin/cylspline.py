@@ -0,0 +1,576 @@
+"""Axisymmetric potential interpolated on a meridional grid."""
+
+__all__ = ["CylSplinePotential"]
+
+from collections.abc import Callable
+from dataclasses import KW_ONLY
+from functools import partial
+from typing import final
+
+import equinox as eqx
+import jax
+import numpy as np
+from jaxtyping import Array, ArrayLike, Float, Int
+
+import quaxed.numpy as jnp
+import unxt as u
+from unxt.quantity import BareQuantity
+from xmmutablemap import ImmutableMap
+
+import galax.typing as gt
+from galax.potential._src.base import AbstractPotential, default_constants
+from galax.potential._src.base_single import AbstractSinglePotential
+from galax.potential._src.params.core import _natural_spline_second_derivs
+from galax.utils._jax import vectorize_method
+
+
+@final
+class CylSplinePotential(AbstractSinglePotential):
+    r"""Potential interpolated on a grid in the meridional plane.
+
+    The potential is expanded in azimuthal harmonics,
+
+    .. math::
+
+        \Phi(R, \phi, z) = \sum_{m=0}^{m_\mathrm{max}} \left[
+            \Phi^c_m(R, z) \cos(m\phi) + \Phi^s_m(R, z) \sin(m\phi) \right],
+
+    and each :math:`\Phi_m(R, z)` is tabulated on a 2D grid and evaluated with a
+    bicubic natural spline in the scaled coordinates :math:`\xi =
+    \operatorname{asinh}(R / R_\mathrm{scale})` and :math:`\eta =
+    \operatorname{asinh}(z / z_\mathrm{scale})`. The scaling makes the grid fine
+    near the centre and the disk plane and coarse far away. The spline is
+    :math:`C^2` continuous, so the forces and the Hessian are continuous. The
+    table is mirrored across the axis (with parity :math:`(-1)^m`) so that the
+    spline is smooth at :math:`R = 0`.
+
+    An axisymmetric model, ``m_max=0``, is a single 2D table: evaluating e.g. a
+    `~galax.potential.MN3ExponentialPotential` plus gas disks becomes one
+    bicubic interpolation. Outside the grid the potential is extrapolated as
+    :math:`1/r` along the ray from the origin.
+
+    Construct it with :meth:`~galax.potential.CylSplinePotential.from_potential`
+    or :meth:`~galax.potential.CylSplinePotential.from_density`. The table is a
+    snapshot at a single time and does not depend on ``t``.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> disk = gp.MN3ExponentialPotential(m_tot=6e10, h_R=3, h_z=0.3,
+    ...                                   units="galactic")
+    >>> pot = gp.CylSplinePotential.from_potential(
+    ...     disk, R_max=u.Quantity(100, "kpc"), z_max=u.Quantity(100, "kpc"),
+    ...     R_scale=u.Quantity(3, "kpc"), z_scale=u.Quantity(0.3, "kpc"))
+
+    >>> q = u.Quantity([8.1, 0.3, 0.1], "kpc")
+    >>> t = u.Quantity(0, "Gyr")
+    >>> bool(jnp.isclose(pot.potential(q, t).value, disk.potential(q, t).value,
+    ...                  rtol=1e-5))
+    True
+
+    >>> pot.error_report["potential_median"] < 1e-6
+    True
+
+    """
+
+    R: Float[Array, "nR"] = eqx.field(converter=jnp.asarray)
+    """Cylindrical radii of the grid nodes, starting at 0, in the length unit."""
+
+    z: Float[Array, "nz"] = eqx.field(converter=jnp.asarray)
+    """Heights of the grid nodes, in the length unit."""
+
+    values: Float[Array, "2 M nR nz"] = eqx.field(converter=jnp.asarray)
+    r"""The azimuthal harmonics of the potential at the grid nodes.
+
+    ``values[0, m]`` is :math:`\Phi^c_m` and ``values[1, m]`` is
+    :math:`\Phi^s_m` (zero for :math:`m = 0`), in the unit system of the
+    potential.
+    """
+
+    R_scale: gt.FloatSz0 = eqx.field(converter=jnp.asarray)
+    """Radial scale length of the interpolation coordinate."""
+
+    z_scale: gt.FloatSz0 = eqx.field(converter=jnp.asarray)
+    """Vertical scale length of the interpolation coordinate."""
+
+    _: KW_ONLY
+    units: u.AbstractUnitSystem = eqx.field(converter=u.unitsystem, static=True)
+    constants: ImmutableMap[str, u.Quantity] = eqx.field(
+        default=default_constants, converter=ImmutableMap
+    )
+    error_report: ImmutableMap[str, float] = eqx.field(
+        default=ImmutableMap(), converter=ImmutableMap, static=True
+    )
+    """Relative errors of the interpolant, measured when it was built."""
+
+    _xi: Float[Array, "2nR-1"] = eqx.field(init=False, repr=False)
+    _eta: Float[Array, "nz"] = eqx.field(init=False, repr=False)
+    _table: Float[Array, "2nR-1 nz 4 2 M"] = eqx.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.values.ndim != 4 or self.values.shape[0] != 2:
+            msg = (
+                "values must have shape (2, m_max + 1, nR, nz), "
+                f"got {self.values.shape}."
+            )
+            raise ValueError(msg)
+        if self.values.shape[2:] != (*self.R.shape, *self.z.shape):
+            msg = (
+                "values must have shape (2, m_max + 1, nR, nz) = "
+                f"(2, m_max + 1, {len(self.R)}, {len(self.z)}), "
+                f"got {self.values.shape}."
+            )
+            raise ValueError(msg)
+        if min(len(self.R), len(self.z)) < 2:
+            msg = "the grid must have at least 2 nodes along each axis."
+            raise ValueError(msg)
+
+        # Mirror the table across the axis: the point (-R, phi) is (R, phi + pi).
+        xi = jnp.asinh(self.R / self.R_scale)
+        parity = (-1.0) ** jnp.arange(self.values.shape[1])[None, :, None, None]
+        values = jnp.concat([parity * self.values[:, :, :0:-1], self.values], axis=2)
+        object.__setattr__(self, "_xi", jnp.concat([-xi[:0:-1], xi]))
+        object.__setattr__(self, "_eta", jnp.asinh(self.z / self.z_scale))
+
+        # Second derivatives of the tensor-product natural spline.
+        d2xi = _spline_along(self._xi, values, axis=2)
+        d2eta = _spline_along(self._eta, values, axis=3)
+        d2both = _spline_along(self._eta, d2xi, axis=3)
+        # Stored node-major, so that a cell is one contiguous slice.
+        table = jnp.stack([values, d2xi, d2eta, d2both])
+        object.__setattr__(self, "_table", jnp.moveaxis(table, (3, 4), (0, 1)))
+
+    @property
+    def m_max(self) -> int:
+        """The maximum azimuthal order of the expansion."""
+        return self.values.shape[1] - 1
+
+    # ==========================================================================
+    # Constructors
+
+    @classmethod
+    def from_potential(
+        cls,
+        pot: AbstractPotential,
+        /,
+        *,
+        R_max: u.Quantity["length"] | ArrayLike,
+        z_max: u.Quantity["length"] | ArrayLike,
+        R_scale: u.Quantity["length"] | ArrayLike | None = None,
+        z_scale: u.Quantity["length"] | ArrayLike | None = None,
+        n_R: int = 65,
+        n_z: int = 129,
+        m_max: int = 0,
+        n_phi: int | None = None,
+        t: u.Quantity["time"] | None = None,
+        batch_size: int | None = None,
+        check: bool = True,
+    ) -> "CylSplinePotential":
+        r"""Tabulate a potential on a meridional grid.
+
+        Parameters
+        ----------
+        pot : `galax.potential.AbstractPotential`
+            The potential to tabulate. It is evaluated once per grid node and
+            azimuth, in one batched call.
+
+        R_max, z_max : Quantity[float, (), "length"] | Array[float, ()]
+            The extent of the grid, :math:`0 \leq R \leq R_\mathrm{max}` and
+            :math:`|z| \leq z_\mathrm{max}`. Arrays are interpreted in the
+            length unit of ``pot.units``.
+        R_scale, z_scale : Quantity[float, (), "length"] | Array[float, ()] | None
+            The scale lengths of the interpolation coordinates, below which the
+            nodes are spaced linearly and above which logarithmically. Set them
+            to about the disk scale length and height. Default to
+            ``R_max / 50`` and ``z_max / 50``.
+        n_R, n_z : int, optional
+            The number of nodes in :math:`R` and :math:`z`, uniformly spaced in
+            the scaled coordinates.
+        m_max : int, optional
+            The maximum azimuthal order. Default is 0 (axisymmetric).
+        n_phi : int | None, optional
+            The number of azimuths at which the potential is sampled to compute
+            the harmonics. Defaults to ``2 * m_max + 1``, so an axisymmetric
+            model is sampled at :math:`\phi = 0` only.
+        t : Quantity[float, (), "time"] | None, optional
+            The time at which to tabulate the potential. Defaults to 0.
+        batch_size : int | None, optional
+            The number of grid nodes evaluated at once. `None` (default)
+            evaluates all nodes together.
+        check : bool, optional
+            Whether to measure the interpolation error at the cell centres and
+            record it in ``error_report``. Default is `True`.
+
+        """
+        usys = pot.units
+        ulen, utime = usys["length"], usys["time"]
+        uenergy = usys["specific energy"]
+        t_val = 0.0 if t is None else u.ustrip(utime, t)
+        n_phi = 2 * m_max + 1 if n_phi is None else n_phi
+
+        R, z, R_s, z_s = _grid(ulen, R_max, z_max, R_scale, z_scale, n_R, n_z)
+
+        def potential_mag(q: Float[Array, "N 3"]) -> Float[Array, "N"]:
+            qq = BareQuantity(q, ulen)
+            return u.ustrip(uenergy, pot._potential(qq, BareQuantity(t_val, utime)))  # noqa: SLF001
+
+        values = _azimuthal_harmonics(
+            potential_mag, R, z, m_max=m_max, n_phi=n_phi, batch_size=batch_size
+        )
+        cpot = cls(R, z, values, R_s, z_s, units=usys, constants=pot.constants)
+        if not check:
+            return cpot
+
+        # Spline interpolation errors peak at the cell centres.
+        xi, eta = jnp.asinh(R / R_s), jnp.asinh(z / z_s)
+        Rc = R_s * jnp.sinh((xi[1:] + xi[:-1]) / 2)
+        zc = z_s * jnp.sinh((eta[1:] + eta[:-1]) / 2)
+        Rc, zc = (v.ravel() for v in jnp.meshgrid(Rc, zc, indexing="ij"))
+        phic = jnp.linspace(0, 2 * jnp.pi, len(Rc), endpoint=False)
+        centres = jnp.stack([Rc * jnp.cos(phic), Rc * jnp.sin(phic), zc], axis=-1)
+
+        phi, dphi = jax.vmap(jax.value_and_grad(lambda q: potential_mag(q[None])[0]))(
+            centres
+        )
+        iphi, idphi = jax.vmap(jax.value_and_grad(cpot._interpolate))(centres)  # noqa: SLF001
+
+        err_phi = jnp.abs(iphi - phi) / jnp.abs(phi)
+        err_grad = jnp.linalg.vector_norm(idphi - dphi, axis=-1)
+        err_grad = err_grad / jnp.linalg.vector_norm(dphi, axis=-1)
+        report = {
+            "potential_max": float(jnp.nanmax(err_phi)),
+            "potential_median": float(jnp.nanmedian(err_phi)),
+            "gradient_max": float(jnp.nanmax(err_grad)),
+            "gradient_median": float(jnp.nanmedian(err_grad)),
+        }
+        return cls(
+            R,
+            z,
+            values,
+            R_s,
+            z_s,
+            units=usys,
+            constants=pot.constants,
+            error_report=report,
+        )
+
+    @classmethod
+    def from_density(
+        cls,
+        density: AbstractPotential | Callable[[u.Quantity], u.Quantity],
+        /,
+        *,
+        R_max: u.Quantity["length"] | ArrayLike,
+        z_max: u.Quantity["length"] | ArrayLike,
+        units: u.AbstractUnitSystem | str,
+        R_scale: u.Quantity["length"] | ArrayLike | None = None,
+        z_scale: u.Quantity["length"] | ArrayLike | None = None,
+        n_R: int = 49,
+        n_z: int = 97,
+        m_max: int = 0,
+        n_phi: int | None = None,
+        n_quad: int = 3,
+        t: u.Quantity["time"] | None = None,
+        batch_size: int | None = 256,
+    ) -> "CylSplinePotential":
+        r"""Solve for the potential of a density on a meridional grid.
+
+        Each azimuthal harmonic of the potential is the integral of the same
+        harmonic of the density against the Green's function of the harmonic,
+
+        .. math::
+
+            \Phi_m(R, z) = -2 G \int\!\!\int \sqrt{\frac{R'}{R}}
+                \rho_m(R', z') \, Q_{m-1/2}(\chi) \, dR' \, dz', \qquad
+            \chi = \frac{R^2 + R'^2 + (z - z')^2}{2 R R'},
+
+        where :math:`Q_{m-1/2}` are the Legendre functions of the second kind
+        of half-integer degree (toroidal functions), computed from complete
+        elliptic integrals (Cohl & Tohline 1999). The integral is evaluated
+        with ``n_quad`` Gauss-Legendre nodes per grid cell and direction, in
+        the scaled coordinates. Mass outside the grid is neglected. The cost is
+        proportional to the number of grid nodes times the number of quadrature
+        nodes, and grows with ``m_max``.
+
+        Parameters
+        ----------
+        density : `galax.potential.AbstractPotential` | callable
+            The density: either a potential, whose density is used, or a
+            function of the position ``Quantity[float, (N, 3), "length"]``
+            returning a ``Quantity[float, (N,), "mass density"]``.
+        R_max, z_max, R_scale, z_scale, n_R, n_z, m_max, n_phi
+            The grid and harmonics, as in
+            :meth:`~galax.potential.CylSplinePotential.from_potential`.
+        units : `unxt.AbstractUnitSystem` | str
+            The unit system of the potential.
+        n_quad : int, optional
+            The number of quadrature nodes per grid cell and direction.
+        t : Quantity[float, (), "time"] | None, optional
+            The time at which to evaluate the density of a potential. Defaults
+            to 0.
+        batch_size : int | None, optional
+            The number of grid nodes solved for at once. Each holds one kernel
+            value per quadrature node.
+
+        Examples
+        --------
+        >>> import jax.numpy as jnp
+        >>> import unxt as u
+        >>> import galax.potential as gp
+
+        >>> disk = gp.MiyamotoNagaiPotential(m_tot=6e10, a=3, b=0.5,
+        ...                                  units="galactic")
+        >>> pot = gp.CylSplinePotential.from_density(
+        ...     disk, R_max=u.Quantity(200, "kpc"), z_max=u.Quantity(200, "kpc"),
+        ...     R_scale=u.Quantity(3, "kpc"), z_scale=u.Quantity(0.5, "kpc"),
+        ...     units="galactic")
+
+        >>> q = u.Quantity([8.1, 0.3, 0.1], "kpc")
+        >>> t = u.Quantity(0, "Gyr")
+        >>> bool(jnp.isclose(pot.potential(q, t).value, disk.potential(q, t).value,
+        ...                  rtol=1e-2))
+        True
+
+        """
+        usys = u.unitsystem(units)
+        ulen, umass = usys["length"], usys["mass"]
+        n_phi = 2 * m_max + 1 if n_phi is None else n_phi
+        G = u.ustrip(ulen**3 / umass / usys["time"] ** 2, default_constants["G"])
+
+        if isinstance(density, AbstractPotential):
+            t = u.Quantity(0.0, usys["time"]) if t is None else t
+            pot = density
+            density = lambda q: pot.density(q, t)  # noqa: E731
+
+        def density_mag(q: Float[Array, "N 3"]) -> Float[Array, "N"]:
+            return u.ustrip(usys["mass density"], density(u.Quantity(q, ulen)))
+
+        R, z, R_s, z_s = _grid(ulen, R_max, z_max, R_scale, z_scale, n_R, n_z)
+
+        # Quadrature nodes: n_quad Gauss-Legendre nodes per cell, in xi and eta.
+        x, w = np.polynomial.legendre.leggauss(n_quad)
+        xi, eta = np.arcsinh(R / R_s), np.arcsinh(z / z_s)
+
+        def nodes(
+            edges: Float[Array, "n"], scale: float
+        ) -> tuple[Float[Array, "k"], Float[Array, "k"]]:
+            h = np.diff(edges)[:, None]
+            s = (edges[:-1, None] + h * (x + 1) / 2).ravel()
+            ws = (h * w / 2).ravel() * scale * np.cosh(s)  # dR = R_s cosh(xi) dxi
+            return scale * np.sinh(s), ws
+
+        Rq, wR = nodes(xi, R_s)
+        zq, wz = nodes(eta, z_s)
+        rho = _azimuthal_harmonics(
+            density_mag, Rq, zq, m_max=m_max, n_phi=n_phi, batch_size=None
+        )
+        src_R, src_z = (v.ravel() for v in np.meshgrid(Rq, zq, indexing="ij"))
+        src_w = np.outer(wR, wz).ravel() * np.sqrt(src_R)
+        src_rho = rho.reshape(2, m_max + 1, -1) * src_w
+
+        @jax.jit
+        def solve(target: Float[Array, "2"]) -> Float[Array, "2 M"]:
+            # Off the axis. On the axis only m = 0 survives, and the limit of
+            # the kernel is approached by a tiny radius.
+            Rt = jnp.maximum(target[0], 1e-8 * R_s)
+            chi = (Rt**2 + src_R**2 + (target[1] - src_z) ** 2) / (2 * Rt * src_R)
+            Q = _toroidal_q(chi, m_max)  # (M, S)
+            phi = -2 * G / jnp.sqrt(Rt) * jnp.sum(src_rho * Q, axis=-1)
+            return jnp.where((target[0] > 0) | (jnp.arange(m_max + 1) == 0), phi, 0.0)
+
+        targets = np.stack([v.ravel() for v in np.meshgrid(R, z, indexing="ij")], -1)
+        values = jax.lax.map(solve, jnp.asarray(targets), batch_size=batch_size)
+        values = jnp.moveaxis(values, 0, -1).reshape(2, m_max + 1, len(R), len(z))
+
+        return cls(R, z, values, R_s, z_s, units=usys)
+
+    # ==========================================================================
+    # Interpolation
+
+    @partial(jax.jit, inline=True)
+    def _interpolate(self, q: gt.Sz3, /) -> gt.FloatSz0:
+        """Interpolate the potential at one position.
+
+        ``q`` is in the length unit of the potential and the returned value is
+        in its unit system.
+        """
+        x, y, z = q[0], q[1], q[2]
+        R2 = x**2 + y**2
+        on_axis = R2 == 0
+        R = jnp.where(on_axis, 0.0, jnp.sqrt(jnp.where(on_axis, 1.0, R2)))
+
+        # Outside the grid, scale back along the ray to its edge, and
+        # extrapolate as 1/r.
+        R_max, z_lo, z_hi = self.R[-1], self.z[0], self.z[-1]
+        lam = jnp.minimum(1.0, R_max / jnp.where(R_max < R, R, R_max))
+        lam = jnp.minimum(lam, z_hi / jnp.where(z > z_hi, z, z_hi))
+        lam = jnp.minimum(lam, z_lo / jnp.where(z < z_lo, z, z_lo))
+
+        ci, wxi = _spline_weights(self._xi, jnp.asinh(lam * R / self.R_scale))
+        cj, weta = _spline_weights(self._eta, jnp.asinh(lam * z / self.z_scale))
+        cell = jax.lax.dynamic_slice(
+            self._table, (ci, cj, 0, 0, 0), (2, 2, *self._table.shape[2:])
+        )
+        # table index: (value, d2xi, d2eta, d2both) = (xi order, eta order)
+        wts = jnp.stack(
+            [
+                wxi[0][:, None] * weta[0][None, :],
+                wxi[1][:, None] * weta[0][None, :],
+                wxi[0][:, None] * weta[1][None, :],
+                wxi[1][:, None] * weta[1][None, :],
+            ]
+        )
+        harmonics = jnp.einsum("kij,ijkcm->cm", wts, cell)
+
+        # Sum the azimuthal harmonics.
+        if self.m_max == 0:
+            return lam * harmonics[0, 0]
+        phi = jnp.arctan2(jnp.where(on_axis, 0.0, y), jnp.where(on_axis, 1.0, x))
+        mphi = jnp.arange(self.m_max + 1) * phi
+        pot = jnp.sum(harmonics[0] * jnp.cos(mphi) + harmonics[1] * jnp.sin(mphi))
+        return lam * pot
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->()")
+    def _potential(self, q: gt.QuSz3, _: gt.RealQuSz0, /) -> gt.SpecificEnergySz0:
+        phi = self._interpolate(u.ustrip(self.units["length"], q))
+        return u.Quantity(phi, self.units["specific energy"])
+
+
+# ===== Helper functions =====
+
+
+def _strip(v: u.Quantity | ArrayLike, unit: gt.Unit) -> float:
+    return float(u.ustrip(unit, u.Quantity.from_(v, unit)))
+
+
+def _grid(
+    ulen: gt.Unit,
+    R_max: u.Quantity | ArrayLike,
+    z_max: u.Quantity | ArrayLike,
+    R_scale: u.Quantity | ArrayLike | None,
+    z_scale: u.Quantity | ArrayLike | None,
+    n_R: int,
+    n_z: int,
+    /,
+) -> tuple[Float[Array, "nR"], Float[Array, "nz"], float, float]:
+    """Grid nodes uniformly spaced in asinh(R / R_s) and asinh(z / z_s)."""
+    R_max, z_max = _strip(R_max, ulen), _strip(z_max, ulen)
+    R_s = R_max / 50 if R_scale is None else _strip(R_scale, ulen)
+    z_s = z_max / 50 if z_scale is None else _strip(z_scale, ulen)
+    R = R_s * np.sinh(np.linspace(0, np.arcsinh(R_max / R_s), n_R))
+    eta_max = np.arcsinh(z_max / z_s)
+    z = z_s * np.sinh(np.linspace(-eta_max, eta_max, n_z))
+    return R, z, R_s, z_s
+
+
+def _azimuthal_harmonics(
+    f: Callable[[Float[Array, "N 3"]], Float[Array, "N"]],
+    R: Float[Array, "nR"],
+    z: Float[Array, "nz"],
+    /,
+    *,
+    m_max: int,
+    n_phi: int,
+    batch_size: int | None,
+) -> Float[Array, "2 M nR nz"]:
+    """Cosine and sine azimuthal harmonics of ``f`` on a meridional grid."""
+    phi = 2 * np.pi * np.arange(n_phi) / n_phi
+    R_, z_, phi_ = np.meshgrid(R, z, phi, indexing="ij")
+    q = np.stack([R_ * np.cos(phi_), R_ * np.sin(phi_), z_], axis=-1)
+    if batch_size is None:
+        vals = f(jnp.asarray(q.reshape(-1, 3)))
+    else:
+        vals = jax.lax.map(
+            lambda x: f(x[None])[0], q.reshape(-1, 3), batch_size=batch_size
+        )
+    vals = vals.reshape(len(R), len(z), n_phi)
+
+    # Trapezoid rule in phi, exact for harmonics below n_phi / 2.
+    m = np.arange(m_max + 1)
+    eps = np.where(m == 0, 1.0, 2.0) / n_phi
+    cos = eps[:, None] * np.cos(m[:, None] * phi)
+    sin = eps[:, None] * np.sin(m[:, None] * phi)
+    return jnp.stack(
+        [jnp.einsum("rzp,mp->mrz", vals, cos), jnp.einsum("rzp,mp->mrz", vals, sin)]
+    )
+
+
+def _spline_along(
+    nodes: Float[Array, "n"], values: Float[Array, "..."], /, *, axis: int
+) -> Float[Array, "..."]:
+    """Natural spline second derivatives of ``values`` along ``axis``."""
+    moved = jnp.moveaxis(values, axis, 0)
+    return jnp.moveaxis(_natural_spline_second_derivs(nodes, moved), 0, axis)
+
+
+def _spline_weights(
+    nodes: Float[Array, "n"], x: gt.FloatSz0, /
+) -> tuple[Int[Array, ""], Float[Array, "2 2"]]:
+    """Cubic spline weights of the cell containing ``x``.
+
+    Returns the index of the left node of the cell and the weights ``W[order,
+    corner]`` of the values (order 0) and second derivatives (order 1) at the
+    left (corner 0) and right (corner 1) nodes.
+    """
+    i = jnp.searchsorted(nodes, x, side="right").astype(int) - 1
+    i = jnp.clip(i, 0, len(nodes) - 2)
+    h = nodes[i + 1] - nodes[i]
+    b = (x - nodes[i]) / h
+    a = 1 - b
+    return i, jnp.asarray([[a, b], [(a**3 - a) * h**2 / 6, (b**3 - b) * h**2 / 6]])
+
+
+def _ellip_ke(
+    k2: Float[Array, "*batch"], /, *, n_iter: int = 12
+) -> tuple[Float[Array, "*batch"], Float[Array, "*batch"]]:
+    """Complete elliptic integrals K(k) and E(k), by the AGM."""
+    a, b = jnp.ones_like(k2), jnp.sqrt(1 - k2)
+    total, power = k2 / 2, 0.5
+    for _ in range(n_iter):
+        c = (a - b) / 2
+        a, b = (a + b) / 2, jnp.sqrt(a * b)
+        power = 2 * power
+        total = total + power * c**2
+    K = jnp.pi / (2 * a)
+    return K, K * (1 - total)
+
+
+def _toroidal_q(chi: Float[Array, "*batch"], m_max: int, /) -> Float[Array, "M *batch"]:
+    """Toroidal functions Q_{m-1/2}(chi) for m = 0, ..., m_max.
+
+    Q_{-1/2} and Q_{1/2} follow from the complete elliptic integrals. Higher
+    orders use the upward recurrence close to the ring (small ``chi``), where
+    it is stable, and the continued fraction for the ratios Q_{m+1/2} /
+    Q_{m-1/2} (Miller's algorithm) further away, where Q decays with ``m``.
+    """
+    k2 = 2 / (chi + 1)
+    K, E = _ellip_ke(k2)
+    q0 = jnp.sqrt(k2) * K
+    if m_max == 0:
+        return q0[None]
+
+    # Upward recurrence, amplifying rounding errors by at most ~1e6.
+    up = [q0, chi * q0 - jnp.sqrt(2 * (chi + 1)) * E]
+    for m in range(1, m_max):
+        up.append((4 * m * chi * up[m] - (2 * m - 1) * up[m - 1]) / (2 * m + 1))
+
+    # Continued fraction, converged to ~1e-16 where the upward recurrence is not
+    # used: the ratios tend to chi - sqrt(chi^2 - 1) at large m.
+    growth = 1e6 ** (1 / (2 * m_max))
+    chi_c = (growth + 1 / growth) / 2
+    m_top = m_max + int(np.ceil(16 / np.log10(growth)))
+    ratio = jnp.zeros_like(chi)
+    ratios = []
+    for m in range(m_top, 0, -1):
+        ratio = (2 * m - 1) / (4 * m * chi - (2 * m + 1) * ratio)
+        if m <= m_max:
+            ratios.append(ratio)
+    down = [q0]
+    for r in reversed(ratios):
+        down.append(down[-1] * r)
+
+    return jnp.where(chi < chi_c, jnp.stack(up), jnp.stack(down))
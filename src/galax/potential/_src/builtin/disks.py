@@ -25,6 +25,9 @@ from galax.potential._src.base import default_constants
 from galax.potential._src.base_single import AbstractSinglePotential
 from galax.potential._src.params.core import AbstractParameter
 from galax.potential._src.params.field import ParameterField
+from galax.utils._jax import vectorize_method
+
+_ZZ = jnp.zeros((3, 3)).at[2, 2].set(1.0)
 
 
 @final
@@ -63,6 +66,34 @@ class KuzminPotential(AbstractSinglePotential):
             )
         )
 
+    @partial(jax.jit, inline=True)
+    def _grad_half_d2(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        """Gradient of half the squared denominator, D^2/2."""
+        zp = jnp.abs(q[2]) + self.a(t)
+        return jnp.stack([q[0], q[1], jnp.sign(q[2]) * zp])
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        g = self._grad_half_d2(q, t)
+        d = jnp.linalg.vector_norm(g, axis=-1)
+        return self.constants["G"] * self.m_tot(t) * g / d**3
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        g = self._grad_half_d2(q, t)
+        d = jnp.linalg.vector_norm(g, axis=-1)
+        GM = self.constants["G"] * self.m_tot(t)
+        return GM / d**3 * (jnp.eye(3) - 3 * jnp.outer(g, g) / d**2)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        # The mass is an infinitely thin sheet at z=0, so the volume density is
+        # zero everywhere else.
+        shape = jnp.broadcast_shapes(q.shape[:-1], jnp.shape(t))
+        return u.Quantity(jnp.zeros(shape), self.units["mass density"])
+
 
 # -------------------------------------------------------------------
 
@@ -95,6 +126,41 @@ class MiyamotoNagaiPotential(AbstractSinglePotential):
         zp2 = (jnp.sqrt(q[..., 2] ** 2 + self.b(t) ** 2) + self.a(t)) ** 2
         return -self.constants["G"] * self.m_tot(t) / jnp.sqrt(R2 + zp2)
 
+    @partial(jax.jit, inline=True)
+    def _grad_half_d2(
+        self, q: gt.QuSz3, t: gt.RealQuSz0, /
+    ) -> tuple[gt.QuSz3, gt.FloatQuSz0, gt.FloatQuSz0]:
+        r"""Gradient of :math:`D^2 / 2 = (R^2 + (a + \sqrt{z^2 + b^2})^2) / 2`."""
+        a, b = self.a(t), self.b(t)
+        zeta = jnp.sqrt(q[2] ** 2 + b**2)
+        g = jnp.stack([q[0], q[1], q[2] * (a + zeta) / zeta])
+        return g, zeta, jnp.linalg.vector_norm(q[:2]) ** 2 + (a + zeta) ** 2
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        g, _, d2 = self._grad_half_d2(q, t)
+        return self.constants["G"] * self.m_tot(t) * g / (d2 * jnp.sqrt(d2))
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        g, zeta, d2 = self._grad_half_d2(q, t)
+        a, b = self.a(t), self.b(t)
+        GM = self.constants["G"] * self.m_tot(t)
+        # d g / d q is the identity, plus a z-z term from the vertical scaling.
+        dg = jnp.eye(3) + u.ustrip("", a * b**2 / zeta**3) * _ZZ
+        return GM / (d2 * jnp.sqrt(d2)) * (dg - 3 * jnp.outer(g, g) / d2)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        a, b = self.a(t), self.b(t)
+        R2 = q[..., 0] ** 2 + q[..., 1] ** 2
+        zeta = jnp.sqrt(q[..., 2] ** 2 + b**2)
+        d = jnp.sqrt(R2 + (a + zeta) ** 2)
+        num = a * R2 + (a + 3 * zeta) * (a + zeta) ** 2
+        return b**2 * self.m_tot(t) / (4 * jnp.pi) * num / (d**5 * zeta**3)
+
 
 # -------------------------------------------------------------------
 
@@ -198,17 +264,37 @@ class AbstractMN3Potential(AbstractSinglePotential):
         )
 
     @partial(jax.jit)
-    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        unit = self.units["acceleration"]
+        return u.Quantity(
+            sum(
+                mn._gradient(q, t).ustrip(unit)  # noqa: SLF001
+                for mn in self._get_mn_components(t)
+            ),
+            unit,
+        )
+
+    @partial(jax.jit)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        unit = self.units["frequency drift"]
+        return u.Quantity(
+            sum(
+                mn._hessian(q, t).ustrip(unit)  # noqa: SLF001
+                for mn in self._get_mn_components(t)
+            ),
+            unit,
+        )
+
+    @partial(jax.jit)
+    @vectorize_method(signature="(3),()->()")
+    def _density(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.FloatQuSz0:
         unit = self.units["mass density"]
         return u.Quantity(
-            jnp.sum(
-                jnp.asarray(
-                    [
-                        mn.density(q, t).to_value(unit)
-                        for mn in self._get_mn_components(t)
-                    ]
-                ),
-                axis=0,
+            sum(
+                mn._density(q, t).ustrip(unit)  # noqa: SLF001
+                for mn in self._get_mn_components(t)
             ),
             unit,
         )
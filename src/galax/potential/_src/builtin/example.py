@@ -22,6 +22,7 @@ from galax.potential._src.base import default_constants
 from galax.potential._src.base_single import AbstractSinglePotential
 from galax.potential._src.params.core import AbstractParameter
 from galax.potential._src.params.field import ParameterField
+from galax.utils._jax import vectorize_method
 
 
 @final
@@ -56,7 +57,7 @@ class HarmonicOscillatorPotential(AbstractSinglePotential):
     Quantity[...](Array(0.5, dtype=float64), unit='kpc2 / Myr2')
 
     >>> pot.density(q, t)
-    Quantity[...](Array(1.76897707e+10, dtype=float64), unit='solMass / kpc3')
+    Quantity[...](Array(5.30693121e+10, dtype=float64), unit='solMass / kpc3')
 
     """
 
@@ -79,11 +80,20 @@ class HarmonicOscillatorPotential(AbstractSinglePotential):
         return 0.5 * jnp.sum(jnp.square(omega * q), axis=-1)
 
     @partial(jax.jit, inline=True)
-    def _density(
-        self, _: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
-    ) -> gt.BtFloatQuSz0:
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        return jnp.square(jnp.atleast_1d(self.omega(t))) * q
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, _: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        return jnp.eye(3) * jnp.square(jnp.atleast_1d(self.omega(t)))
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->()")
+    def _density(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.FloatQuSz0:
         # \rho(\mathbf{q}, t) = \frac{1}{4 \pi G} \sum_i \omega_i^2
-        omega = jnp.atleast_1d(self.omega(t))
+        omega = jnp.broadcast_to(jnp.atleast_1d(self.omega(t)), q.shape)
         denom = 4 * jnp.pi * self.constants["G"]
         return jnp.sum(omega**2, axis=-1) / denom
 
@@ -151,3 +161,35 @@ class HenonHeilesPotential(AbstractSinglePotential):
         x2, y = q[..., 0] ** 2, q[..., 1]
         R2 = x2 + y**2
         return (R2 / 2 + coeff * (x2 * y - y**3 / 3.0)) / ts2
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        ts2, coeff = self.timescale(t) ** 2, self.coeff(t)
+        x, y = q[0], q[1]
+        grad = jnp.stack(
+            [x * (1 + 2 * coeff * y), y + coeff * (x**2 - y**2), jnp.zeros_like(q[2])]
+        )
+        return grad / ts2
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        ts2, coeff = self.timescale(t) ** 2, self.coeff(t)
+        cx, cy = coeff * q[0], coeff * q[1]
+        one, zero = jnp.ones_like(cx), jnp.zeros_like(cx)
+        hess = jnp.stack(
+            [
+                jnp.stack([one + 2 * cy, 2 * cx, zero]),
+                jnp.stack([2 * cx, one - 2 * cy, zero]),
+                jnp.stack([zero, zero, zero]),
+            ]
+        )
+        return hess / ts2
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        # The cubic terms are harmonic, so the laplacian is uniform.
+        ts2 = self.timescale(t) ** 2
+        rho = 2 / (4 * jnp.pi * self.constants["G"] * ts2)
+        return jnp.broadcast_to(rho, q.shape[:-1])
@@ -8,11 +8,15 @@ from typing import final
 import jax
 
 import quaxed.numpy as jnp
+import unxt as u
 
 import galax.typing as gt
 from galax.potential._src.base_single import AbstractSinglePotential
 from galax.potential._src.params.core import AbstractParameter
 from galax.potential._src.params.field import ParameterField
+from galax.utils._jax import vectorize_method
+
+_ZZ = jnp.zeros((3, 3)).at[2, 2].set(1.0)
 
 
 @final
@@ -46,3 +50,40 @@ class SatohPotential(AbstractSinglePotential):
         z = q[..., 2]
         term = R2 + z**2 + a * (a + 2 * jnp.sqrt(z**2 + b**2))
         return -self.constants["G"] * self.m_tot(t) / jnp.sqrt(term)
+
+    @partial(jax.jit, inline=True)
+    def _grad_half_s(
+        self, q: gt.QuSz3, t: gt.RealQuSz0, /
+    ) -> tuple[gt.QuSz3, gt.FloatQuSz0, gt.FloatQuSz0]:
+        r"""Gradient of half of :math:`S = R^2 + z^2 + a(a + 2\sqrt{z^2 + b^2})`."""
+        a, b = self.a(t), self.b(t)
+        zeta = jnp.sqrt(q[2] ** 2 + b**2)
+        g = jnp.stack([q[0], q[1], q[2] * (1 + a / zeta)])
+        S = jnp.sum(q**2, axis=-1) + a * (a + 2 * zeta)
+        return g, zeta, S
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        g, _, S = self._grad_half_s(q, t)
+        return self.constants["G"] * self.m_tot(t) * g / (S * jnp.sqrt(S))
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        g, zeta, S = self._grad_half_s(q, t)
+        a, b = self.a(t), self.b(t)
+        GM = self.constants["G"] * self.m_tot(t)
+        # d g / d q is the identity, plus a z-z term from the vertical scaling.
+        dg = jnp.eye(3) + u.ustrip("", a * b**2 / zeta**3) * _ZZ
+        return GM / (S * jnp.sqrt(S)) * (dg - 3 * jnp.outer(g, g) / S)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        a, b = self.a(t), self.b(t)
+        zeta = jnp.sqrt(q[..., 2] ** 2 + b**2)
+        S = jnp.sum(q**2, axis=-1) + a * (a + 2 * zeta)
+        g2 = q[..., 0] ** 2 + q[..., 1] ** 2 + (q[..., 2] * (1 + a / zeta)) ** 2
+        # The trace of the hessian, i.e. the laplacian of the potential.
+        lapl = 3 + u.ustrip("", a * b**2 / zeta**3) - 3 * u.ustrip("", g2 / S)
+        return self.m_tot(t) / (4 * jnp.pi) * lapl / (S * jnp.sqrt(S))
@@ -0,0 +1,291 @@
+"""Grid-interpolated potential."""
+
+__all__ = ["InterpolatedPotential"]
+
+from dataclasses import KW_ONLY
+from functools import partial
+from typing import final
+
+import equinox as eqx
+import jax
+from jaxtyping import Array, ArrayLike, Float, Int
+
+import quaxed.numpy as jnp
+import unxt as u
+from unxt.quantity import BareQuantity
+from xmmutablemap import ImmutableMap
+
+import galax.typing as gt
+from galax.potential._src.base import AbstractPotential, default_constants
+from galax.potential._src.base_single import AbstractSinglePotential
+from galax.utils._jax import vectorize_method
+
+
+@final
+class InterpolatedPotential(AbstractSinglePotential):
+    r"""Potential interpolated from its values on a rectilinear grid.
+
+    The potential, its gradient, and its mixed derivatives
+    :math:`\partial_{xy}, \partial_{xz}, \partial_{yz}, \partial_{xyz}` are
+    tabulated on the nodes of a Cartesian grid and evaluated with piecewise
+    tricubic Hermite interpolation (Lekien & Marsden 2005). The interpolant is
+    :math:`C^1` continuous, so orbits integrated in it conserve energy to the
+    accuracy of the table.
+
+    Construct it from any potential with
+    :meth:`~galax.potential.InterpolatedPotential.from_potential`. The
+    interpolant is a snapshot of the potential at a single time and does not
+    depend on ``t``.
+
+    .. warning::
+
+        Outside the grid the interpolant extrapolates the cubic of the nearest
+        cell, which quickly becomes inaccurate. Choose a grid that covers all
+        positions of interest.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> pot = gp.NFWPotential(m=1e12, r_s=15, units="galactic")
+    >>> nodes = u.Quantity(jnp.linspace(-30, 30, 41), "kpc")
+    >>> ipot = gp.InterpolatedPotential.from_potential(pot, nodes)
+
+    >>> q = u.Quantity([8.1, 0.3, 1.7], "kpc")
+    >>> t = u.Quantity(0, "Gyr")
+    >>> jnp.allclose(ipot.potential(q, t).value, pot.potential(q, t).value,
+    ...              rtol=1e-5)
+    Array(True, dtype=bool)
+
+    The maximum and median relative errors at the cell centres, where the
+    interpolation error is largest, are saved on the potential:
+
+    >>> ipot.error_report["potential_max"] < 1e-4
+    True
+
+    """
+
+    x: Float[Array, "nx"] = eqx.field(converter=jnp.asarray)
+    """Grid nodes along the x-axis, in the length unit of ``units``."""
+
+    y: Float[Array, "ny"] = eqx.field(converter=jnp.asarray)
+    """Grid nodes along the y-axis, in the length unit of ``units``."""
+
+    z: Float[Array, "nz"] = eqx.field(converter=jnp.asarray)
+    """Grid nodes along the z-axis, in the length unit of ``units``."""
+
+    derivs: Float[Array, "nx ny nz 2 2 2"] = eqx.field(converter=jnp.asarray)
+    r"""Potential and its derivatives at the grid nodes.
+
+    ``derivs[i, j, k, a, b, c]`` is :math:`\partial_x^a \partial_y^b
+    \partial_z^c \Phi` at node ``(x[i], y[j], z[k])``, in the unit system of the
+    potential.
+    """
+
+    _: KW_ONLY
+    units: u.AbstractUnitSystem = eqx.field(converter=u.unitsystem, static=True)
+    constants: ImmutableMap[str, u.Quantity] = eqx.field(
+        default=default_constants, converter=ImmutableMap
+    )
+    error_report: ImmutableMap[str, float] = eqx.field(
+        default=ImmutableMap(), converter=ImmutableMap, static=True
+    )
+    """Relative errors of the interpolant, measured when it was built."""
+
+    def __check_init__(self) -> None:
+        shape = (*self.x.shape, *self.y.shape, *self.z.shape, 2, 2, 2)
+        if self.derivs.shape != shape:
+            msg = (
+                f"derivs must have shape (nx, ny, nz, 2, 2, 2) = {shape}, "
+                f"got {self.derivs.shape}."
+            )
+            raise ValueError(msg)
+        if min(len(self.x), len(self.y), len(self.z)) < 2:
+            msg = "the grid must have at least 2 nodes along each axis."
+            raise ValueError(msg)
+
+    # ==========================================================================
+    # Constructors
+
+    @classmethod
+    def from_potential(
+        cls,
+        pot: AbstractPotential,
+        /,
+        x: u.Quantity["length"] | ArrayLike,
+        y: u.Quantity["length"] | ArrayLike | None = None,
+        z: u.Quantity["length"] | ArrayLike | None = None,
+        *,
+        t: u.Quantity["time"] | None = None,
+        batch_size: int | None = None,
+        check: bool = True,
+    ) -> "InterpolatedPotential":
+        """Tabulate a potential on a grid.
+
+        Parameters
+        ----------
+        pot : `galax.potential.AbstractPotential`
+            The potential to tabulate. It is evaluated once per grid node.
+        x, y, z : Quantity[float, (n,), "length"] | Array[float, (n,)]
+            Strictly increasing grid nodes along each axis. The spacing need not
+            be uniform, e.g. nodes may be concentrated near the centre. ``y``
+            and ``z`` default to ``x``. Arrays are interpreted in the length
+            unit of ``pot.units``.
+
+        t : Quantity[float, (), "time"] | None, optional
+            The time at which to tabulate the potential. Defaults to 0.
+        batch_size : int | None, optional
+            The number of nodes evaluated at once. `None` (default) evaluates
+            all nodes together; set it to bound the memory used by expensive
+            potentials.
+        check : bool, optional
+            Whether to measure the interpolation error at the cell centres and
+            record it in ``error_report``. Default is `True`.
+
+        """
+        usys = pot.units
+        ulen, utime = usys["length"], usys["time"]
+        uenergy = usys["specific energy"]
+
+        def to_nodes(v: u.Quantity | ArrayLike) -> Float[Array, "n"]:
+            return jnp.asarray(u.ustrip(ulen, u.Quantity.from_(v, ulen)), dtype=float)
+
+        xs = to_nodes(x)
+        ys = xs if y is None else to_nodes(y)
+        zs = xs if z is None else to_nodes(z)
+        t_val = 0.0 if t is None else u.ustrip(utime, t)
+
+        def potential_mag(q: gt.Sz3) -> gt.FloatSz0:
+            qq = BareQuantity(q, ulen)
+            return u.ustrip(uenergy, pot._potential(qq, BareQuantity(t_val, utime)))  # noqa: SLF001
+
+        grad = jax.grad(potential_mag)
+        hess = jax.hessian(potential_mag)
+        dxyz = jax.grad(lambda q: hess(q)[0, 1])
+
+        def node_derivs(q: gt.Sz3) -> Float[Array, "2 2 2"]:
+            g, h = grad(q), hess(q)
+            return jnp.asarray(
+                [
+                    [[potential_mag(q), g[2]], [g[1], h[1, 2]]],
+                    [[g[0], h[0, 2]], [h[0, 1], dxyz(q)[2]]],
+                ]
+            )
+
+        grid = jnp.stack(jnp.meshgrid(xs, ys, zs, indexing="ij"), axis=-1)
+        derivs = jax.lax.map(node_derivs, grid.reshape(-1, 3), batch_size=batch_size)
+        derivs = derivs.reshape(*grid.shape[:-1], 2, 2, 2)
+
+        ipot = cls(xs, ys, zs, derivs, units=usys, constants=pot.constants)
+        if not check:
+            return ipot
+
+        # Hermite interpolation errors peak at the cell centres.
+        centres = jnp.stack(
+            jnp.meshgrid(
+                (xs[1:] + xs[:-1]) / 2,
+                (ys[1:] + ys[:-1]) / 2,
+                (zs[1:] + zs[:-1]) / 2,
+                indexing="ij",
+            ),
+            axis=-1,
+        ).reshape(-1, 3)
+
+        def exact(q: gt.Sz3) -> tuple[gt.FloatSz0, gt.Sz3]:
+            return jax.value_and_grad(potential_mag)(q)
+
+        phi, dphi = jax.lax.map(exact, centres, batch_size=batch_size)
+        iphi, idphi = jax.vmap(ipot._interpolate)(centres)  # noqa: SLF001
+
+        err_phi = jnp.abs(iphi - phi) / jnp.abs(phi)
+        err_grad = jnp.linalg.vector_norm(idphi - dphi, axis=-1)
+        err_grad = err_grad / jnp.linalg.vector_norm(dphi, axis=-1)
+        report = {
+            "potential_max": float(jnp.nanmax(err_phi)),
+            "potential_median": float(jnp.nanmedian(err_phi)),
+            "gradient_max": float(jnp.nanmax(err_grad)),
+            "gradient_median": float(jnp.nanmedian(err_grad)),
+        }
+        return cls(
+            xs, ys, zs, derivs, units=usys, constants=pot.constants, error_report=report
+        )
+
+    # ==========================================================================
+    # Interpolation
+
+    @partial(jax.jit, inline=True)
+    def _interpolate(self, q: gt.Sz3, /) -> tuple[gt.FloatSz0, gt.Sz3]:
+        """Interpolate the potential and its gradient at one position.
+
+        ``q`` is in the length unit of the potential and the returned values
+        are in its unit system.
+        """
+        idx, basis, dbasis = zip(
+            *(
+                _hermite_basis(nodes, qi)
+                for nodes, qi in ((self.x, q[0]), (self.y, q[1]), (self.z, q[2]))
+            ),
+            strict=True,
+        )
+        cell = jax.lax.dynamic_slice(self.derivs, (*idx, 0, 0, 0), (2, 2, 2, 2, 2, 2))
+
+        bx, by, bz = basis
+        dbx, dby, dbz = dbasis
+        contract = partial(jnp.einsum, "ia,jb,kc,ijkabc->")
+        phi = contract(bx, by, bz, cell)
+        grad = jnp.stack(
+            [
+                contract(dbx, by, bz, cell),
+                contract(bx, dby, bz, cell),
+                contract(bx, by, dbz, cell),
+            ]
+        )
+        return phi, grad
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->()")
+    def _potential(self, q: gt.QuSz3, _: gt.RealQuSz0, /) -> gt.SpecificEnergySz0:
+        phi, _ = self._interpolate(u.ustrip(self.units["length"], q))
+        return u.Quantity(phi, self.units["specific energy"])
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, _: gt.RealQuSz0, /) -> gt.QuSz3:
+        _, grad = self._interpolate(u.ustrip(self.units["length"], q))
+        return u.Quantity(grad, self.units["acceleration"])
+
+
+# ===== Helper functions =====
+
+
+def _hermite_basis(
+    nodes: Float[Array, "n"], x: gt.FloatSz0, /
+) -> tuple[Int[Array, ""], Float[Array, "2 2"], Float[Array, "2 2"]]:
+    """Cubic Hermite basis of the cell containing ``x``.
+
+    Returns the index of the left node of the cell, and the basis and its
+    derivative as ``B[corner, order]``: the weights of the value (order 0) and
+    of the derivative (order 1) at the left (corner 0) and right (corner 1)
+    nodes.
+    """
+    i = jnp.searchsorted(nodes, x, side="right").astype(int) - 1
+    i = jnp.clip(i, 0, len(nodes) - 2)
+    h = nodes[i + 1] - nodes[i]
+    s = (x - nodes[i]) / h
+    s2, s3 = s**2, s**3
+
+    basis = jnp.asarray(
+        [
+            [2 * s3 - 3 * s2 + 1, h * (s3 - 2 * s2 + s)],
+            [-2 * s3 + 3 * s2, h * (s3 - s2)],
+        ]
+    )
+    dbasis = jnp.asarray(
+        [
+            [(6 * s2 - 6 * s) / h, 3 * s2 - 4 * s + 1],
+            [(-6 * s2 + 6 * s) / h, 3 * s2 - 2 * s],
+        ]
+    )
+    return i, basis, dbasis
@@ -22,6 +22,7 @@ from galax.potential._src.base import default_constants
 from galax.potential._src.base_single import AbstractSinglePotential
 from galax.potential._src.params.core import AbstractParameter
 from galax.potential._src.params.field import ParameterField
+from galax.utils._jax import vectorize_method
 
 
 @final
@@ -45,6 +46,25 @@ class LogarithmicPotential(AbstractSinglePotential):
         r = jnp.linalg.vector_norm(q, axis=-1).ustrip(self.units["length"])
         return 0.5 * self.v_c(t) ** 2 * jnp.log(r_s**2 + r**2)
 
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        d2 = self.r_s(t) ** 2 + jnp.sum(q**2, axis=-1)
+        return self.v_c(t) ** 2 * q / d2
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        d2 = self.r_s(t) ** 2 + jnp.sum(q**2, axis=-1)
+        v2 = self.v_c(t) ** 2
+        return v2 / d2 * jnp.eye(3) - 2 * v2 / d2**2 * jnp.outer(q, q)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        r_s2, r2 = self.r_s(t) ** 2, jnp.sum(q**2, axis=-1)
+        num = self.v_c(t) ** 2 * (3 * r_s2 + r2)
+        return num / (4 * jnp.pi * self.constants["G"] * (r_s2 + r2) ** 2)
+
 
 @final
 class LMJ09LogarithmicPotential(AbstractSinglePotential):
@@ -91,3 +111,36 @@ class LMJ09LogarithmicPotential(AbstractSinglePotential):
                 + u.ustrip(self.units["area"], r2)
             )
         )
+
+    @partial(jax.jit, inline=True)
+    def _metric(self, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        r"""Return the matrix :math:`M` such that :math:`r^2 = q^T M q`."""
+        phi = self.phi(t)
+        sphi, cphi = jnp.sin(phi), jnp.cos(phi)
+        zero, one = jnp.zeros_like(cphi), jnp.ones_like(cphi)
+        rot = jnp.stack(
+            [
+                jnp.stack([cphi, sphi, zero]),
+                jnp.stack([-sphi, cphi, zero]),
+                jnp.stack([zero, zero, one]),
+            ]
+        )
+        inv_q2 = 1 / jnp.stack([self.q1(t), self.q2(t), self.q3(t)]) ** 2
+        return rot.T @ (inv_q2[:, None] * rot)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        M = self._metric(t)
+        Mq = M @ q
+        d2 = self.r_s(t) ** 2 + jnp.sum(q * Mq, axis=-1)
+        return self.v_c(t) ** 2 * Mq / d2
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        M = self._metric(t)
+        Mq = M @ q
+        d2 = self.r_s(t) ** 2 + jnp.sum(q * Mq, axis=-1)
+        v2 = self.v_c(t) ** 2
+        return v2 / d2 * M - 2 * v2 / d2**2 * jnp.outer(Mq, Mq)
@@ -7,19 +7,21 @@ __all__ = [
     "MultipolePotential",
 ]
 
+from collections.abc import Callable
 from dataclasses import KW_ONLY
 from functools import partial
 from typing import final
 
 import jax
+import numpy as np
 from equinox import field
-from jax.scipy.special import sph_harm
-from jaxtyping import Array, Float
+from jaxtyping import Array, ArrayLike, Float
 
 import quaxed.numpy as jnp
 import unxt as u
 
 import galax.typing as gt
+from galax.potential._src.base import AbstractPotential
 from galax.potential._src.base_single import AbstractSinglePotential
 from galax.potential._src.params.core import AbstractParameter
 from galax.potential._src.params.field import ParameterField
@@ -80,15 +82,10 @@ class MultipoleInnerPotential(AbstractMultipolePotential):
         s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(q), r_s)
 
         # Compute the summation over l and m
-        l_max = self.l_max
-        ls, ms = jnp.tril_indices(l_max + 1)
-
-        # TODO: vectorize compute_Ylm over l, m, then don't need a vmap?
-        def summand(l: int, m: int) -> Float[Array, "*batch"]:
-            cPlm, sPlm = compute_Ylm(l, m, theta, phi, l_max=l_max)
-            return jnp.pow(s, l) * (Slm[l, m] * cPlm + Tlm[l, m] * sPlm)
-
-        summation = jnp.sum(jax.vmap(summand, in_axes=(0, 0))(ls, ms), axis=0)
+        cPlm, sPlm = compute_Ylm(theta, phi, l_max=self.l_max)
+        ls = jnp.arange(self.l_max + 1)
+        sl = jnp.pow(s[..., None], ls)[..., None]
+        summation = jnp.sum(sl * (Slm * cPlm + Tlm * sPlm), axis=(-2, -1))
         if is_scalar:
             summation = summation[0]
 
@@ -137,15 +134,10 @@ class MultipoleOuterPotential(AbstractMultipolePotential):
         s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(q), r_s)
 
         # Compute the summation over l and m
-        l_max = self.l_max
-        ls, ms = jnp.tril_indices(l_max + 1)
-
-        # TODO: vectorize compute_Ylm over l, m, then don't need a vmap?
-        def summand(l: int, m: int) -> Float[Array, "*batch"]:
-            cPlm, sPlm = compute_Ylm(l, m, theta, phi, l_max=l_max)
-            return jnp.pow(s, -(l + 1)) * (Slm[l, m] * cPlm + Tlm[l, m] * sPlm)
-
-        summation = jnp.sum(jax.vmap(summand, in_axes=(0, 0))(ls, ms), axis=0)
+        cPlm, sPlm = compute_Ylm(theta, phi, l_max=self.l_max)
+        ls = jnp.arange(self.l_max + 1)
+        sl1 = jnp.pow(s[..., None], -(ls + 1))[..., None]
+        summation = jnp.sum(sl1 * (Slm * cPlm + Tlm * sPlm), axis=(-2, -1))
         if is_scalar:
             summation = summation[0]
 
@@ -164,6 +156,20 @@ class MultipolePotential(AbstractMultipolePotential):
              + (r^l IT_{lm} + r^{-(l+1)} OT_{lm}) \, \sin{m\,\phi}]
             \, P_l^m(\cos\theta)
 
+    If ``s_knots`` is given, the coefficients are instead tabulated at the
+    radii ``s_knots`` (in units of ``r_s``), with shape ``(K, l_max + 1, l_max +
+    1)``, and vary with radius. This represents a continuous density, for which
+    :math:`IS_{lm}(r)` collects the mass outside :math:`r` and
+    :math:`OS_{lm}(r)` the mass inside (see
+    :meth:`~galax.potential.MultipolePotential.from_density`). Each radial term
+    :math:`\Phi_{lm}(r) = r^l IS_{lm}(r) + r^{-(l+1)} OS_{lm}(r)` is then
+    evaluated by cubic Hermite interpolation in :math:`\ln r`, using the
+    values and the exact derivatives :math:`d\Phi_{lm}/d\ln r = l r^l IS_{lm} -
+    (l+1) r^{-(l+1)} OS_{lm}` at the knots. Outside the outermost knot the
+    coefficients are held fixed, which is exact for a density truncated there.
+    Inside the innermost knot the outer coefficients are scaled as
+    :math:`r^{2l+3}`, as for a regular density.
+
     """
 
     ISlm: AbstractParameter = ParameterField(dimensions="dimensionless")  # type: ignore[assignment]
@@ -178,8 +184,22 @@ class MultipolePotential(AbstractMultipolePotential):
     OTlm: AbstractParameter = ParameterField(dimensions="dimensionless")  # type: ignore[assignment]
     r"""Outer Spherical harmonic coefficients for the $\sin(m \phi)$ terms."""
 
+    s_knots: Float[Array, "K"] | None = field(
+        default=None,
+        converter=lambda x: x if x is None else jnp.asarray(x, dtype=float),
+    )
+    """Radii of the tabulated coefficients, in units of ``r_s``.
+
+    `None` (default) for constant coefficients.
+    """
+
     def __check_init__(self) -> None:
         shape = (self.l_max + 1, self.l_max + 1)
+        if self.s_knots is not None:
+            if self.s_knots.ndim != 1 or len(self.s_knots) < 2:
+                msg = "s_knots must be a 1D array of at least 2 radii."
+                raise ValueError(msg)
+            shape = (len(self.s_knots), *shape)
         t = u.Quantity(0.0, "Gyr")
         is_shape, it_shape = self.ISlm(t).shape, self.ITlm(t).shape
         os_shape, ot_shape = self.OSlm(t).shape, self.OTlm(t).shape
@@ -190,9 +210,310 @@ class MultipolePotential(AbstractMultipolePotential):
             or os_shape != shape
             or ot_shape != shape
         ):
-            msg = "I/OSlm and I/OTlm must have the shape (l_max + 1, l_max + 1)."
+            msg = (
+                "I/OSlm and I/OTlm must have the shape (l_max + 1, l_max + 1), "
+                "or (len(s_knots), l_max + 1, l_max + 1) with s_knots."
+            )
+            raise ValueError(msg)
+
+    # ==========================================================================
+    # Constructors
+
+    @classmethod
+    def from_particles(
+        cls,
+        q: u.Quantity["length"] | ArrayLike,
+        m: u.Quantity["mass"] | ArrayLike,
+        /,
+        *,
+        l_max: int,
+        r_s: u.Quantity["length"] | ArrayLike,
+        r_split: u.Quantity["length"] | ArrayLike | None = None,
+        units: u.AbstractUnitSystem | str,
+        chunk_size: int = 2**14,
+    ) -> "MultipolePotential":
+        r"""Fit the multipole expansion to a set of particles.
+
+        The potential of point masses :math:`m_k` at :math:`\mathbf{q}_k` is
+        expanded about the origin. Particles inside ``r_split`` contribute to
+        the outer coefficients and those outside to the inner coefficients,
+
+        .. math::
+
+            OS_{lm} = -\frac{4\pi \epsilon_m}{2l+1} \sum_{s_k < s_\mathrm{split}}
+                \frac{m_k}{M} s_k^l \bar{P}_l^m(\cos\theta_k) \cos{m\phi_k},
+            \qquad
+            IS_{lm} = -\frac{4\pi \epsilon_m}{2l+1}
+                \sum_{s_k \geq s_\mathrm{split}}
+                \frac{m_k}{M} s_k^{-(l+1)} \bar{P}_l^m(\cos\theta_k)
+                \cos{m\phi_k},
+
+        and likewise for :math:`IT_{lm}, OT_{lm}` with :math:`\sin{m\phi_k}`,
+        where :math:`s = r / r_s`, :math:`M = \sum_k m_k`, and
+        :math:`\epsilon_0 = 1, \epsilon_{m>0} = 2`. The expansion is exact
+        (up to ``l_max``) wherever all particles inside the evaluation radius
+        are inside ``r_split`` and all those outside it are outside
+        ``r_split``, e.g. in an empty shell around ``r_split`` or, with the
+        default, outside the snapshot.
+
+        The particles are processed in chunks of ``chunk_size``, so the cost is
+        :math:`O(N \, l_\mathrm{max}^2)` in time and :math:`O(\mathrm{chunk}
+        \, l_\mathrm{max}^2)` in memory. Only one chunk at a time is moved to
+        the device, so host (NumPy) arrays larger than the device memory can be
+        used.
+
+        Parameters
+        ----------
+        q : Quantity[float, (N, 3), "length"] | Array[float, (N, 3)]
+            Particle positions. Arrays are interpreted in the length unit of
+            ``units``.
+        m : Quantity[float, (N,), "mass"] | Array[float, (N,)]
+            Particle masses. Arrays are interpreted in the mass unit of
+            ``units``.
+        l_max : int
+            The maximum degree of the expansion.
+        r_s : Quantity[float, (), "length"] | Array[float, ()]
+            The scale radius of the expansion.
+        r_split : Quantity[float, (), "length"] | Array[float, ()] | None
+            The radius separating the particles in the outer expansion from
+            those in the inner expansion. `None` (default) puts every particle
+            in the outer expansion.
+        units : `unxt.AbstractUnitSystem` | str
+            The unit system of the potential.
+        chunk_size : int, optional
+            The number of particles processed at once.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import unxt as u
+        >>> import galax.potential as gp
+
+        >>> rng = np.random.default_rng(0)
+        >>> q = u.Quantity(rng.normal(size=(1_000, 3)), "kpc")
+        >>> m = u.Quantity(np.full(1_000, 1e7), "Msun")
+        >>> pot = gp.MultipolePotential.from_particles(
+        ...     q, m, l_max=4, r_s=u.Quantity(1, "kpc"), units="galactic")
+
+        Outside the particles, the potential converges to that of a point mass:
+
+        >>> x = u.Quantity([50.0, 0, 0], "kpc")
+        >>> kep = gp.KeplerPotential(m_tot=u.Quantity(1e10, "Msun"),
+        ...                          units="galactic")
+        >>> bool(abs(pot.potential(x, 0) / kep.potential(x, 0) - 1) < 1e-2)
+        True
+
+        """
+        usys = u.unitsystem(units)
+        ulen, umass = usys["length"], usys["mass"]
+
+        r_s_val = _strip(r_s, ulen)
+        r_split_val = jnp.inf if r_split is None else _strip(r_split, ulen) / r_s_val
+
+        n = len(q)
+        if q.shape != (n, 3) or m.shape != (n,):
+            msg = f"q must have shape (N, 3) and m (N,), got {q.shape}, {m.shape}."
             raise ValueError(msg)
 
+        # Accumulate the moments over fixed-size chunks. The last chunk is
+        # padded with massless particles so the kernel compiles only once.
+        moments = jnp.zeros((4, l_max + 1, l_max + 1))
+        m_tot = 0.0
+        for i in range(0, n, chunk_size):
+            q_i = jnp.asarray(_strip(q[i : i + chunk_size], ulen), dtype=float)
+            m_i = jnp.asarray(_strip(m[i : i + chunk_size], umass), dtype=float)
+            pad = chunk_size - len(m_i) if n > chunk_size else 0
+            q_i = jnp.pad(q_i / r_s_val, ((0, pad), (0, 0)), constant_values=1.0)
+            m_i = jnp.pad(m_i, (0, pad))
+            moments = moments + _particle_moments(q_i, m_i, r_split_val, l_max=l_max)
+            m_tot = m_tot + jnp.sum(m_i)
+
+        ls = np.arange(l_max + 1)[:, None]
+        eps = np.where(np.arange(l_max + 1) == 0, 1.0, 2.0)[None, :]
+        ISlm, ITlm, OSlm, OTlm = -4 * np.pi * eps / (2 * ls + 1) * moments / m_tot
+
+        return cls(
+            m_tot=u.Quantity(m_tot, umass),
+            r_s=u.Quantity(r_s_val, ulen),
+            l_max=l_max,
+            ISlm=ISlm,
+            ITlm=ITlm,
+            OSlm=OSlm,
+            OTlm=OTlm,
+            units=usys,
+        )
+
+    @classmethod
+    def from_density(
+        cls,
+        density: AbstractPotential | Callable[[u.Quantity], u.Quantity],
+        /,
+        *,
+        l_max: int,
+        r_s: u.Quantity["length"] | ArrayLike,
+        units: u.AbstractUnitSystem | str,
+        t: u.Quantity["time"] | None = None,
+        r_min: u.Quantity["length"] | ArrayLike | None = None,
+        r_max: u.Quantity["length"] | ArrayLike | None = None,
+        n_r: int = 128,
+        n_theta: int | None = None,
+        n_phi: int | None = None,
+        chunk_size: int = 2**14,
+    ) -> "MultipolePotential":
+        r"""Solve Poisson's equation for a density by a multipole expansion.
+
+        The density is projected onto the spherical harmonics on spheres of
+        radius :math:`s = r / r_s`,
+
+        .. math::
+
+            \rho_{lm}(s) = \int \rho(s, \theta, \phi) \, \bar{P}_l^m(\cos\theta)
+                \cos{m\phi} \, d\Omega,
+
+        by Gauss-Legendre quadrature in :math:`\cos\theta` and the trapezoid
+        rule in :math:`\phi`, and the radial integrals
+
+        .. math::
+
+            OS_{lm}(s) = -\frac{4\pi \epsilon_m}{(2l+1) M} \int_0^s
+                \rho_{lm}(s') \, s'^{l+2} \, ds',
+            \qquad
+            IS_{lm}(s) = -\frac{4\pi \epsilon_m}{(2l+1) M} \int_s^{s_\mathrm{max}}
+                \rho_{lm}(s') \, s'^{1-l} \, ds',
+
+        (and likewise :math:`IT_{lm}, OT_{lm}` with :math:`\sin{m\phi}`) are
+        accumulated over ``n_r`` knots log-spaced between ``r_min`` and
+        ``r_max``, with 4-point Gauss-Legendre quadrature in each interval.
+        This is the continuous analogue of
+        :meth:`~galax.potential.MultipolePotential.from_particles`. The density
+        is truncated at ``r_max``, so for densities extending beyond it the
+        potential is offset by (nearly) a constant inside ``r_max``. The
+        density is evaluated once, in batches of ``chunk_size`` quadrature
+        nodes; the resulting potential costs the same per evaluation as any
+        other multipole expansion with the same ``l_max``.
+
+        Parameters
+        ----------
+        density : `galax.potential.AbstractPotential` | callable
+            The density to expand: either a potential, whose density is used,
+            or a function of the position ``Quantity[float, (N, 3), "length"]``
+            returning a ``Quantity[float, (N,), "mass density"]``.
+        l_max : int
+            The maximum degree of the expansion.
+        r_s : Quantity[float, (), "length"] | Array[float, ()]
+            The scale radius of the expansion.
+        units : `unxt.AbstractUnitSystem` | str
+            The unit system of the potential.
+        t : Quantity[float, (), "time"] | None, optional
+            The time at which to evaluate the density of a potential. Defaults
+            to 0.
+        r_min, r_max : Quantity[float, (), "length"] | Array[float, ()] | None
+            The innermost and outermost knots. Default to ``1e-3 r_s`` and
+            ``1e3 r_s``.
+        n_r : int, optional
+            The number of radial knots.
+        n_theta, n_phi : int | None, optional
+            The number of polar and azimuthal quadrature nodes. Default to
+            ``2 * l_max + 8``, enough to resolve densities with harmonics up to
+            about twice ``l_max``.
+        chunk_size : int, optional
+            The number of quadrature nodes evaluated at once.
+
+        Examples
+        --------
+        >>> import jax.numpy as jnp
+        >>> import unxt as u
+        >>> import galax.potential as gp
+
+        >>> hern = gp.HernquistPotential(m_tot=u.Quantity(1e12, "Msun"),
+        ...                              r_s=u.Quantity(10, "kpc"), units="galactic")
+        >>> pot = gp.MultipolePotential.from_density(
+        ...     hern, l_max=2, r_s=u.Quantity(10, "kpc"), units="galactic")
+        >>> pot.s_knots.shape, pot.ISlm(0).shape
+        ((128,), (128, 3, 3))
+
+        >>> q = u.Quantity([1.0, 2, 3], "kpc")
+        >>> bool(jnp.isclose(pot.potential(q, 0).value, hern.potential(q, 0).value,
+        ...                  rtol=1e-5))
+        True
+
+        """
+        usys = u.unitsystem(units)
+        ulen = usys["length"]
+        r_s_val = _strip(r_s, ulen)
+        s_min = 1e-3 if r_min is None else _strip(r_min, ulen) / r_s_val
+        s_max = 1e3 if r_max is None else _strip(r_max, ulen) / r_s_val
+        n_theta = 2 * l_max + 8 if n_theta is None else n_theta
+        n_phi = 2 * l_max + 8 if n_phi is None else n_phi
+
+        if isinstance(density, AbstractPotential):
+            t = u.Quantity(0.0, usys["time"]) if t is None else t
+            pot = density
+            density = lambda q: pot.density(q, t)  # noqa: E731
+
+        # Radial nodes (in units of r_s) and weights: linear in s inside the
+        # first knot, then 4 nodes in ln s per interval between knots.
+        s_knots = np.geomspace(s_min, s_max, n_r)
+        xi, w_xi = np.polynomial.legendre.leggauss(4)
+        lnk = np.log(s_knots)
+        mid, half = (lnk[1:] + lnk[:-1]) / 2, (lnk[1:] - lnk[:-1]) / 2
+        s_seg = np.concat(
+            [s_knots[0] * (1 + xi[None]) / 2, np.exp(mid[:, None] + half[:, None] * xi)]
+        )
+        w_seg = np.concat(
+            [s_knots[0] / 2 * w_xi[None], half[:, None] * w_xi * s_seg[1:]]
+        )
+
+        # Angular nodes and the harmonics on them.
+        mu, w_mu = np.polynomial.legendre.leggauss(n_theta)
+        phi = 2 * np.pi * np.arange(n_phi) / n_phi
+        mu, phi = (v.ravel() for v in np.meshgrid(mu, phi, indexing="ij"))
+        w_ang = np.repeat(w_mu, n_phi) * 2 * np.pi / n_phi
+        cPlm, sPlm = compute_Ylm(jnp.acos(mu), jnp.asarray(phi), l_max=l_max)
+        Ylm = jnp.stack([cPlm, sPlm], axis=1) * w_ang[:, None, None, None]
+        sin_theta = np.sqrt(1 - mu**2)
+        dirs = np.stack([sin_theta * np.cos(phi), sin_theta * np.sin(phi), mu], -1)
+
+        # Project the density onto the harmonics, a few spheres at a time.
+        s_all = s_seg.ravel()
+        rho_unit = usys["mass density"]
+        step = max(1, chunk_size // len(w_ang))
+        rho_lm = []
+        for i in range(0, len(s_all), step):
+            s_i = s_all[i : i + step]
+            x = (s_i[:, None, None] * dirs).reshape(-1, 3) * r_s_val
+            rho = u.ustrip(rho_unit, density(u.Quantity(x, ulen)))
+            rho = jnp.reshape(rho, (len(s_i), len(w_ang))) * r_s_val**3
+            rho_lm.append(jnp.einsum("na,aklm->nklm", rho, Ylm))
+        rho_lm = jnp.concat(rho_lm).reshape(*s_seg.shape, 2, l_max + 1, l_max + 1)
+
+        # Cumulative radial integrals.
+        ls = np.arange(l_max + 1)[:, None]
+        w = w_seg[..., None, None, None]
+        s_ = s_seg[..., None, None, None]
+        seg_out = jnp.sum(w * jnp.pow(s_, ls + 2) * rho_lm, axis=1)
+        seg_in = jnp.sum(w[1:] * jnp.pow(s_[1:], 1 - ls) * rho_lm[1:], axis=1)
+        outer = jnp.cumsum(seg_out, axis=0)
+        inner = jnp.cumsum(seg_in[::-1], axis=0)[::-1]
+        inner = jnp.concat([inner, jnp.zeros_like(inner[:1])])
+
+        m_tot = np.sqrt(4 * np.pi) * outer[-1, 0, 0, 0]
+        eps = np.where(np.arange(l_max + 1) == 0, 1.0, 2.0)[None, :]
+        norm = -4 * np.pi * eps / (2 * ls + 1) / m_tot
+        inner, outer = inner * norm, outer * norm
+
+        return cls(
+            m_tot=u.Quantity(m_tot, usys["mass"]),
+            r_s=u.Quantity(r_s_val, ulen),
+            l_max=l_max,
+            ISlm=inner[:, 0],
+            ITlm=inner[:, 1],
+            OSlm=outer[:, 0],
+            OTlm=outer[:, 1],
+            s_knots=s_knots,
+            units=usys,
+        )
+
     @partial(jax.jit, inline=True)
     def _potential(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
         # Compute the parameters
@@ -204,18 +525,27 @@ class MultipolePotential(AbstractMultipolePotential):
         is_scalar = q.ndim == 1
         s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(q), r_s)
 
-        # Compute the summation over l and m
-        l_max = self.l_max
-        ls, ms = jnp.tril_indices(l_max + 1)
-
-        # TODO: vectorize compute_Ylm over l, m, then don't need a vmap?
-        def summand(l: int, m: int) -> Float[Array, "*batch"]:
-            cPlm, sPlm = compute_Ylm(l, m, theta, phi, l_max=l_max)
-            inner = jnp.pow(s, l) * (ISlm[l, m] * cPlm + ITlm[l, m] * sPlm)
-            outer = jnp.pow(s, -l - 1) * (OSlm[l, m] * cPlm + OTlm[l, m] * sPlm)
-            return inner + outer
-
-        summation = jnp.sum(jax.vmap(summand, in_axes=(0, 0))(ls, ms), axis=0)
+        # Compute the summation over l and m. The harmonics are shared by the
+        # inner and outer expansions.
+        cPlm, sPlm = compute_Ylm(theta, phi, l_max=self.l_max)
+        if self.s_knots is None:
+            ls = jnp.arange(self.l_max + 1)
+            sl = jnp.pow(s[..., None], ls)[..., None]
+            sl1 = jnp.pow(s[..., None], -(ls + 1))[..., None]
+            inner = sl * (ISlm * cPlm + ITlm * sPlm)
+            outer = sl1 * (OSlm * cPlm + OTlm * sPlm)
+            summation = jnp.sum(inner + outer, axis=(-2, -1))
+        else:
+            radial = _radial_terms(
+                s,
+                self.s_knots,
+                jnp.stack([ISlm, ITlm], axis=1),
+                jnp.stack([OSlm, OTlm], axis=1),
+            )
+            summation = jnp.sum(
+                radial[..., 0, :, :] * cPlm + radial[..., 1, :, :] * sPlm,
+                axis=(-2, -1),
+            )
         if is_scalar:
             summation = summation[0]
 
@@ -225,6 +555,10 @@ class MultipolePotential(AbstractMultipolePotential):
 # ===== Helper functions =====
 
 
+def _strip(v: u.AbstractQuantity | ArrayLike, unit: gt.Unit, /) -> ArrayLike:
+    return u.ustrip(unit, v) if isinstance(v, u.AbstractQuantity) else v
+
+
 def cartesian_to_normalized_spherical(
     q: gt.BtQuSz3, r_s: u.Quantity, /
 ) -> tuple[gt.BtFloatSz0, gt.BtFloatSz0, u.Quantity]:
@@ -259,14 +593,166 @@ def cartesian_to_normalized_spherical(
     return s.value, theta, phi
 
 
-# TODO: vectorize such that it's signature="(l),(l),(N),(N)->(l, N)":
-def compute_Ylm(
-    l: int,
-    m: int,
-    theta: Float[Array, "*batch"],
-    phi: Float[Array, "*batch"],
+@partial(jax.jit, static_argnames=("l_max",))
+def _particle_moments(
+    s: Float[Array, "N 3"],
+    m: Float[Array, "N"],
+    s_split: gt.FloatSz0,
+    /,
     *,
     l_max: int,
-) -> tuple[Float[Array, "*batch"], Float[Array, "*batch"]]:
-    Ylm = sph_harm(jnp.atleast_1d(m), jnp.atleast_1d(l), phi, theta, n_max=l_max)
-    return Ylm.real, Ylm.imag
+) -> Float[Array, "4 l m"]:
+    r"""Unnormalized multipole moments of point masses.
+
+    ``s`` are positions in units of the scale radius. Returns the sums
+    :math:`\sum_k m_k s_k^{-(l+1)} \bar{P}_l^m \{\cos, \sin\}(m\phi_k)` over
+    the particles outside ``s_split`` and :math:`\sum_k m_k s_k^l \bar{P}_l^m
+    \{\cos, \sin\}(m\phi_k)` over those inside, stacked as ``(IS, IT, OS,
+    OT)``.
+    """
+    r = jnp.linalg.vector_norm(s, axis=-1)
+    theta = jnp.acos(s[:, 2] / jnp.where(r > 0, r, 1.0))
+    phi = jnp.atan2(s[:, 1], s[:, 0])
+    cPlm, sPlm = compute_Ylm(theta, phi, l_max=l_max)
+
+    ls = jnp.arange(l_max + 1)
+    outside = r >= s_split
+    w_in = jnp.where(outside, m, 0)[:, None] * jnp.pow(
+        jnp.where(outside, r, 1.0)[:, None], -(ls + 1)
+    )
+    w_out = jnp.where(outside, 0, m)[:, None] * jnp.pow(r[:, None], ls)
+    contract = partial(jnp.einsum, "nl,nlm->lm")
+    return jnp.stack(
+        [
+            contract(w_in, cPlm),
+            contract(w_in, sPlm),
+            contract(w_out, cPlm),
+            contract(w_out, sPlm),
+        ]
+    )
+
+
+def _radial_terms(
+    s: Float[Array, "*batch"],
+    s_knots: Float[Array, "K"],
+    inner: Float[Array, "K 2 l m"],
+    outer: Float[Array, "K 2 l m"],
+    /,
+) -> Float[Array, "*batch 2 l m"]:
+    r"""Radial terms :math:`s^l I_{lm}(s) + s^{-(l+1)} O_{lm}(s)`.
+
+    Cubic Hermite interpolation in :math:`\ln s` between the knots, using the
+    exact logarithmic derivatives :math:`l s^l I_{lm} - (l+1) s^{-(l+1)}
+    O_{lm}` of the tabulated terms. See
+    `galax.potential.MultipolePotential`.
+    """
+    ls = jnp.arange(inner.shape[-2])[:, None]
+    sk = s_knots[:, None, None, None]
+    y_in, y_out = jnp.pow(sk, ls) * inner, jnp.pow(sk, -(ls + 1)) * outer
+    y, dy = y_in + y_out, ls * y_in - (ls + 1) * y_out
+
+    # Interpolate inside the knots
+    x_k = jnp.log(s_knots)
+    s_safe = jnp.where(s > 0, s, s_knots[0])
+    x = jnp.log(s_safe)
+    i = jnp.clip(jnp.searchsorted(x_k, x) - 1, 0, len(x_k) - 2)
+    h = x_k[i + 1] - x_k[i]
+    t = jnp.clip((x - x_k[i]) / h, 0.0, 1.0)
+    t2, t3 = t**2, t**3
+    h00, h01 = 2 * t3 - 3 * t2 + 1, 3 * t2 - 2 * t3
+    h10, h11 = (t3 - 2 * t2 + t) * h, (t3 - t2) * h
+    c = lambda v: v[..., None, None, None]  # noqa: E731
+    within = c(h00) * y[i] + c(h10) * dy[i] + c(h01) * y[i + 1] + c(h11) * dy[i + 1]
+
+    # Extrapolate with fixed inner coefficients, and fixed (outside) or
+    # s^(2l+3)-scaled (inside) outer coefficients.
+    ss = c(s)
+    below = jnp.pow(ss, ls) * inner[0] + y_out[0] * jnp.pow(ss / s_knots[0], ls + 2)
+    above = jnp.pow(ss, ls) * inner[-1] + jnp.pow(c(s_safe), -(ls + 1)) * outer[-1]
+
+    return jnp.where(
+        c(s < s_knots[0]), below, jnp.where(c(s > s_knots[-1]), above, within)
+    )
+
+
+def normalized_legendre(
+    x: Float[Array, "*batch"], y: Float[Array, "*batch"], /, *, l_max: int
+) -> Float[Array, "*batch l m"]:
+    r"""Orthonormalized associated Legendre functions up to ``l_max``.
+
+    Computes
+
+    .. math::
+
+        \bar{P}_l^m(x) = \sqrt{\frac{2l+1}{4\pi} \frac{(l-m)!}{(l+m)!}}
+            \, P_l^m(x)
+
+    (including the Condon-Shortley phase) for all :math:`0 \leq m \leq l \leq
+    l_\mathrm{max}` in one sweep over :math:`l`, using the standard stable
+    recurrences
+
+    .. math::
+
+        \bar{P}_m^m = -\sqrt{\frac{2m+1}{2m}} \, y \, \bar{P}_{m-1}^{m-1},
+        \qquad
+        \bar{P}_l^m = a_{lm} \left(x \bar{P}_{l-1}^m - b_{lm} \bar{P}_{l-2}^m
+            \right),
+
+    with :math:`a_{lm} = \sqrt{(4l^2 - 1) / (l^2 - m^2)}` and :math:`b_{lm} =
+    \sqrt{((l-1)^2 - m^2) / (4(l-1)^2 - 1)}`.
+
+    Parameters
+    ----------
+    x, y : Array[float, (*batch,)]
+        :math:`\cos\theta` and :math:`\sin\theta`.
+    l_max : int
+        The maximum degree.
+
+    Returns
+    -------
+    Array[float, (*batch, l_max + 1, l_max + 1)]
+        :math:`\bar{P}_l^m`, indexed by ``[..., l, m]``. Entries with
+        :math:`m > l` are zero.
+    """
+    # Recurrence coefficients, computed once per l_max.
+    ls, ms = np.arange(l_max + 1)[:, None], np.arange(l_max + 1)[None, :]
+    a_den = np.where(ms < ls, ls**2 - ms**2, 1)
+    a = np.sqrt(np.where(ms < ls, (4 * ls**2 - 1) / a_den, 0.0))
+    b_den = np.where(ms < ls - 1, 4 * (ls - 1) ** 2 - 1, 1)
+    b = np.sqrt(np.where(ms < ls - 1, ((ls - 1) ** 2 - ms**2) / b_den, 0.0))
+
+    # Sectoral terms, P_m^m.
+    k = np.arange(1, l_max + 1)
+    sectoral = np.concat([[1.0], np.cumprod(-np.sqrt((2 * k + 1) / (2 * k)))])
+    sectoral = (
+        sectoral / np.sqrt(4 * np.pi) * jnp.pow(y[..., None], np.arange(l_max + 1))
+    )
+
+    def step(
+        carry: tuple[Float[Array, "*batch m"], Float[Array, "*batch m"]],
+        coeffs: tuple[Float[Array, "m"], Float[Array, "m"], Float[Array, "m"]],
+    ) -> tuple[tuple[Float[Array, "*batch m"], Float[Array, "*batch m"]], Array]:
+        p1, p2 = carry  # P_{l-1}^m, P_{l-2}^m
+        a_l, b_l, is_diag = coeffs
+        p = a_l * (x[..., None] * p1 - b_l * p2) + is_diag * sectoral
+        return (p, p1), p
+
+    p0 = sectoral * (ms[0] == 0)
+    _, pl = jax.lax.scan(
+        step, (p0, jnp.zeros_like(p0)), (a[1:], b[1:], np.eye(l_max + 1)[1:])
+    )
+    return jnp.moveaxis(jnp.concat([p0[None], pl], axis=0), 0, -2)
+
+
+def compute_Ylm(
+    theta: Float[Array, "*batch"], phi: Float[Array, "*batch"], /, *, l_max: int
+) -> tuple[Float[Array, "*batch l m"], Float[Array, "*batch l m"]]:
+    r"""Real and imaginary parts of the spherical harmonics up to ``l_max``.
+
+    Returns :math:`\bar{P}_l^m(\cos\theta) \cos(m\phi)` and
+    :math:`\bar{P}_l^m(\cos\theta) \sin(m\phi)`, indexed by ``[..., l, m]``,
+    matching :func:`jax.scipy.special.sph_harm`.
+    """
+    Plm = normalized_legendre(jnp.cos(theta), jnp.sin(theta), l_max=l_max)
+    mphi = jnp.arange(l_max + 1) * phi[..., None]
+    return Plm * jnp.cos(mphi)[..., None, :], Plm * jnp.sin(mphi)[..., None, :]
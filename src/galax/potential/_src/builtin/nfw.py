@@ -7,6 +7,7 @@ __all__ = [
     "Vogelsberger08TriaxialNFWPotential",
 ]
 
+import itertools
 from collections.abc import Callable
 from dataclasses import KW_ONLY
 from functools import partial
@@ -25,10 +26,16 @@ from xmmutablemap import ImmutableMap
 
 import galax.typing as gt
 from .const import _log2
+from .utils import radial_gradient, radial_hessian
 from galax.potential._src.base import default_constants
 from galax.potential._src.base_single import AbstractSinglePotential
-from galax.potential._src.params.core import AbstractParameter
+from galax.potential._src.params.core import (
+    AbstractParameter,
+    ConstantParameter,
+    _natural_spline_second_derivs,
+)
 from galax.potential._src.params.field import ParameterField
+from galax.utils._jax import vectorize_method
 
 # -------------------------------------------------------------------
 
@@ -72,6 +79,39 @@ class NFWPotential(AbstractSinglePotential):
         v_h2 = self.constants["G"] * self.m(t) / r_s
         return -v_h2 * jnp.log(1.0 + u) / u
 
+    @partial(jax.jit, inline=True)
+    def _dpotential_dr(
+        self, r: gt.FloatQuSz0, t: gt.RealQuSz0, /
+    ) -> tuple[gt.FloatQuSz0, gt.FloatQuSz0]:
+        r"""First and second radial derivatives of the potential.
+
+        .. math::
+
+            \frac{d\Phi}{dr} = G M \left(\frac{\log(1 + r/r_s)}{r^2}
+                                 - \frac{1}{r (r + r_s)}\right)
+        """
+        GM, r_s = self.constants["G"] * self.m(t), self.r_s(t)
+        log1pu = jnp.log(1.0 + r / r_s)
+        dPhi_dr = GM * (log1pu / r**2 - 1 / (r * (r + r_s)))
+        d2Phi_dr2 = GM * (
+            -2 * log1pu / r**3
+            + 1 / (r**2 * (r + r_s))
+            + (2 * r + r_s) / (r * (r + r_s)) ** 2
+        )
+        return dPhi_dr, d2Phi_dr2
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        return radial_gradient(self._dpotential_dr(r, t)[0], q, r)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        return radial_hessian(*self._dpotential_dr(r, t), q, r)
+
     @partial(jax.jit)
     def _density(
         self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
@@ -315,6 +355,49 @@ class GaussLegendreIntegrator(eqx.Module):  # type: ignore[misc]
         return jnp.sum(y * w, axis=0)
 
 
+def _gauss_legendre_integrator(order: int, /) -> GaussLegendreIntegrator:
+    """Gauss-Legendre quadrature of the given order on [0, 1]."""
+    x_, w_ = np.polynomial.legendre.leggauss(order)
+    x, w = jnp.asarray(x_, dtype=float), jnp.asarray(w_, dtype=float)
+    # Interval change from [-1, 1] to [0, 1]
+    return GaussLegendreIntegrator(0.5 * (x + 1), 0.5 * w)
+
+
+def _probe_points() -> Float[Array, "P 3"]:
+    """Points from 1e-3 to 1e2, along 26 directions, to measure errors."""
+    directions = np.asarray(
+        [d for d in itertools.product((-1, 0, 1), repeat=3) if any(d)], dtype=float
+    )
+    directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+    # Rotate slightly off the symmetry planes.
+    directions = directions * np.asarray([1.0, 0.9, 0.8]) + 0.05
+    radii = np.logspace(-3, 2, 21)
+    return jnp.asarray((radii[:, None, None] * directions).reshape(-1, 3))
+
+
+def _octant_monomials(
+    y2: Float[Array, "*batch"], z2: Float[Array, "*batch"], l_max: int, /
+) -> Float[Array, "*batch T"]:
+    r"""Angular basis of the tabulated triaxial potential.
+
+    Functions on the sphere that are symmetric under reflection in the three
+    principal planes, with harmonics up to (even) degree ``l_max``, are the
+    polynomials of degree :math:`\leq l_\mathrm{max}/2` in :math:`\hat{y}^2`
+    and :math:`\hat{z}^2` (:math:`\hat{x}^2 = 1 - \hat{y}^2 - \hat{z}^2`). The
+    monomials :math:`\hat{y}^{2a} \hat{z}^{2b}` are cheaper to evaluate than
+    the harmonics.
+    """
+    deg = l_max // 2
+    ypow, zpow = [jnp.ones_like(y2)], [jnp.ones_like(z2)]
+    for _ in range(deg):
+        ypow.append(ypow[-1] * y2)
+        zpow.append(zpow[-1] * z2)
+    return jnp.stack(
+        [ypow[a] * zpow[b] for a in range(deg + 1) for b in range(deg + 1 - a)],
+        axis=-1,
+    )
+
+
 @final
 class TriaxialNFWPotential(AbstractSinglePotential):
     r"""Triaxial (density) NFW Potential.
@@ -328,6 +411,32 @@ class TriaxialNFWPotential(AbstractSinglePotential):
     .. math::
 
         \xi^2 = x^2 + \frac{y^2}{q_1^2} + \frac{z^2}{q_2^2}
+
+    The potential is an integral over ellipsoidal shells, computed with a
+    Gauss-Legendre quadrature. Its order can be chosen to meet a tolerance with
+    ``integration_rtol``, and with ``tabulate=True`` the potential is instead
+    interpolated from a table built once at construction.
+
+    Examples
+    --------
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> pot = gp.TriaxialNFWPotential(m=1e12, r_s=15, q1=0.8, q2=0.6,
+    ...                               units="galactic", integration_rtol=1e-10)
+    >>> pot.integration_order
+    64
+
+    >>> tab = gp.TriaxialNFWPotential(m=1e12, r_s=15, q1=0.8, q2=0.6,
+    ...                               units="galactic", tabulate=True)
+    >>> tab.error_report["table_max"] < 1e-6
+    True
+
+    >>> q = u.Quantity([10.0, 5, 3], "kpc")
+    >>> t = u.Quantity(0, "Gyr")
+    >>> bool(abs(tab.potential(q, t) / pot.potential(q, t) - 1) < 1e-6)
+    True
+
     """
 
     m: AbstractParameter = ParameterField(dimensions="mass")  # type: ignore[assignment]
@@ -357,16 +466,70 @@ class TriaxialNFWPotential(AbstractSinglePotential):
 
     See :func:`numpy.polynomial.legendre.leggauss` for details.
     """
+
+    integration_rtol: float | None = eqx.field(default=None, static=True)
+    """Target relative error of the quadrature, to choose its order adaptively.
+
+    If given, ``integration_order`` is replaced by the smallest order in 8, 16,
+    32, ..., 1024 whose relative error is below ``integration_rtol``. The error
+    of order :math:`n` is estimated by comparing with order :math:`2n` at probe
+    points between :math:`10^{-3}` and :math:`10^2` scale radii, and is saved in
+    ``error_report["integration"]``. This requires concrete parameter values.
+    """
+
+    tabulate: bool = eqx.field(default=False, static=True)
+    r"""Whether to precompute the potential in a table.
+
+    The dimensionless potential :math:`\Phi r_s / (G m)` depends only on
+    :math:`q / r_s` and the axis ratios. With ``tabulate=True`` it is computed
+    once with the quadrature, expanded in real spherical harmonics up to
+    ``table_l_max`` (only even :math:`l` and :math:`m` are allowed by the
+    symmetry) and each radial coefficient is stored as a natural cubic spline in
+    :math:`\ln(r/r_s)`. Evaluations then cost a spline lookup and one set of
+    harmonics instead of ``integration_order`` evaluations of the integrand,
+    and stay smooth for the gradient and Hessian. ``m`` and ``r_s`` may still
+    vary with time, but ``q1`` and ``q2`` must be constant. The error of the
+    table against the quadrature is saved in ``error_report``.
+    """
+
+    table_l_max: int = eqx.field(default=12, static=True)
+    """Maximum harmonic degree of the table."""
+
+    table_n_r: int = eqx.field(default=256, static=True)
+    """Number of radial knots of the table."""
+
+    table_r_range: tuple[float, float] = eqx.field(default=(1e-4, 1e4), static=True)
+    """Radial range of the table, in units of ``r_s``.
+
+    Outside this range the radius is clamped to the nearest end.
+    """
+
+    error_report: ImmutableMap[str, float] = eqx.field(
+        default=ImmutableMap(), init=False, static=True
+    )
+    """Estimated relative errors of the adaptive quadrature and the table."""
+
     _integrator: GaussLegendreIntegrator = eqx.field(init=False)
+    _table: Float[Array, "2 R T"] | None = eqx.field(default=None, init=False)
 
     def __post_init__(self) -> None:
-        # Gauss-Legendre quadrature
-        x_, w_ = np.polynomial.legendre.leggauss(self.integration_order)
-        x, w = jnp.asarray(x_, dtype=float), jnp.asarray(w_, dtype=float)
-        # Interval change from [-1, 1] to [0, 1]
-        x = 0.5 * (x + 1)
-        w = 0.5 * w
-        object.__setattr__(self, "_integrator", GaussLegendreIntegrator(x, w))
+        report = {}
+        if self.integration_rtol is not None:
+            order, report["integration"] = self._adaptive_order()
+            object.__setattr__(self, "integration_order", order)
+        integrator = _gauss_legendre_integrator(self.integration_order)
+        object.__setattr__(self, "_integrator", integrator)
+
+        if self.tabulate:
+            if not all(isinstance(p, ConstantParameter) for p in (self.q1, self.q2)):
+                msg = "tabulate=True requires constant q1 and q2."
+                raise ValueError(msg)
+            object.__setattr__(self, "_table", self._build_table())
+            err = self._table_error()
+            report["table_max"] = float(np.max(err))
+            report["table_median"] = float(np.median(err))
+
+        object.__setattr__(self, "error_report", ImmutableMap(report))
 
     # ==========================================================================
 
@@ -411,6 +574,17 @@ class TriaxialNFWPotential(AbstractSinglePotential):
         q: gt.BtQuSz3,
         t: gt.BBtRealQuSz0,
         /,
+    ) -> gt.SpecificEnergyBtSz0:
+        if self.tabulate:
+            return self._tabulated_potential(q, t)
+        return self._quadrature_potential(q, t, self._integrator)
+
+    def _quadrature_potential(
+        self,
+        q: gt.BtQuSz3,
+        t: gt.BBtRealQuSz0,
+        integrator: GaussLegendreIntegrator,
+        /,
     ) -> gt.SpecificEnergyBtSz0:
         r"""Potential energy for the triaxial NFW.
 
@@ -491,13 +665,103 @@ class TriaxialNFWPotential(AbstractSinglePotential):
             denom = jnp.sqrt(((q1sq - 1) * s2 + 1) * ((q2sq - 1) * s2 + 1))
             return delta_psi_factor(s2) / denom
 
-        # TODO: option to do integrate.quad
-        integral = self._integrator(integrand)
+        integral = integrator(integrand)
 
         return (
             -2.0 * jnp.pi * self.constants["G"] * rho0 * r_s**2 * q1 * q2
         ) * integral
 
+    def _tabulated_potential(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> gt.SpecificEnergyBtSz0:
+        """Potential energy from the precomputed table."""
+        m, r_s = self.m(t), self.r_s(t)
+        coeffs, second_derivs = self._table
+
+        r2 = jnp.sum(q**2, axis=-1)
+        s2 = u.ustrip("", r2 / r_s**2)
+        y2, z2 = u.ustrip("", q[..., 1] ** 2 / r2), u.ustrip("", q[..., 2] ** 2 / r2)
+
+        # Natural cubic spline in ln(r / r_s) on a uniform grid.
+        lo, hi = np.log(self.table_r_range)
+        h = (hi - lo) / (self.table_n_r - 1)
+        x = (jnp.clip(0.5 * jnp.log(s2), lo, hi) - lo) / h
+        i = jnp.clip(jnp.floor(x).astype(int), 0, self.table_n_r - 2)
+        b = (x - i)[..., None]
+        a = 1 - b
+        c = a * coeffs[i] + b * coeffs[i + 1]
+        c = c + ((a**3 - a) * second_derivs[i] + (b**3 - b) * second_derivs[i + 1]) * (
+            h**2 / 6
+        )
+
+        summation = jnp.sum(c * _octant_monomials(y2, z2, self.table_l_max), axis=-1)
+        return self.constants["G"] * m / r_s * summation
+
+    # --------------------------------------------------------------------------
+    # Construction-time helpers
+
+    def _dimensionless_potential(
+        self, x: Float[Array, "*batch 3"], integrator: GaussLegendreIntegrator, /
+    ) -> Float[Array, "*batch"]:
+        """Quadrature potential in units of ``G m / r_s`` at ``q = x r_s``."""
+        t = u.Quantity(0.0, self.units["time"])
+        m, r_s = self.m(t), self.r_s(t)
+        phi = self._quadrature_potential(x * r_s, t, integrator)
+        return u.ustrip("", phi * r_s / (self.constants["G"] * m))
+
+    def _adaptive_order(self) -> tuple[int, float]:
+        """Smallest quadrature order meeting ``integration_rtol``."""
+        x = _probe_points()
+        prev = self._dimensionless_potential(x, _gauss_legendre_integrator(8))
+        for order in (16, 32, 64, 128, 256, 512, 1024):
+            phi = self._dimensionless_potential(x, _gauss_legendre_integrator(order))
+            err = float(jnp.max(jnp.abs(prev / phi - 1)))
+            if err < self.integration_rtol:
+                break
+            prev = phi
+        return order // 2, err
+
+    def _build_table(self) -> Float[Array, "2 R T"]:
+        """Angular coefficients and their spline second derivatives."""
+        n_ang = 2 * (self.table_l_max + 1)
+
+        # Angular quadrature: Gauss-Legendre in cos(theta), trapezoid in phi.
+        # It is exact for the products of the basis functions.
+        mu, w_mu = np.polynomial.legendre.leggauss(n_ang)
+        phi = 2 * np.pi * np.arange(n_ang) / n_ang
+        theta, phi = np.meshgrid(np.arccos(mu), phi, indexing="ij")
+        direction = np.stack(
+            [np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)],
+            axis=-1,
+        ).reshape(-1, 3)
+        sqrt_w = np.sqrt(np.repeat(w_mu, n_ang) * (2 * np.pi / n_ang))
+        basis = np.asarray(
+            _octant_monomials(
+                jnp.asarray(direction[:, 1] ** 2),
+                jnp.asarray(direction[:, 2] ** 2),
+                self.table_l_max,
+            )
+        )
+
+        # Potential on the (r, theta, phi) grid, projected on the basis.
+        lnr = np.linspace(*np.log(self.table_r_range), self.table_n_r)
+        x = np.exp(lnr)[:, None, None] * direction
+        pot = np.asarray(
+            self._dimensionless_potential(jnp.asarray(x), self._integrator)
+        )
+        coeffs = np.linalg.lstsq(basis * sqrt_w[:, None], (pot * sqrt_w).T)[0].T
+        coeffs = jnp.asarray(coeffs)
+
+        second_derivs = _natural_spline_second_derivs(jnp.asarray(lnr), coeffs)
+        return jnp.stack([coeffs, second_derivs])
+
+    def _table_error(self) -> Float[Array, "P"]:
+        """Relative error of the table against the quadrature at probe points."""
+        t = u.Quantity(0.0, self.units["time"])
+        q = _probe_points() * self.r_s(t)
+        expect = self._quadrature_potential(q, t, self._integrator)
+        return u.ustrip("", jnp.abs(self._tabulated_potential(q, t) / expect - 1))
+
     # ==========================================================================
 
     @partial(jax.jit)
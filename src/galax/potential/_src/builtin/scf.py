@@ -0,0 +1,505 @@
+"""Self-consistent field (basis function expansion) potential."""
+
+__all__ = ["SCFPotential"]
+
+import math
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import KW_ONLY
+from functools import partial
+from typing import final
+
+import jax
+import numpy as np
+from equinox import field
+from jaxtyping import Array, ArrayLike, Float
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.typing as gt
+from .multipole import cartesian_to_normalized_spherical, compute_Ylm
+from galax.potential._src.base import AbstractPotential
+from galax.potential._src.base_single import AbstractSinglePotential
+from galax.potential._src.params.core import AbstractParameter
+from galax.potential._src.params.field import ParameterField
+
+
+@final
+class SCFPotential(AbstractSinglePotential):
+    r"""Hernquist & Ostriker (1992) basis function expansion potential.
+
+    The potential is expanded in the biorthogonal basis of Hernquist & Ostriker
+    (1992), whose lowest order term is the Hernquist potential:
+
+    .. math::
+
+        \Phi(r,\theta,\phi) = \frac{G M}{r_s}
+            \sum_{n=0}^{n_\mathrm{max}} \sum_{l=0}^{l_\mathrm{max}}
+            \sum_{m=0}^{l} \Phi_{nl}(s) \, \bar{P}_l^m(\cos\theta)
+            \, (S_{nlm} \cos{m\phi} + T_{nlm} \sin{m\phi}),
+
+        \Phi_{nl}(s) = -\frac{s^l}{(1+s)^{2l+1}}
+            \, C_n^{(2l+3/2)}\!\left(\frac{s-1}{s+1}\right),
+
+    with :math:`s = r / r_s`, :math:`C_n^{(\alpha)}` the Gegenbauer polynomials
+    and :math:`\bar{P}_l^m` the orthonormalized associated Legendre functions.
+    The density has the same expansion with the radial functions
+
+    .. math::
+
+        \rho_{nl}(s) = \frac{K_{nl}}{2\pi} \frac{s^l}{s (1+s)^{2l+3}}
+            \, C_n^{(2l+3/2)}\!\left(\frac{s-1}{s+1}\right),
+        \qquad K_{nl} = \tfrac{1}{2} n (n + 4l + 3) + (l + 1)(2l + 1),
+
+    in units of :math:`M / r_s^3`, so the density is evaluated in closed form.
+    All radial and angular functions are built with recurrences in a single
+    pass for all :math:`(n, l, m)`.
+
+    The coefficients can be fit to an N-body snapshot with
+    :meth:`~galax.potential.SCFPotential.from_particles` or to a density with
+    :meth:`~galax.potential.SCFPotential.from_density`.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    The lowest order term is a Hernquist potential:
+
+    >>> Snlm = jnp.zeros((3, 3, 3)).at[0, 0, 0].set(jnp.sqrt(4 * jnp.pi))
+    >>> pot = gp.SCFPotential(m_tot=u.Quantity(1e12, "Msun"),
+    ...                       r_s=u.Quantity(10, "kpc"), Snlm=Snlm,
+    ...                       Tnlm=jnp.zeros((3, 3, 3)), n_max=2, l_max=2,
+    ...                       units="galactic")
+
+    >>> hern = gp.HernquistPotential(m_tot=u.Quantity(1e12, "Msun"),
+    ...                              r_s=u.Quantity(10, "kpc"), units="galactic")
+    >>> q = u.Quantity([1.0, 2, 3], "kpc")
+    >>> bool(jnp.isclose(pot.potential(q, 0).value, hern.potential(q, 0).value))
+    True
+
+    """
+
+    m_tot: AbstractParameter = ParameterField(dimensions="mass")  # type: ignore[assignment]
+    """Mass scale of the expansion."""
+
+    r_s: AbstractParameter = ParameterField(dimensions="length")  # type: ignore[assignment]
+    """Scale radius."""
+
+    Snlm: AbstractParameter = ParameterField(dimensions="dimensionless")  # type: ignore[assignment]
+    r"""Expansion coefficients for the $\cos(m \phi)$ terms."""
+
+    Tnlm: AbstractParameter = ParameterField(dimensions="dimensionless")  # type: ignore[assignment]
+    r"""Expansion coefficients for the $\sin(m \phi)$ terms."""
+
+    _: KW_ONLY
+    n_max: int = field(static=True)
+    l_max: int = field(static=True)
+
+    def __check_init__(self) -> None:
+        shape = (self.n_max + 1, self.l_max + 1, self.l_max + 1)
+        t = u.Quantity(0.0, "Gyr")
+        s_shape, t_shape = self.Snlm(t).shape, self.Tnlm(t).shape
+        # TODO: check shape across time.
+        if s_shape != shape or t_shape != shape:
+            msg = (
+                "Snlm and Tnlm must have the shape (n_max + 1, l_max + 1, l_max + 1)."
+                f"Snlm shape: {s_shape}, Tnlm shape: {t_shape}"
+            )
+            raise ValueError(msg)
+
+    # ==========================================================================
+    # Constructors
+
+    @classmethod
+    def from_particles(
+        cls,
+        q: u.Quantity["length"] | ArrayLike,
+        m: u.Quantity["mass"] | ArrayLike,
+        /,
+        *,
+        n_max: int,
+        l_max: int,
+        r_s: u.Quantity["length"] | ArrayLike,
+        units: u.AbstractUnitSystem | str,
+        chunk_size: int = 2**14,
+    ) -> "SCFPotential":
+        r"""Fit the expansion to a set of particles.
+
+        By biorthogonality, the coefficients are sums over the particles,
+
+        .. math::
+
+            S_{nlm} = \frac{\epsilon_m}{I_{nl}} \sum_k \frac{m_k}{M}
+                \Phi_{nl}(s_k) \bar{P}_l^m(\cos\theta_k) \cos{m\phi_k},
+
+        and likewise for :math:`T_{nlm}` with :math:`\sin{m\phi_k}`, where
+        :math:`M = \sum_k m_k`, :math:`\epsilon_0 = 1, \epsilon_{m>0} = 2`, and
+        :math:`I_{nl} = \int_0^\infty s^2 \Phi_{nl} \rho_{nl} \, ds`.
+
+        The particles are processed in chunks of ``chunk_size``, so the cost is
+        :math:`O(N \, n_\mathrm{max} l_\mathrm{max}^2)` in time and
+        :math:`O(\mathrm{chunk} \, n_\mathrm{max} l_\mathrm{max}^2)` in memory.
+        Only one chunk at a time is moved to the device, so host (NumPy) arrays
+        larger than the device memory can be used.
+
+        Parameters
+        ----------
+        q : Quantity[float, (N, 3), "length"] | Array[float, (N, 3)]
+            Particle positions. Arrays are interpreted in the length unit of
+            ``units``.
+        m : Quantity[float, (N,), "mass"] | Array[float, (N,)]
+            Particle masses. Arrays are interpreted in the mass unit of
+            ``units``.
+        n_max, l_max : int
+            The maximum radial order and degree of the expansion.
+        r_s : Quantity[float, (), "length"] | Array[float, ()]
+            The scale radius of the expansion.
+        units : `unxt.AbstractUnitSystem` | str
+            The unit system of the potential.
+        chunk_size : int, optional
+            The number of particles processed at once.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import unxt as u
+        >>> import galax.potential as gp
+
+        Sample a Hernquist sphere with :math:`M(<r) \propto r^2 / (r + a)^2`:
+
+        >>> rng = np.random.default_rng(0)
+        >>> x = np.sqrt(rng.uniform(size=20_000))
+        >>> r = 2 * x / (1 - x)
+        >>> d = rng.normal(size=(20_000, 3))
+        >>> q = u.Quantity(r[:, None] * d / np.linalg.norm(d, axis=1)[:, None], "kpc")
+        >>> m = u.Quantity(np.full(20_000, 5e7), "Msun")
+
+        >>> pot = gp.SCFPotential.from_particles(
+        ...     q, m, n_max=4, l_max=2, r_s=u.Quantity(2, "kpc"), units="galactic")
+
+        The leading coefficient is that of a Hernquist sphere, up to shot noise:
+
+        >>> bool(abs(pot.Snlm(0)[0, 0, 0] / np.sqrt(4 * np.pi) - 1) < 0.02)
+        True
+
+        """
+        usys = u.unitsystem(units)
+        ulen, umass = usys["length"], usys["mass"]
+        r_s_val = _strip(r_s, ulen)
+
+        n = len(q)
+        if q.shape != (n, 3) or m.shape != (n,):
+            msg = f"q must have shape (N, 3) and m (N,), got {q.shape}, {m.shape}."
+            raise ValueError(msg)
+
+        def chunks() -> Iterator[tuple[Array, Array]]:
+            for i in range(0, n, chunk_size):
+                q_i = jnp.asarray(_strip(q[i : i + chunk_size], ulen), dtype=float)
+                m_i = jnp.asarray(_strip(m[i : i + chunk_size], umass), dtype=float)
+                yield q_i / r_s_val, m_i
+
+        moments, m_tot = _accumulate(
+            chunks(), n_max=n_max, l_max=l_max, chunk_size=min(n, chunk_size)
+        )
+        return cls._from_moments(moments, m_tot, r_s_val, usys, n_max=n_max)
+
+    @classmethod
+    def from_density(
+        cls,
+        density: AbstractPotential | Callable[[u.Quantity], u.Quantity],
+        /,
+        *,
+        n_max: int,
+        l_max: int,
+        r_s: u.Quantity["length"] | ArrayLike,
+        units: u.AbstractUnitSystem | str,
+        t: u.Quantity["time"] | None = None,
+        n_r: int = 64,
+        n_theta: int | None = None,
+        n_phi: int | None = None,
+        chunk_size: int = 2**14,
+    ) -> "SCFPotential":
+        r"""Fit the expansion to a density.
+
+        The projection integrals of
+        :meth:`~galax.potential.SCFPotential.from_particles` are evaluated by
+        quadrature: Gauss-Legendre in :math:`\xi = (s - 1) / (s + 1)` and in
+        :math:`\cos\theta`, and the trapezoid rule (exact for trigonometric
+        polynomials) in :math:`\phi`. The density is evaluated in batches of
+        ``chunk_size`` quadrature nodes.
+
+        Parameters
+        ----------
+        density : `galax.potential.AbstractPotential` | callable
+            The density to expand: either a potential, whose density is used,
+            or a function of the position ``Quantity[float, (N, 3), "length"]``
+            returning a ``Quantity[float, (N,), "mass density"]``.
+        n_max, l_max : int
+            The maximum radial order and degree of the expansion.
+        r_s : Quantity[float, (), "length"] | Array[float, ()]
+            The scale radius of the expansion.
+        units : `unxt.AbstractUnitSystem` | str
+            The unit system of the potential.
+        t : Quantity[float, (), "time"] | None, optional
+            The time at which to evaluate the density of a potential. Defaults
+            to 0.
+        n_r : int, optional
+            The number of radial quadrature nodes.
+        n_theta, n_phi : int | None, optional
+            The number of polar and azimuthal quadrature nodes. Default to
+            ``2 * l_max + 8``, enough to resolve densities with harmonics up to
+            about twice ``l_max``.
+        chunk_size : int, optional
+            The number of quadrature nodes evaluated at once.
+
+        Examples
+        --------
+        >>> import jax.numpy as jnp
+        >>> import unxt as u
+        >>> import galax.potential as gp
+
+        >>> hern = gp.HernquistPotential(m_tot=u.Quantity(1e12, "Msun"),
+        ...                              r_s=u.Quantity(10, "kpc"), units="galactic")
+        >>> pot = gp.SCFPotential.from_density(
+        ...     hern, n_max=2, l_max=2, r_s=u.Quantity(10, "kpc"), units="galactic")
+
+        >>> q = u.Quantity([1.0, 2, 3], "kpc")
+        >>> bool(jnp.isclose(pot.potential(q, 0).value, hern.potential(q, 0).value))
+        True
+
+        """
+        usys = u.unitsystem(units)
+        ulen = usys["length"]
+        r_s_val = _strip(r_s, ulen)
+        n_theta = 2 * l_max + 8 if n_theta is None else n_theta
+        n_phi = 2 * l_max + 8 if n_phi is None else n_phi
+
+        if isinstance(density, AbstractPotential):
+            t = u.Quantity(0.0, usys["time"]) if t is None else t
+            pot = density
+            density = lambda q: pot.density(q, t)  # noqa: E731
+
+        # Quadrature nodes (in units of r_s) and volume weights (in r_s^3).
+        xi, w_xi = np.polynomial.legendre.leggauss(n_r)
+        s = (1 + xi) / (1 - xi)
+        w_s = w_xi * 2 / (1 - xi) ** 2 * s**2
+        mu, w_mu = np.polynomial.legendre.leggauss(n_theta)
+        phi = 2 * np.pi * np.arange(n_phi) / n_phi
+        w_phi = np.full(n_phi, 2 * np.pi / n_phi)
+
+        s, mu, phi = (v.ravel() for v in np.meshgrid(s, mu, phi, indexing="ij"))
+        weights = np.einsum("i,j,k->ijk", w_s, w_mu, w_phi).ravel()
+        sin_theta = np.sqrt(1 - mu**2)
+        nodes = np.stack(
+            [s * sin_theta * np.cos(phi), s * sin_theta * np.sin(phi), s * mu],
+            axis=-1,
+        )
+        rho_unit = usys["mass density"]
+
+        def chunks() -> Iterator[tuple[Array, Array]]:
+            for i in range(0, len(weights), chunk_size):
+                s_i = jnp.asarray(nodes[i : i + chunk_size])
+                rho = u.ustrip(rho_unit, density(u.Quantity(s_i * r_s_val, ulen)))
+                yield s_i, rho * weights[i : i + chunk_size] * r_s_val**3
+
+        moments, m_tot = _accumulate(
+            chunks(),
+            n_max=n_max,
+            l_max=l_max,
+            chunk_size=min(len(weights), chunk_size),
+        )
+        return cls._from_moments(moments, m_tot, r_s_val, usys, n_max=n_max)
+
+    @classmethod
+    def _from_moments(
+        cls,
+        moments: Float[Array, "2 n l m"],
+        m_tot: gt.FloatSz0,
+        r_s: gt.FloatSz0,
+        usys: u.AbstractUnitSystem,
+        /,
+        *,
+        n_max: int,
+    ) -> "SCFPotential":
+        """Normalize the projection integrals into expansion coefficients."""
+        l_max = moments.shape[-1] - 1
+        eps = np.where(np.arange(l_max + 1) == 0, 1.0, 2.0)
+        Snlm, Tnlm = moments * eps / _radial_norm(n_max, l_max)[..., None] / m_tot
+        return cls(
+            m_tot=u.Quantity(m_tot, usys["mass"]),
+            r_s=u.Quantity(r_s, usys["length"]),
+            Snlm=Snlm,
+            Tnlm=Tnlm,
+            n_max=n_max,
+            l_max=l_max,
+            units=usys,
+        )
+
+    # ==========================================================================
+
+    @partial(jax.jit, inline=True)
+    def _potential(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        # Compute the parameters
+        m_tot, r_s = self.m_tot(t), self.r_s(t)
+        Snlm, Tnlm = self.Snlm(t).value, self.Tnlm(t).value
+
+        # spherical coordinates
+        is_scalar = q.ndim == 1
+        s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(q), r_s)
+
+        # Compute the summation over n, l and m
+        cPlm, sPlm = compute_Ylm(theta, phi, l_max=self.l_max)
+        Phi_nl = scf_radial_basis(s, n_max=self.n_max, l_max=self.l_max)[0]
+        summation = jnp.einsum("...nl,nlm,...lm->...", Phi_nl, Snlm, cPlm)
+        summation = summation + jnp.einsum("...nl,nlm,...lm->...", Phi_nl, Tnlm, sPlm)
+        if is_scalar:
+            summation = summation[0]
+
+        return self.constants["G"] * m_tot / r_s * summation
+
+    @partial(jax.jit, inline=True)
+    def _density(
+        self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
+    ) -> gt.BtFloatQuSz0:
+        # Compute the parameters
+        m_tot, r_s = self.m_tot(t), self.r_s(t)
+        Snlm, Tnlm = self.Snlm(t).value, self.Tnlm(t).value
+
+        # spherical coordinates
+        is_scalar = q.ndim == 1
+        s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(q), r_s)
+
+        # Compute the summation over n, l and m
+        cPlm, sPlm = compute_Ylm(theta, phi, l_max=self.l_max)
+        rho_nl = scf_radial_basis(s, n_max=self.n_max, l_max=self.l_max)[1]
+        summation = jnp.einsum("...nl,nlm,...lm->...", rho_nl, Snlm, cPlm)
+        summation = summation + jnp.einsum("...nl,nlm,...lm->...", rho_nl, Tnlm, sPlm)
+        if is_scalar:
+            summation = summation[0]
+
+        return m_tot / r_s**3 * summation
+
+
+# ===== Helper functions =====
+
+
+def scf_radial_basis(
+    s: Float[Array, "*batch"], /, *, n_max: int, l_max: int
+) -> tuple[Float[Array, "*batch n l"], Float[Array, "*batch n l"]]:
+    r"""Hernquist-Ostriker radial potential and density basis functions.
+
+    The Gegenbauer polynomials :math:`C_n^{(2l+3/2)}(\xi)` are computed for all
+    :math:`n \leq n_\mathrm{max}` and :math:`l \leq l_\mathrm{max}` in one
+    sweep over :math:`n` with the three-term recurrence
+
+    .. math::
+
+        n C_n^{(\alpha)}(\xi) = 2 (n + \alpha - 1) \, \xi \, C_{n-1}^{(\alpha)}(\xi)
+            - (n + 2\alpha - 2) \, C_{n-2}^{(\alpha)}(\xi).
+
+    Parameters
+    ----------
+    s : Array[float, (*batch,)]
+        Radius in units of the scale radius.
+    n_max, l_max : int
+        The maximum radial order and degree.
+
+    Returns
+    -------
+    Phi_nl, rho_nl : Array[float, (*batch, n_max + 1, l_max + 1)]
+        :math:`\Phi_{nl}(s)` and :math:`\rho_{nl}(s)`, indexed by
+        ``[..., n, l]``.
+    """
+    ls = np.arange(l_max + 1)
+    alpha = 2 * ls + 1.5
+    xi = ((s - 1) / (s + 1))[..., None]
+
+    def step(
+        carry: tuple[Float[Array, "*batch l"], Float[Array, "*batch l"]],
+        n: Float[Array, ""],
+    ) -> tuple[tuple[Float[Array, "*batch l"], Float[Array, "*batch l"]], Array]:
+        c1, c2 = carry  # C_{n-1}, C_{n-2}
+        c = (2 * (n + alpha - 1) * xi * c1 - (n + 2 * alpha - 2) * c2) / n
+        return (c, c1), c
+
+    c0 = jnp.ones_like(xi * alpha)
+    _, cn = jax.lax.scan(
+        step, (c0, jnp.zeros_like(c0)), np.arange(1, n_max + 1, dtype=float)
+    )
+    Cnl = jnp.moveaxis(jnp.concat([c0[None], cn], axis=0), 0, -2)
+
+    ns = np.arange(n_max + 1)[:, None]
+    Knl = 0.5 * ns * (ns + 4 * ls + 3) + (ls + 1) * (2 * ls + 1)
+    s_ = s[..., None, None]
+    Phi_nl = -(s_**ls) / (1 + s_) ** (2 * ls + 1) * Cnl
+    rho_nl = Knl / (2 * np.pi) * s_ ** (ls - 1) / (1 + s_) ** (2 * ls + 3) * Cnl
+    return Phi_nl, rho_nl
+
+
+def _radial_norm(n_max: int, l_max: int, /) -> Float[np.ndarray, "n l"]:
+    r"""Return the basis normalization :math:`\int_0^\infty s^2 \Phi_{nl} \rho_{nl} ds`.
+
+    .. math::
+
+        I_{nl} = -\frac{K_{nl}}{2^{8l+6}}
+            \frac{\Gamma(n + 4l + 3)}{n! \, (n + 2l + 3/2) \, \Gamma(2l + 3/2)^2}
+    """
+    ns, ls = np.arange(n_max + 1)[:, None], np.arange(l_max + 1)[None, :]
+    Knl = 0.5 * ns * (ns + 4 * ls + 3) + (ls + 1) * (2 * ls + 1)
+    lgamma = np.vectorize(math.lgamma)
+    log_ratio = (
+        lgamma(ns + 4 * ls + 3)
+        - lgamma(ns + 1)
+        - 2 * lgamma(2 * ls + 1.5)
+        - (8 * ls + 6) * np.log(2)
+    )
+    return -Knl * np.exp(log_ratio) / (ns + 2 * ls + 1.5)
+
+
+@partial(jax.jit, static_argnames=("n_max", "l_max"))
+def _scf_moments(
+    s: Float[Array, "N 3"], m: Float[Array, "N"], /, *, n_max: int, l_max: int
+) -> Float[Array, "2 n l m"]:
+    r"""Unnormalized projections of point masses onto the SCF basis.
+
+    ``s`` are positions in units of the scale radius. Returns the sums
+    :math:`\sum_k m_k \Phi_{nl}(s_k) \bar{P}_l^m \{\cos, \sin\}(m\phi_k)`.
+    """
+    r = jnp.linalg.vector_norm(s, axis=-1)
+    theta = jnp.acos(s[:, 2] / jnp.where(r > 0, r, 1.0))
+    phi = jnp.atan2(s[:, 1], s[:, 0])
+    cPlm, sPlm = compute_Ylm(theta, phi, l_max=l_max)
+    Phi_nl = scf_radial_basis(r, n_max=n_max, l_max=l_max)[0] * m[:, None, None]
+    contract = partial(jnp.einsum, "knl,klm->nlm")
+    return jnp.stack([contract(Phi_nl, cPlm), contract(Phi_nl, sPlm)])
+
+
+def _accumulate(
+    chunks: Iterable[tuple[Array, Array]],
+    /,
+    *,
+    n_max: int,
+    l_max: int,
+    chunk_size: int,
+) -> tuple[Float[Array, "2 n l m"], gt.FloatSz0]:
+    """Sum the SCF projections and the mass over chunks of point masses.
+
+    Chunks shorter than ``chunk_size`` are padded with massless particles so the
+    kernel compiles only once.
+    """
+    moments = jnp.zeros((2, n_max + 1, l_max + 1, l_max + 1))
+    m_tot = 0.0
+    for s_i, m_i in chunks:
+        pad = chunk_size - len(m_i)
+        s_pad = jnp.pad(s_i, ((0, pad), (0, 0)), constant_values=1.0)
+        m_pad = jnp.pad(m_i, (0, pad))
+        moments = moments + _scf_moments(s_pad, m_pad, n_max=n_max, l_max=l_max)
+        m_tot = m_tot + jnp.sum(m_i)
+    return moments, m_tot
+
+
+def _strip(v: u.AbstractQuantity | ArrayLike, unit: gt.Unit, /) -> ArrayLike:
+    """Strip the units of a quantity, passing through arrays."""
+    return u.ustrip(unit, v) if isinstance(v, u.AbstractQuantity) else v
@@ -29,10 +29,12 @@ from xmmutablemap import ImmutableMap
 
 import galax.typing as gt
 from .const import _burkert_const
+from .utils import radial_gradient, radial_hessian
 from galax.potential._src.base import default_constants
 from galax.potential._src.base_single import AbstractSinglePotential
 from galax.potential._src.params.core import AbstractParameter
 from galax.potential._src.params.field import ParameterField
+from galax.utils._jax import vectorize_method
 
 # -------------------------------------------------------------------
 
@@ -77,6 +79,22 @@ class BurkertPotential(AbstractSinglePotential):
             - (1 - xinv) * jnp.log(1 + x**2)
         )
 
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        dPhi_dr = self.constants["G"] * self._mass(q, t) / r**2
+        return radial_gradient(dPhi_dr, q, r)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        G = self.constants["G"]
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        dPhi_dr = G * self._mass(q, t) / r**2
+        d2Phi_dr2 = 4 * jnp.pi * G * self._density(q, t) - 2 * dPhi_dr / r
+        return radial_hessian(dPhi_dr, d2Phi_dr2, q, r)
+
     @partial(jax.jit, inline=True)
     def _density(
         self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
@@ -93,7 +111,7 @@ class BurkertPotential(AbstractSinglePotential):
         return (
             self.m(t)
             / _burkert_const
-            * (-2 * jnp.atan(x) + 2 * jnp.log(1 + x) + jnp.log(1 + x**2))
+            * (-2 * jnp.atan(x).value + 2 * jnp.log(1 + x) + jnp.log(1 + x**2))
         )
 
     # -------------------------------------------------------------------
@@ -177,6 +195,20 @@ class HernquistPotential(AbstractSinglePotential):
         r = jnp.linalg.vector_norm(q, axis=-1)
         return -self.constants["G"] * self.m_tot(t) / (r + self.r_s(t))
 
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        dPhi_dr = self.constants["G"] * self.m_tot(t) / (r + self.r_s(t)) ** 2
+        return radial_gradient(dPhi_dr, q, r)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        GM, rpa = self.constants["G"] * self.m_tot(t), r + self.r_s(t)
+        return radial_hessian(GM / rpa**2, -2 * GM / rpa**3, q, r)
+
     @partial(jax.jit, inline=True)
     def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
         r_s = self.r_s(t)
@@ -222,6 +254,32 @@ class IsochronePotential(AbstractSinglePotential):
         b = self.b(t)
         return -self.constants["G"] * self.m_tot(t) / (b + jnp.sqrt(r**2 + b**2))
 
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        b = self.b(t)
+        s = jnp.sqrt(jnp.sum(q**2, axis=-1) + b**2)
+        return self.constants["G"] * self.m_tot(t) * q / (s * (b + s) ** 2)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        b = self.b(t)
+        s = jnp.sqrt(jnp.sum(q**2, axis=-1) + b**2)
+        GM = self.constants["G"] * self.m_tot(t)
+        # grad = f0(r) q, so the Hessian is f0 I + (f0'(r) / r) q q^T
+        f0 = GM / (s * (b + s) ** 2)
+        f1 = -GM * (1 / (s**3 * (b + s) ** 2) + 2 / (s**2 * (b + s) ** 3))
+        return f0 * jnp.eye(3) + f1 * jnp.outer(q, q)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        r2 = jnp.sum(q**2, axis=-1)
+        b = self.b(t)
+        s = jnp.sqrt(r2 + b**2)
+        num = 3 * (b + s) * s**2 - r2 * (b + 3 * s)
+        return self.m_tot(t) * num / (4 * jnp.pi * (b + s) ** 3 * s**3)
+
 
 # -------------------------------------------------------------------
 
@@ -241,6 +299,28 @@ class JaffePotential(AbstractSinglePotential):
         r_s = self.r_s(t)
         return -self.constants["G"] * self.m(t) / r_s * jnp.log(1 + r_s / r)
 
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        dPhi_dr = self.constants["G"] * self.m(t) / (r * (r + self.r_s(t)))
+        return radial_gradient(dPhi_dr, q, r)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        GM, r_s = self.constants["G"] * self.m(t), self.r_s(t)
+        dPhi_dr = GM / (r * (r + r_s))
+        d2Phi_dr2 = -GM * (2 * r + r_s) / (r * (r + r_s)) ** 2
+        return radial_hessian(dPhi_dr, d2Phi_dr2, q, r)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        r_s = self.r_s(t)
+        return self.m(t) * r_s / (4 * jnp.pi * (r * (r + r_s)) ** 2)
+
 
 # -------------------------------------------------------------------
 
@@ -270,6 +350,19 @@ class KeplerPotential(AbstractSinglePotential):
         r = jnp.linalg.vector_norm(q, axis=-1)
         return -self.constants["G"] * self.m_tot(t) / r
 
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        return radial_gradient(self.constants["G"] * self.m_tot(t) / r**2, q, r)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        GM = self.constants["G"] * self.m_tot(t)
+        return radial_hessian(GM / r**2, -2 * GM / r**3, q, r)
+
     @partial(jax.jit, inline=True)
     def _density(
         self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
@@ -312,6 +405,25 @@ class PlummerPotential(AbstractSinglePotential):
         r2 = jnp.linalg.vector_norm(q, axis=-1) ** 2
         return -self.constants["G"] * self.m_tot(t) / jnp.sqrt(r2 + self.b(t) ** 2)
 
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        d = jnp.sqrt(jnp.sum(q**2, axis=-1) + self.b(t) ** 2)
+        return self.constants["G"] * self.m_tot(t) * q / d**3
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        d = jnp.sqrt(jnp.sum(q**2, axis=-1) + self.b(t) ** 2)
+        GM = self.constants["G"] * self.m_tot(t)
+        return GM / d**3 * jnp.eye(3) - 3 * GM / d**5 * jnp.outer(q, q)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        b = self.b(t)
+        s = jnp.sqrt(1 + jnp.sum(q**2, axis=-1) / b**2)
+        return 3 * self.m_tot(t) / (4 * jnp.pi * b**3) / s**5
+
 
 # -------------------------------------------------------------------
 
@@ -367,6 +479,35 @@ class PowerLawCutoffPotential(AbstractSinglePotential):
             + _safe_gamma_inc(1 - a, rp2) / (r_c * qsp.gamma(1.5 - a))
         )
 
+    @partial(jax.jit, inline=True)
+    def _mass(self, q: gt.BtQuSz3, /, t: gt.BBtRealQuSz0) -> gt.BtFloatQuSz0:
+        a, r_c = 0.5 * self.alpha(t), self.r_c(t)
+        rp2 = jnp.sum(q**2, axis=-1) / r_c**2
+        return self.m_tot(t) * qsp.gammainc(1.5 - a, rp2)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        alpha, r_c = self.alpha(t), self.r_c(t)
+        x = jnp.linalg.vector_norm(q, axis=-1) / r_c
+        A = self.m_tot(t) / (2 * jnp.pi * r_c**3 * qsp.gamma(1.5 - 0.5 * alpha))
+        return A * jnp.pow(u.ustrip("", x), -u.ustrip("", alpha)) * jnp.exp(-(x**2))
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        dPhi_dr = self.constants["G"] * self._mass(q, t) / r**2
+        return radial_gradient(dPhi_dr, q, r)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        G = self.constants["G"]
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        dPhi_dr = G * self._mass(q, t) / r**2
+        d2Phi_dr2 = 4 * jnp.pi * G * self._density(q, t) - 2 * dPhi_dr / r
+        return radial_hessian(dPhi_dr, d2Phi_dr2, q, r)
+
 
 # -------------------------------------------------------------------
 
@@ -413,6 +554,46 @@ class StoneOstriker15Potential(AbstractSinglePotential):
             + 0.5 * jnp.log((r**2 + r_h**2) / (r**2 + r_c**2))
         )
 
+    @partial(jax.jit, inline=True)
+    def _dpotential_dr(
+        self, r: gt.FloatQuSz0, t: gt.RealQuSz0, /
+    ) -> tuple[gt.FloatQuSz0, gt.FloatQuSz0]:
+        """First and second radial derivatives of the potential."""
+        r_h, r_c = self.r_h(t), self.r_c(t)
+        A = -2 * self.constants["G"] * self.m_tot(t) / (jnp.pi * (r_h - r_c))
+        # Note that the 1/r terms from the atan and log pieces cancel.
+        num = r_c * u.ustrip("rad", jnp.atan2(r, r_c)) - r_h * u.ustrip(
+            "rad", jnp.atan2(r, r_h)
+        )
+        dPhi_dr = A * num / r**2
+        d2Phi_dr2 = A * (
+            (r_c**2 / (r**2 + r_c**2) - r_h**2 / (r**2 + r_h**2)) / r**2
+            - 2 * num / r**3
+        )
+        return dPhi_dr, d2Phi_dr2
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        return radial_gradient(self._dpotential_dr(r, t)[0], q, r)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        r = jnp.linalg.vector_norm(q, axis=-1)
+        return radial_hessian(*self._dpotential_dr(r, t), q, r)
+
+    @partial(jax.jit, inline=True)
+    def _density(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtFloatQuSz0:
+        r_h, r_c = self.r_h(t), self.r_c(t)
+        r2 = jnp.sum(q**2, axis=-1)
+        return (
+            self.m_tot(t)
+            * (r_h + r_c)
+            / (2 * jnp.pi**2 * (r2 + r_c**2) * (r2 + r_h**2))
+        )
+
 
 # -------------------------------------------------------------------
 
@@ -498,3 +679,41 @@ class TriaxialHernquistPotential(AbstractSinglePotential):
             q[..., 0] ** 2 + (q[..., 1] / q1) ** 2 + (q[..., 2] / q2) ** 2
         )
         return -self.constants["G"] * self.m_tot(t) / (rprime + r_s)
+
+    @partial(jax.jit, inline=True)
+    def _inv_axes2(self, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        """Inverse squared axis lengths ``(1, 1/q1^2, 1/q2^2)``."""
+        q1, q2 = self.q1(t), self.q2(t)
+        return 1 / jnp.stack([jnp.ones_like(q1), q1**2, q2**2])
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3)")
+    def _gradient(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz3:
+        inv_s2 = self._inv_axes2(t)
+        rprime = jnp.sqrt(jnp.sum(q**2 * inv_s2, axis=-1))
+        drprime = q * inv_s2 / rprime
+        GM = self.constants["G"] * self.m_tot(t)
+        return GM / (rprime + self.r_s(t)) ** 2 * drprime
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->(3,3)")
+    def _hessian(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.QuSz33:
+        inv_s2 = self._inv_axes2(t)
+        rprime = jnp.sqrt(jnp.sum(q**2 * inv_s2, axis=-1))
+        qs = q * inv_s2
+        drprime = qs / rprime
+        d2rprime = jnp.eye(3) * inv_s2 / rprime - jnp.outer(qs, qs) / rprime**3
+        GM, rpa = self.constants["G"] * self.m_tot(t), rprime + self.r_s(t)
+        return GM / rpa**2 * d2rprime - 2 * GM / rpa**3 * jnp.outer(drprime, drprime)
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->()")
+    def _density(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.FloatQuSz0:
+        inv_s2 = self._inv_axes2(t)
+        rprime = jnp.sqrt(jnp.sum(q**2 * inv_s2, axis=-1))
+        qs2 = jnp.sum((q * inv_s2) ** 2, axis=-1)
+        # The trace of the hessian, i.e. the laplacian of the potential.
+        lapl_rprime = jnp.sum(inv_s2) / rprime - qs2 / rprime**3
+        rpa = rprime + self.r_s(t)
+        lapl = lapl_rprime / rpa**2 - 2 * qs2 / (rprime**2 * rpa**3)
+        return self.m_tot(t) / (4 * jnp.pi) * lapl
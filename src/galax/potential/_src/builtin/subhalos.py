@@ -0,0 +1,344 @@
+"""Potential of a population of moving subhalos."""
+
+__all__ = ["SubhaloPopulationPotential"]
+
+import itertools
+from collections.abc import Sequence
+from dataclasses import KW_ONLY
+from functools import partial
+from typing import final
+
+import equinox as eqx
+import jax
+import numpy as np
+from jaxtyping import Array, Bool, Float, Int
+
+import quaxed.numpy as jnp
+import unxt as u
+from unxt.quantity import BareQuantity
+from xmmutablemap import ImmutableMap
+
+import galax.typing as gt
+from galax.potential._src.base import AbstractPotential, default_constants
+from galax.potential._src.base_single import AbstractSinglePotential
+from galax.potential._src.stacked import StackedPotential
+from galax.utils._jax import vectorize_method
+
+# Offsets of the 27 cells in the neighbourhood of a cell.
+_NEIGHBOURS = np.asarray(list(itertools.product((-1, 0, 1), repeat=3)))
+
+
+@final
+class SubhaloPopulationPotential(AbstractSinglePotential):
+    r"""Potential of a large population of subhalos on precomputed orbits.
+
+    Each subhalo is a potential centred on the origin (e.g. a
+    `~galax.potential.PlummerPotential` or `~galax.potential.NFWPotential`),
+    displaced along its own trajectory. The trajectories are tabulated at knot
+    times :math:`t_k` and linearly interpolated in between.
+
+    A flat sum over every subhalo per evaluation is avoided with a uniform grid
+    of cubic cells (a cell list), rebuilt at every knot. For an evaluation at
+    time :math:`t \in [t_k, t_{k+1}]`, the subhalos assigned at :math:`t_k` to
+    the 27 cells around the evaluation point are summed exactly. Every other
+    cell is replaced by a point mass at its centre of mass, moving with the
+    mass-weighted mean velocity of its members (a monopole far field), or
+    dropped if ``far_field=False``. The cost per evaluation is
+    :math:`O(27 \, n_\mathrm{cell}^\mathrm{max} + N_\mathrm{cells})` instead of
+    :math:`O(N_\mathrm{subhalos})`.
+
+    Subhalos closer than ``cell_size`` minus the largest distance a subhalo
+    moves between two knots, which is saved as ``exact_radius``, are always
+    summed exactly. Choose ``cell_size`` a few times larger than the subhalo
+    scale radii.
+
+    Construct it with
+    :meth:`~galax.potential.SubhaloPopulationPotential.from_trajectories`.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import numpy as np
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    A thousand subhalos drifting in a 100 kpc box:
+
+    >>> rng = np.random.default_rng(0)
+    >>> n = 1_000
+    >>> x0 = rng.uniform(-50, 50, size=(n, 3))
+    >>> v = rng.normal(0, 0.1, size=(n, 3))  # kpc / Myr
+    >>> times = u.Quantity([0.0, 10, 20], "Myr")
+    >>> orbits = u.Quantity(x0[:, None] + v[:, None] * times.value[:, None], "kpc")
+
+    >>> profiles = [gp.PlummerPotential(m_tot=1e7, b=0.3, units="galactic")] * n
+    >>> pot = gp.SubhaloPopulationPotential.from_trajectories(
+    ...     profiles, times, orbits, cell_size=u.Quantity(10, "kpc"))
+
+    >>> q = u.Quantity([1.0, 2, 3], "kpc")
+    >>> t = u.Quantity(5, "Myr")
+    >>> pot.potential(q, t)
+    Quantity[...](Array(-0.00..., dtype=float64), unit='kpc2 / Myr2')
+
+    """
+
+    profiles: StackedPotential
+    """The subhalo potentials, centred on the origin."""
+
+    times: Float[Array, "K"] = eqx.field(converter=jnp.asarray)
+    """Knot times of the trajectories, in the time unit of ``units``."""
+
+    positions: Float[Array, "N K 3"] = eqx.field(converter=jnp.asarray)
+    """Subhalo positions at the knots, in the length unit of ``units``."""
+
+    masses: Float[Array, "N"] = eqx.field(converter=jnp.asarray)
+    """Subhalo masses for the far field, in the mass unit of ``units``."""
+
+    grid_origin: Float[Array, "3"] = eqx.field(converter=jnp.asarray)
+    """Lower corner of the grid."""
+
+    cell_size: gt.FloatSz0 = eqx.field(converter=jnp.asarray)
+    """Side length of the cells."""
+
+    order: Int[Array, "K-1 N"] = eqx.field(converter=jnp.asarray)
+    """Subhalos sorted by cell, for each chunk between knots."""
+
+    cell_start: Int[Array, "K-1 C+1"] = eqx.field(converter=jnp.asarray)
+    """Offset of each cell's members in ``order``, for each chunk."""
+
+    cell_mass: Float[Array, "K-1 C"] = eqx.field(converter=jnp.asarray)
+    """Total mass of each cell, for each chunk."""
+
+    cell_com: Float[Array, "K-1 C 3"] = eqx.field(converter=jnp.asarray)
+    """Centre of mass of each cell at the start of each chunk."""
+
+    cell_vcom: Float[Array, "K-1 C 3"] = eqx.field(converter=jnp.asarray)
+    """Mass-weighted mean velocity of each cell over each chunk."""
+
+    _: KW_ONLY
+    n_cells: tuple[int, int, int] = eqx.field(static=True)
+    """Number of cells along each axis."""
+
+    max_per_cell: int = eqx.field(static=True)
+    """Largest number of subhalos in a cell, over all chunks."""
+
+    far_field: bool = eqx.field(default=True, static=True)
+    """Whether to include the monopole of the cells outside the neighbourhood."""
+
+    exact_radius: float = eqx.field(default=0.0, static=True)
+    """Distance within which subhalos are always summed exactly."""
+
+    units: u.AbstractUnitSystem = eqx.field(converter=u.unitsystem, static=True)
+    constants: ImmutableMap[str, u.Quantity] = eqx.field(
+        default=default_constants, converter=ImmutableMap
+    )
+
+    # ==========================================================================
+    # Constructors
+
+    @classmethod
+    def from_trajectories(
+        cls,
+        profiles: StackedPotential | Sequence[AbstractPotential],
+        times: u.Quantity["time"],
+        positions: u.Quantity["length"],
+        /,
+        *,
+        cell_size: u.Quantity["length"],
+        masses: u.Quantity["mass"] | None = None,
+        far_field: bool = True,
+    ) -> "SubhaloPopulationPotential":
+        """Build the population and its cell lists.
+
+        Parameters
+        ----------
+        profiles : `galax.potential.StackedPotential` | Sequence[AbstractPotential]
+            The subhalo potentials, centred on the origin. A sequence is stacked
+            into a `galax.potential.StackedPotential`; all subhalos must then be
+            of the same type. The unit system of the population is that of the
+            profiles.
+        times : Quantity[float, (K,), "time"]
+            Strictly increasing knot times, with ``K >= 2``. The cell lists are
+            rebuilt at each knot. Outside the knots the subhalos are held at the
+            first or last position.
+        positions : Quantity[float, (N, K, 3), "length"]
+            Subhalo positions at the knots.
+        cell_size : Quantity[float, (), "length"]
+            Side length of the grid cells.
+        masses : Quantity[float, (N,), "mass"] | None, optional
+            Subhalo masses for the far field. If `None` (default), the
+            ``m_tot`` (or ``m``) parameter of the profiles at the first knot is
+            used.
+        far_field : bool, optional
+            Whether to include the monopole of the cells outside the
+            neighbourhood of the evaluation point. Default is `True`.
+
+        """
+        if not isinstance(profiles, StackedPotential):
+            profiles = StackedPotential(profiles)
+        usys = profiles.units
+        ulen, utime, umass = usys["length"], usys["time"], usys["mass"]
+
+        tk = np.asarray(u.ustrip(utime, times), dtype=float)
+        xk = np.asarray(u.ustrip(ulen, positions), dtype=float)
+        h = float(u.ustrip(ulen, cell_size))
+        n = len(profiles)
+        if tk.ndim != 1 or len(tk) < 2 or xk.shape != (n, len(tk), 3):
+            msg = (
+                "times must have shape (K,) with K >= 2 and positions (N, K, 3) "
+                f"with N = {n} subhalos, got {tk.shape} and {xk.shape}."
+            )
+            raise ValueError(msg)
+
+        # Far-field masses.
+        if masses is None:
+            t0 = u.Quantity(tk[0], utime)
+            mass_param = getattr(profiles.stacked, "m_tot", None)
+            mass_param = getattr(profiles.stacked, "m", mass_param)
+            if mass_param is None:
+                msg = "the profiles have no mass parameter; pass `masses`."
+                raise ValueError(msg)
+            masses = mass_param(t0)
+        mk = np.broadcast_to(np.asarray(u.ustrip(umass, masses), dtype=float), (n,))
+
+        # Subhalos must not move further than a cell within a chunk.
+        max_disp = float(np.max(np.linalg.norm(np.diff(xk, axis=1), axis=-1)))
+        if max_disp >= h:
+            msg = (
+                f"subhalos move up to {max_disp:.3g} between knots, more than the "
+                f"cell size {h:.3g}. Add knots or increase `cell_size`."
+            )
+            raise ValueError(msg)
+
+        # Grid covering all the trajectories.
+        origin = xk.reshape(-1, 3).min(axis=0) - h / 2
+        extent = xk.reshape(-1, 3).max(axis=0) + h / 2 - origin
+        n_cells = tuple(int(i) for i in np.ceil(extent / h).astype(int))
+        n_total = int(np.prod(n_cells))
+
+        # Cell lists, rebuilt at the start of each chunk.
+        orders, starts, cmass, ccom, cvcom = [], [], [], [], []
+        for k in range(len(tk) - 1):
+            x, dx = xk[:, k], xk[:, k + 1] - xk[:, k]
+            v = dx / (tk[k + 1] - tk[k])
+            ijk = np.clip(((x - origin) // h).astype(int), 0, np.asarray(n_cells) - 1)
+            cell = np.ravel_multi_index(ijk.T, n_cells)
+            orders.append(np.argsort(cell, kind="stable"))
+            counts = np.bincount(cell, minlength=n_total)
+            starts.append(np.concat([[0], np.cumsum(counts)]))
+            mass = np.bincount(cell, weights=mk, minlength=n_total)
+            safe = np.where(mass > 0, mass, 1.0)
+            ccom.append(
+                np.stack(
+                    [
+                        np.bincount(cell, mk * x[:, i], minlength=n_total) / safe
+                        for i in range(3)
+                    ],
+                    axis=-1,
+                )
+            )
+            cvcom.append(
+                np.stack(
+                    [
+                        np.bincount(cell, mk * v[:, i], minlength=n_total) / safe
+                        for i in range(3)
+                    ],
+                    axis=-1,
+                )
+            )
+            cmass.append(mass)
+
+        return cls(
+            profiles=profiles,
+            times=tk,
+            positions=xk,
+            masses=mk,
+            grid_origin=origin,
+            cell_size=h,
+            order=np.stack(orders).astype(np.int32),
+            cell_start=np.stack(starts).astype(np.int32),
+            cell_mass=np.stack(cmass),
+            cell_com=np.stack(ccom),
+            cell_vcom=np.stack(cvcom),
+            n_cells=n_cells,
+            max_per_cell=int(max(np.max(np.diff(s)) for s in starts)),
+            far_field=far_field,
+            exact_radius=h - max_disp,
+            units=usys,
+            constants=profiles.constants,
+        )
+
+    # ==========================================================================
+
+    def _chunk(self, t: gt.FloatSz0, /) -> tuple[Int[Array, ""], gt.FloatSz0]:
+        """Index of the chunk containing ``t`` and the fraction through it."""
+        tk = self.times
+        k = jnp.clip(jnp.searchsorted(tk, t, side="right") - 1, 0, len(tk) - 2)
+        frac = jnp.clip((t - tk[k]) / (tk[k + 1] - tk[k]), 0.0, 1.0)
+        return k, frac
+
+    def _neighbours(
+        self, x: gt.Sz3, k: Int[Array, ""], /
+    ) -> tuple[Int[Array, "M"], Bool[Array, "M"], Bool[Array, "C"]]:
+        """Candidate subhalos near ``x`` and the cells outside its neighbourhood.
+
+        Returns the indices of the subhalos in the 27 cells around ``x`` (padded
+        to ``27 * max_per_cell``), a mask of the valid entries, and a mask of
+        the cells that are not in the neighbourhood.
+        """
+        n_cells = np.asarray(self.n_cells)
+        ijk = jnp.floor((x - self.grid_origin) / self.cell_size).astype(int)
+
+        # Neighbouring cells inside the grid.
+        nbr = ijk + _NEIGHBOURS
+        in_grid = jnp.all((nbr >= 0) & (nbr < n_cells), axis=-1)
+        cell = jnp.ravel_multi_index(tuple(nbr.T), self.n_cells, mode="clip")
+
+        # Their members, padded to `max_per_cell`.
+        start = self.cell_start[k, cell]
+        count = jnp.where(in_grid, self.cell_start[k, cell + 1] - start, 0)
+        slot = jnp.arange(self.max_per_cell)
+        valid = slot[None, :] < count[:, None]
+        pos = jnp.clip(start[:, None] + slot[None, :], 0, self.order.shape[1] - 1)
+        idx = self.order[k, pos]
+
+        # Cells outside the neighbourhood.
+        all_ijk = jnp.stack(
+            jnp.unravel_index(jnp.arange(np.prod(n_cells)), self.n_cells), axis=-1
+        )
+        far = jnp.any(jnp.abs(all_ijk - ijk) > 1, axis=-1)
+        return idx.ravel(), valid.ravel(), far
+
+    @partial(jax.jit, inline=True)
+    @vectorize_method(signature="(3),()->()")
+    def _potential(self, q: gt.QuSz3, t: gt.RealQuSz0, /) -> gt.SpecificEnergySz0:
+        usys = self.units
+        ulen, uenergy = usys["length"], usys["specific energy"]
+        x, tt = u.ustrip(ulen, q), u.ustrip(usys["time"], t)
+        k, frac = self._chunk(tt)
+        idx, valid, far = self._neighbours(x, k)
+
+        # Nearby subhalos, summed exactly. Padding entries are moved far away
+        # so that they contribute finite values (and gradients) to be masked.
+        x0, x1 = self.positions[idx, k], self.positions[idx, k + 1]
+        dx = x - (x0 + frac * (x1 - x0))
+        dx = jnp.where(valid[:, None], dx, 1e3 * self.cell_size)
+        profiles = jax.tree.map(lambda a: a[idx], self.profiles.stacked)
+        phis = jax.vmap(
+            lambda p, d: u.ustrip(uenergy, p._potential(BareQuantity(d, ulen), t))  # noqa: SLF001
+        )(profiles, dx)
+        phi = jnp.sum(jnp.where(valid, phis, 0.0))
+
+        if self.far_field:
+            # Monopoles of the other cells.
+            G = u.ustrip(
+                ulen**3 / usys["mass"] / usys["time"] ** 2, self.constants["G"]
+            )
+            com = self.cell_com[k] + self.cell_vcom[k] * (tt - self.times[k])
+            use = far & (self.cell_mass[k] > 0)
+            r = jnp.linalg.vector_norm(x - com, axis=-1)
+            phi = phi - G * jnp.sum(
+                jnp.where(use, self.cell_mass[k] / jnp.where(use, r, 1.0), 0.0)
+            )
+
+        return u.Quantity(phi, uenergy)
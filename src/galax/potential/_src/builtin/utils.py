@@ -0,0 +1,63 @@
+"""Helpers for the closed-form derivatives of built-in potentials.
+
+This module is private API.
+
+"""
+
+__all__: list[str] = []
+
+import quaxed.numpy as jnp
+
+import galax.typing as gt
+
+
+def radial_gradient(
+    dPhi_dr: gt.FloatQuSz0, q: gt.QuSz3, r: gt.FloatQuSz0, /
+) -> gt.QuSz3:
+    r"""Cartesian gradient of a spherically-symmetric potential.
+
+    .. math::
+
+        \nabla\Phi = \frac{d\Phi}{dr} \hat{r}
+
+    Parameters
+    ----------
+    dPhi_dr : Quantity[float, (), "acceleration"]
+        The radial derivative of the potential at ``r``.
+    q : Quantity[float, (3,), "length"]
+        The Cartesian position.
+    r : Quantity[float, (), "length"]
+        The norm of ``q``.
+
+    """
+    return dPhi_dr * q / r
+
+
+def radial_hessian(
+    dPhi_dr: gt.FloatQuSz0,
+    d2Phi_dr2: gt.FloatQuSz0,
+    q: gt.QuSz3,
+    r: gt.FloatQuSz0,
+    /,
+) -> gt.QuSz33:
+    r"""Cartesian Hessian of a spherically-symmetric potential.
+
+    .. math::
+
+        \frac{\partial^2\Phi}{\partial x_i \partial x_j}
+            = \frac{d^2\Phi}{dr^2} \hat{r}_i \hat{r}_j
+            + \frac{1}{r}\frac{d\Phi}{dr} (\delta_{ij} - \hat{r}_i \hat{r}_j)
+
+    Parameters
+    ----------
+    dPhi_dr, d2Phi_dr2 : Quantity[float, (), "acceleration" | "frequency drift"]
+        The first and second radial derivatives of the potential at ``r``.
+    q : Quantity[float, (3,), "length"]
+        The Cartesian position.
+    r : Quantity[float, (), "length"]
+        The norm of ``q``.
+
+    """
+    rhat = q / r
+    rr = jnp.outer(rhat, rhat)
+    return d2Phi_dr2 * rr + (dPhi_dr / r) * (jnp.eye(3) - rr)
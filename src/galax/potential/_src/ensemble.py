@@ -0,0 +1,232 @@
+"""Ensembles of same-type potentials with batched parameters."""
+
+__all__ = ["PotentialEnsemble"]
+
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar, final
+
+import equinox as eqx
+import jax
+import numpy as np
+from jaxtyping import Array
+
+import quaxed.numpy as jnp
+import unxt as u
+
+from .base import AbstractPotential
+from .params.core import ConstantParameter
+from .stacked import stack_potentials
+
+if TYPE_CHECKING:
+    import galax.dynamics  # noqa: ICN001
+
+R = TypeVar("R")
+
+
+@final
+class PotentialEnsemble(eqx.Module):  # type: ignore[misc]
+    """One potential class evaluated over a batch of parameter sets.
+
+    The members are stored as a single potential whose array leaves have a
+    leading ensemble axis, and every method is a `jax.vmap` over that axis.
+    Unlike a :class:`~galax.potential.StackedPotential` the members are not
+    summed: each method returns one result per member, with a leading axis of
+    length ``len(ensemble)``. The ensemble is a pytree, so it can be passed
+    through `jax.jit`, and :meth:`with_parameters` swaps in new parameter
+    values without re-running the potential constructor -- the typical inner
+    loop of e.g. an MCMC walker ensemble.
+
+    Parameters
+    ----------
+    potentials : Sequence[AbstractPotential]
+        The members, all of the same class, unit system and parameter types.
+        See also :meth:`from_parameters`.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> ens = gp.PotentialEnsemble.from_parameters(
+    ...     gp.NFWPotential, m=u.Quantity(jnp.geomspace(1e11, 1e12, 4), "Msun"),
+    ...     r_s=u.Quantity(15, "kpc"), units="galactic")
+    >>> len(ens)
+    4
+
+    >>> q = u.Quantity([[8.0, 0, 0], [0, 20, 0]], "kpc")
+    >>> ens.potential(q, 0).shape
+    (4, 2)
+
+    Members can be recovered by index:
+
+    >>> ens[1].m(0)
+    Quantity['mass'](Array(2.15443469e+11, dtype=float64), unit='solMass')
+
+    New parameter values, e.g. the next step of the walkers:
+
+    >>> ens2 = ens.with_parameters(r_s=u.Quantity([10.0, 12, 14, 16], "kpc"))
+    >>> ens2.stacked.r_s.value
+    Quantity['length'](Array([10., 12., 14., 16.], dtype=float64), unit='kpc')
+
+    Orbits are integrated for every member at once:
+
+    >>> import galax.coordinates as gc
+    >>> w0 = gc.PhaseSpacePosition(q=u.Quantity([10.0, 0, 0], "kpc"),
+    ...                            p=u.Quantity([0.0, 150, 0], "km/s"))
+    >>> orbits = ens.evaluate_orbit(w0, u.Quantity([0.0, 100, 200], "Myr"))
+    >>> orbits.shape
+    (4, 3)
+
+    """
+
+    stacked: AbstractPotential
+    """The members, with their array leaves stacked along a leading axis."""
+
+    def __init__(self, potentials: Sequence[AbstractPotential], /) -> None:
+        self.stacked = stack_potentials(potentials, name="PotentialEnsemble")
+
+    @classmethod
+    def from_parameters(
+        cls,
+        pot_cls: type[AbstractPotential],
+        /,
+        **kwargs: Any,
+    ) -> "PotentialEnsemble":
+        """Construct the ensemble from batched parameter values.
+
+        The constructor of ``pot_cls`` is traced once under `jax.vmap`, rather
+        than called once per member. Array and `unxt.Quantity` arguments with a
+        leading axis are batched over it; scalar arrays are shared by all
+        members, as are all other arguments (e.g. ``units`` or ``l_max``).
+
+        Parameters
+        ----------
+        pot_cls : type[AbstractPotential]
+            The class of the members.
+        **kwargs : Any
+            The arguments of ``pot_cls``.
+
+        Raises
+        ------
+        ValueError
+            If the batched arguments do not share the length of their leading
+            axis, or if there are none.
+        """
+        is_array = lambda v: isinstance(v, u.AbstractQuantity | Array | np.ndarray)  # noqa: E731
+        batched = {k: v for k, v in kwargs.items() if is_array(v) and jnp.ndim(v) > 0}
+        shared = {k: v for k, v in kwargs.items() if k not in batched}
+        sizes = {jnp.shape(v)[0] for v in batched.values()}
+        if len(sizes) != 1:
+            msg = (
+                "the batched parameters must share the length of their leading "
+                f"axis, got {sorted(sizes)}."
+            )
+            raise ValueError(msg)
+
+        obj = object.__new__(cls)
+        stacked = jax.vmap(lambda kw: pot_cls(**kw, **shared))(batched)
+        object.__setattr__(obj, "stacked", stacked)
+        return obj
+
+    # ==========================================================================
+
+    @property
+    def units(self) -> u.AbstractUnitSystem:
+        """The unit system of the members."""
+        return self.stacked.units
+
+    def __len__(self) -> int:
+        return len(jax.tree.leaves(self.stacked)[0])
+
+    def __getitem__(self, index: int) -> AbstractPotential:
+        """Return the ``index``-th member."""
+        return jax.tree.map(lambda x: x[index], self.stacked)
+
+    def with_parameters(self, **values: Any) -> "PotentialEnsemble":
+        """Return the ensemble with new values of constant parameters.
+
+        The values replace the leaves of the members' parameters directly, so
+        no constructor or unit-system parsing is run and this is cheap inside
+        `jax.jit`. Arrays are interpreted in the units of the current values,
+        and scalars are shared by all members.
+
+        Raises
+        ------
+        TypeError
+            If a parameter is not a
+            :class:`~galax.potential.params.ConstantParameter`.
+        """
+        params = [getattr(self.stacked, k) for k in values]
+        for k, p in zip(values, params, strict=True):
+            if not isinstance(p, ConstantParameter):
+                msg = f"parameter {k!r} is a {type(p).__name__}, not constant."
+                raise TypeError(msg)
+
+        new = tuple(
+            jnp.broadcast_to(
+                u.Quantity.from_(v, p.value.unit),
+                p.value.shape,
+            )
+            for v, p in zip(values.values(), params, strict=True)
+        )
+        stacked = eqx.tree_at(
+            lambda s: tuple(getattr(s, k).value for k in values), self.stacked, new
+        )
+        return eqx.tree_at(lambda e: e.stacked, self, stacked)
+
+    # ==========================================================================
+
+    @eqx.filter_jit
+    def map(
+        self, func: Callable[[AbstractPotential], R], /, *args: Any, **kwargs: Any
+    ) -> R:
+        """Evaluate ``func(member, *args, **kwargs)`` for every member.
+
+        Examples
+        --------
+        >>> import jax.numpy as jnp
+        >>> import unxt as u
+        >>> import galax.potential as gp
+
+        >>> ens = gp.PotentialEnsemble.from_parameters(
+        ...     gp.KeplerPotential, m_tot=u.Quantity([1e11, 1e12], "Msun"),
+        ...     units="galactic")
+        >>> q = u.Quantity([8.0, 0, 0], "kpc")
+        >>> vc = ens.map(gp.local_circular_velocity, q, u.Quantity(0, "Gyr"))
+        >>> vc.uconvert("km/s").round(1)
+        Quantity['speed'](Array([231.9, 733.2], dtype=float64), unit='km / s')
+
+        """
+        return jax.vmap(lambda p: func(p, *args, **kwargs))(self.stacked)
+
+    def potential(self, *args: Any, **kwargs: Any) -> u.Quantity["specific energy"]:
+        """Potential of every member. See :func:`~galax.potential.potential`."""
+        return self.map(AbstractPotential.potential, *args, **kwargs)
+
+    def gradient(self, *args: Any, **kwargs: Any) -> Any:
+        """Gradient of every member. See :func:`~galax.potential.gradient`."""
+        return self.map(AbstractPotential.gradient, *args, **kwargs)
+
+    def acceleration(self, *args: Any, **kwargs: Any) -> Any:
+        """Acceleration of every member. See :func:`~galax.potential.acceleration`."""
+        return self.map(AbstractPotential.acceleration, *args, **kwargs)
+
+    def density(self, *args: Any, **kwargs: Any) -> u.Quantity["mass density"]:
+        """Density of every member. See :func:`~galax.potential.density`."""
+        return self.map(AbstractPotential.density, *args, **kwargs)
+
+    def hessian(self, *args: Any, **kwargs: Any) -> u.Quantity["1/s^2"]:
+        """Hessian of every member. See :func:`~galax.potential.hessian`."""
+        return self.map(AbstractPotential.hessian, *args, **kwargs)
+
+    def evaluate_orbit(
+        self, w0: Any, t: Any, /, **kwargs: Any
+    ) -> "galax.dynamics.Orbit":
+        """Orbit in every member. See :func:`~galax.dynamics.evaluate_orbit`.
+
+        The orbits have a leading ensemble axis, and share the times ``t``.
+        """
+        orbits = self.map(AbstractPotential.evaluate_orbit, w0, t, **kwargs)
+        return eqx.tree_at(lambda o: o.t, orbits, orbits.t[0])
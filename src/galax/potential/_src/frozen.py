@@ -0,0 +1,208 @@
+"""Frozen potentials, compiled with their parameters as constants."""
+
+__all__ = ["FrozenPotential", "freeze"]
+
+
+from collections.abc import Callable
+from functools import partial
+from typing import Any, final
+
+import equinox as eqx
+import jax
+from jaxtyping import Array
+
+import unxt as u
+from unxt.quantity import AbstractQuantity, BareQuantity
+from xmmutablemap import ImmutableMap
+
+import galax.typing as gt
+from .base import AbstractPotential
+
+
+class _Kernels:
+    """Raw-array kernels of a potential, closed over its parameters.
+
+    Instances hash by identity, so they can be a static field of a potential.
+    """
+
+    __slots__ = ("density", "gradient", "hessian", "potential", "source")
+
+    def __init__(self, pot: AbstractPotential, /) -> None:
+        self.source = pot
+        usys = pot.units
+        ulen, utime = usys["length"], usys["time"]
+
+        def kernel(method: Callable[..., Any], unit: Any, sig: str) -> Callable:
+            def fn(q: Array, t: Array) -> Array:
+                out = method(BareQuantity(q, ulen), BareQuantity(t, utime))
+                return u.ustrip(unit, out)
+
+            return jax.numpy.vectorize(fn, signature=sig)
+
+        self.potential = kernel(
+            pot._potential,  # noqa: SLF001
+            usys["specific energy"],
+            "(3),()->()",
+        )
+        self.gradient = kernel(
+            pot._gradient,  # noqa: SLF001
+            usys["acceleration"],
+            "(3),()->(3)",
+        )
+        self.hessian = kernel(
+            pot._hessian,  # noqa: SLF001
+            usys["frequency drift"],
+            "(3),()->(3,3)",
+        )
+        self.density = kernel(
+            pot._density,  # noqa: SLF001
+            usys["mass density"],
+            "(3),()->()",
+        )
+
+    def __repr__(self) -> str:
+        return repr(self.source)
+
+
+@final
+class FrozenPotential(AbstractPotential):
+    """A potential compiled with all of its parameters as constants.
+
+    The parameters, constants and components of the frozen potential are
+    closed over by raw-array kernels for the potential, its gradient, its
+    Hessian and the density, so they are compile-time constants of any
+    `jax.jit`-compiled function that evaluates the potential. Each kernel is a
+    single function of the bare position and time arrays, which XLA fuses and
+    constant-folds across components. The frozen potential has no array
+    leaves, so it is also free to pass into a jitted function.
+
+    Construct it with :func:`~galax.potential.freeze`. Because the parameters
+    are part of the compiled program, every frozen potential is compiled
+    separately, and large tabulated parameters (e.g. interpolation tables)
+    increase the compile time. Freeze a potential when it is fixed for many
+    evaluations, e.g. for a production orbit integration, not when its
+    parameters are varied.
+
+    Examples
+    --------
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> pot = gp.MilkyWayPotential()
+    >>> frozen = gp.freeze(pot)
+    >>> frozen.units is pot.units
+    True
+
+    >>> q = u.Quantity([8.0, 0, 0], "kpc")
+    >>> t = u.Quantity(0, "Gyr")
+    >>> frozen.potential(q, t)
+    Quantity[...](Array(-0.16440296, dtype=float64), unit='kpc2 / Myr2')
+    >>> pot.potential(q, t)
+    Quantity[...](Array(-0.16440296, dtype=float64), unit='kpc2 / Myr2')
+
+    >>> import jax
+    >>> jax.tree.leaves(frozen)
+    []
+
+    """
+
+    _kernels: _Kernels = eqx.field(static=True)
+
+    def __init__(self, potential: AbstractPotential, /) -> None:
+        self._kernels = _Kernels(potential)
+
+    # ==========================================================================
+
+    @property
+    def original(self) -> AbstractPotential:
+        """The potential that was frozen."""
+        return self._kernels.source
+
+    @property
+    def units(self) -> u.AbstractUnitSystem:  # type: ignore[override]
+        """The unit system of the frozen potential."""
+        return self._kernels.source.units
+
+    @property
+    def constants(self) -> ImmutableMap[str, AbstractQuantity]:  # type: ignore[override]
+        """The constants of the frozen potential."""
+        return self._kernels.source.constants
+
+    # ==========================================================================
+
+    def _evaluate(
+        self, kernel: Callable[[Array, Array], Array], unit: str, q: Any, t: Any
+    ) -> u.Quantity:
+        ulen, utime = self.units["length"], self.units["time"]
+        out = kernel(u.ustrip(ulen, q), u.ustrip(utime, t))
+        return u.Quantity(out, self.units[unit])
+
+    @partial(jax.jit, inline=True)
+    def _potential(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> gt.SpecificEnergyBtSz0:
+        return self._evaluate(self._kernels.potential, "specific energy", q, t)
+
+    @partial(jax.jit, inline=True)
+    def _gradient(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz3:
+        return self._evaluate(self._kernels.gradient, "acceleration", q, t)
+
+    @partial(jax.jit, inline=True)
+    def _potential_and_gradient(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> tuple[gt.SpecificEnergyBtSz0, gt.BtQuSz3]:
+        return self._potential(q, t), self._gradient(q, t)
+
+    @partial(jax.jit, inline=True)
+    def _density(
+        self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
+    ) -> gt.BtFloatQuSz0:
+        return self._evaluate(self._kernels.density, "mass density", q, t)
+
+    @partial(jax.jit, inline=True)
+    def _hessian(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz33:
+        return self._evaluate(self._kernels.hessian, "frequency drift", q, t)
+
+
+def freeze(pot: AbstractPotential, /) -> FrozenPotential:
+    """Freeze a potential, compiling its parameters as constants.
+
+    This works for any potential, and is most effective for those with many
+    components, e.g. a :class:`~galax.potential.CompositePotential`, the
+    Milky Way models like :class:`~galax.potential.MilkyWayPotential`, or a
+    :class:`~galax.potential.TransformedPotential`. See
+    :class:`~galax.potential.FrozenPotential`.
+
+    Raises
+    ------
+    ValueError
+        If the potential is traced, e.g. inside `jax.jit`: its parameters are
+        then not constants.
+
+    Examples
+    --------
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> pot = gp.CompositePotential(
+    ...     disk=gp.MiyamotoNagaiPotential(m_tot=1e11, a=6.5, b=0.26, units="galactic"),
+    ...     halo=gp.NFWPotential(m=1e12, r_s=20, units="galactic"),
+    ... )
+    >>> frozen = gp.freeze(pot)
+    >>> frozen.original is pot
+    True
+
+    >>> frozen.acceleration(u.Quantity([8.0, 0, 0], "kpc"), u.Quantity(0, "Gyr"))
+    CartesianAcc3D(
+      x=Quantity[...](value=f64[], unit=Unit("kpc / Myr2")),
+      y=Quantity[...](value=f64[], unit=Unit("kpc / Myr2")),
+      z=Quantity[...](value=f64[], unit=Unit("kpc / Myr2"))
+    )
+
+    """
+    if isinstance(pot, FrozenPotential):
+        return pot
+    if any(isinstance(x, jax.core.Tracer) for x in jax.tree.leaves(pot)):
+        msg = "cannot freeze a traced potential; call `freeze` outside of `jax.jit`."
+        raise ValueError(msg)
+    return FrozenPotential(pot)
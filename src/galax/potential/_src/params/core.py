@@ -5,16 +5,19 @@ __all__ = [
     "AbstractParameter",
     "ConstantParameter",
     "LinearParameter",
+    "InterpolatedParameter",
     "UserParameter",
 ]
 
 import abc
 from functools import partial
-from typing import Any, Protocol, final, runtime_checkable
+from typing import Any, Literal, Protocol, final, runtime_checkable
 
 import equinox as eqx
 import jax
+from jaxtyping import Array, Float
 
+import quaxed.numpy as jnp
 import unxt as u
 from dataclassish.converters import Unless
 from unxt.quantity import AbstractQuantity
@@ -272,6 +275,147 @@ class LinearParameter(AbstractParameter):
         return self.slope * (t - self.point_time) + self.point_value
 
 
+#####################################################################
+# Interpolated Parameter
+
+
+@final
+class InterpolatedParameter(AbstractParameter):
+    r"""Parameter interpolated from a table of values at knot times.
+
+    The values may be array-valued, e.g. the expansion coefficients of a
+    `galax.potential.MultipolePotential` tabulated along a simulation. They are
+    interpolated with a natural cubic spline (``method="cubic"``, the default)
+    or linearly (``method="linear"``). The knot containing ``t`` is found by
+    bisection, so an evaluation costs :math:`O(\log K)` for :math:`K` knots.
+    The spline's second derivatives are solved for once, at construction.
+
+    Outside the range of the knots the parameter is held at the first or last
+    value.
+
+    Parameters
+    ----------
+    times : Quantity[float, (K,), "time"]
+        The strictly increasing knot times.
+    values : Quantity[float, (K, *shape)]
+        The parameter values at the knots.
+    method : {"cubic", "linear"}, optional
+        The interpolation method.
+
+    Examples
+    --------
+    >>> from galax.potential.params import InterpolatedParameter
+    >>> import unxt as u
+    >>> import quaxed.numpy as jnp
+
+    >>> times = u.Quantity(jnp.linspace(0, 4, 5), "Gyr")
+    >>> ip = InterpolatedParameter(times, u.Quantity(1e9 * times.value**2, "Msun"))
+
+    The cubic spline follows the quadratic growth (2.25e9 Msun at 1.5 Gyr) more
+    closely than linear interpolation:
+
+    >>> ip(u.Quantity(1.5, "Gyr")).round(-5)
+    Quantity['mass'](Array(2.2321e+09, dtype=float64), unit='solMass')
+
+    >>> lip = InterpolatedParameter(times, u.Quantity(1e9 * times.value**2, "Msun"),
+    ...                             method="linear")
+    >>> lip(u.Quantity(1.5, "Gyr"))
+    Quantity['mass'](Array(2.5e+09, dtype=float64), unit='solMass')
+
+    Array-valued parameters are interpolated element-wise, and the output has
+    the batch shape of ``t`` followed by the shape of the values:
+
+    >>> coeffs = u.Quantity(jnp.ones((5, 3, 3)) * times.value[:, None, None], "")
+    >>> ip = InterpolatedParameter(times, coeffs)
+    >>> ip(u.Quantity([0.5, 2.5], "Gyr")).shape
+    (2, 3, 3)
+
+    """
+
+    times: Float[AbstractQuantity, "K"] = eqx.field(converter=u.Quantity["time"].from_)
+    """The knot times."""
+
+    values: FloatQuSzAny = eqx.field(converter=u.Quantity.from_)
+    """The parameter values at the knots, with the knots along the first axis."""
+
+    second_derivs: Float[Array, "K ..."] = eqx.field(repr=False)
+    """Second derivatives of the spline at the knots, in the units of ``values``
+    per squared unit of ``times``. Zero for linear interpolation."""
+
+    method: Literal["cubic", "linear"] = eqx.field(static=True)
+    """The interpolation method."""
+
+    def __init__(
+        self,
+        times: Any,
+        values: Any,
+        *,
+        method: Literal["cubic", "linear"] = "cubic",
+    ) -> None:
+        self.times = times
+        self.values = values
+        self.method = method
+
+        tk, yk = self.times.value, self.values.value
+        if tk.ndim != 1 or len(tk) < 2 or yk.shape[:1] != tk.shape:
+            msg = (
+                "times must have shape (K,) with K >= 2 and values (K, *shape), "
+                f"got {tk.shape} and {yk.shape}."
+            )
+            raise ValueError(msg)
+        if method not in ("cubic", "linear"):
+            msg = f"method must be 'cubic' or 'linear', got {method!r}."
+            raise ValueError(msg)
+
+        if method == "linear" or len(tk) == 2:
+            self.second_derivs = jnp.zeros_like(yk, dtype=float)
+        else:
+            self.second_derivs = _natural_spline_second_derivs(tk, yk)
+
+    @partial(jax.jit, inline=True)
+    def __call__(self, t: BBtRealQuSz0, **_: Any) -> FloatQuSzAny:
+        """Return the parameter value.
+
+        Parameters
+        ----------
+        t : Quantity[float | int, (*batch,), "time"]
+            The time(s) at which to evaluate the parameter.
+
+        Returns
+        -------
+        Quantity[float, (*batch, *shape)]
+            The interpolated parameter value.
+        """
+        tk, yk, mk = self.times.value, self.values.value, self.second_derivs
+        t = jnp.clip(u.ustrip(self.times.unit, t), tk[0], tk[-1])
+
+        i = jnp.clip(jnp.searchsorted(tk, t, side="right") - 1, 0, len(tk) - 2)
+        h = tk[i + 1] - tk[i]
+        # Broadcast the batch of weights against the value shape.
+        expand = (...,) + (None,) * (yk.ndim - 1)
+        b = ((t - tk[i]) / h)[expand]
+        a = 1 - b
+        h2 = (h**2 / 6)[expand]
+        out = a * yk[i] + b * yk[i + 1]
+        out = out + ((a**3 - a) * mk[i] + (b**3 - b) * mk[i + 1]) * h2
+        return u.Quantity(out, self.values.unit)
+
+
+def _natural_spline_second_derivs(
+    tk: Float[Array, "K"], yk: Float[Array, "K ..."], /
+) -> Float[Array, "K ..."]:
+    """Second derivatives of the natural cubic spline through the knots."""
+    h = jnp.diff(tk)
+    dy = jnp.diff(yk, axis=0).reshape(len(h), -1) / h[:, None]
+    rhs = 6 * (dy[1:] - dy[:-1])
+    diag = 2 * (h[:-1] + h[1:])
+    lower = jnp.concat([jnp.zeros(1), h[1:-1]])
+    upper = jnp.concat([h[1:-1], jnp.zeros(1)])
+    m = jax.lax.linalg.tridiagonal_solve(lower, diag, upper, rhs)
+    zero = jnp.zeros((1, m.shape[1]))
+    return jnp.concat([zero, m, zero]).reshape(yk.shape)
+
+
 #####################################################################
 # User-defined Parameter
 # For passing a function as a parameter.
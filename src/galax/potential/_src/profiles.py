@@ -0,0 +1,190 @@
+"""Radial profiles of potentials."""
+
+__all__ = ["RadialProfiles", "radial_profiles"]
+
+
+import weakref
+from collections import OrderedDict
+from typing import Any, final
+
+import equinox as eqx
+import jax
+import numpy as np
+from jaxtyping import Array, Float, Shaped
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.typing as gt
+from . import raw
+from .base import AbstractPotential
+
+_MAXSIZE = 128
+_cache: OrderedDict[tuple[Any, ...], tuple[weakref.ref, "RadialProfiles"]] = (
+    OrderedDict()
+)
+
+
+@final
+class RadialProfiles(eqx.Module):  # type: ignore[misc]
+    """Radial profiles of a potential, see :func:`radial_profiles`."""
+
+    r: Shaped[u.Quantity["length"], "R"]
+    """The radii."""
+
+    circular_velocity: Shaped[u.Quantity["speed"], "R"]
+    r"""The circular velocity, :math:`v_c = \sqrt{r\, d\Phi/dr}`."""
+
+    mass_enclosed: Shaped[u.Quantity["mass"], "R"]
+    r"""The enclosed mass, :math:`M(<r) = r^2\, (d\Phi/dr) / G`."""
+
+    density: Shaped[u.Quantity["mass density"], "R"]
+    r"""The density, :math:`\rho = \nabla^2 \Phi / 4\pi G`."""
+
+    Omega: Shaped[u.Quantity["frequency"], "R"]
+    r"""The circular frequency, :math:`\Omega = v_c / r`."""
+
+    kappa: Shaped[u.Quantity["frequency"], "R"]
+    r"""The epicyclic frequency,
+    :math:`\kappa^2 = d^2\Phi/dr^2 + (3/r)\, d\Phi/dr`."""
+
+    nu: Shaped[u.Quantity["frequency"], "R"]
+    r"""The vertical frequency, :math:`\nu^2 = d^2\Phi/dz^2`."""
+
+
+@jax.jit
+def _radial_profiles(
+    pot: AbstractPotential,
+    r: Float[Array, "R"],
+    t: gt.RealSz0,
+    directions: Float[Array, "D 3"],
+    G: gt.FloatSz0,
+) -> tuple[Float[Array, "R"], ...]:
+    q = directions[:, None, :] * r[None, :, None]  # (D, R, 3)
+    grad = raw.gradient(pot, q, t)
+    hess = raw.hessian(pot, q, t)
+
+    # Average over the directions. For directions sampling the sphere this
+    # gives the spherically-averaged profiles, by Gauss's theorem.
+    dphi_dr = jnp.mean(jnp.einsum("di,dri->dr", directions, grad), axis=0)
+    d2phi_dr2 = jnp.mean(
+        jnp.einsum("di,drij,dj->dr", directions, hess, directions), axis=0
+    )
+    d2phi_dz2 = jnp.mean(hess[..., 2, 2], axis=0)
+    lapl = jnp.mean(jnp.trace(hess, axis1=-2, axis2=-1), axis=0)
+
+    vc = jnp.sqrt(r * jnp.abs(dphi_dr))
+    return (
+        vc,
+        r**2 * jnp.abs(dphi_dr) / G,
+        lapl / (4 * jnp.pi * G),
+        vc / r,
+        jnp.sqrt(d2phi_dr2 + 3 * dphi_dr / r),
+        jnp.sqrt(d2phi_dz2),
+    )
+
+
+def radial_profiles(
+    pot: AbstractPotential,
+    r: Any,
+    t: Any,
+    /,
+    *,
+    directions: Any = None,
+) -> RadialProfiles:
+    r"""Compute the radial profiles of a potential on a grid of radii.
+
+    The circular velocity, enclosed mass, density and the circular, epicyclic
+    and vertical frequencies are all derived from one gradient and one Hessian
+    evaluation per grid point, in a single jitted call. The results are
+    memoized per potential, grid, time and directions, so repeated queries of
+    the same profiles are free.
+
+    Parameters
+    ----------
+    pot : AbstractPotential
+        The potential.
+    r : Quantity[float, (R,), "length"] | Array[float, (R,)]
+        The radii. Arrays are interpreted in the length unit of the potential.
+    t : Quantity[float, (), "time"] | Array[float, ()]
+        The time. Arrays are interpreted in the time unit of the potential.
+    directions : Array[float, (D, 3)] | None, optional
+        The directions along which the radial derivatives are taken, which
+        are averaged over. Defaults to the :math:`x`-axis, i.e. the midplane
+        of an axisymmetric potential. Directions sampling the sphere give the
+        spherically-averaged enclosed mass and density of a non-spherical
+        potential. The directions need not be normalized.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> pot = gp.MilkyWayPotential()
+    >>> prof = gp.radial_profiles(pot, u.Quantity([4.0, 8, 16], "kpc"),
+    ...                           u.Quantity(0, "Gyr"))
+    >>> prof.circular_velocity.uconvert("km/s").round(1)
+    Quantity['speed'](Array([230.3, 231.8, 218.5], dtype=float64), unit='km / s')
+
+    The profiles are consistent with the functional API:
+
+    >>> gp.local_circular_velocity(pot, u.Quantity([8.0, 0, 0], "kpc"),
+    ...                            u.Quantity(0, "Gyr")).uconvert("km/s").round(1)
+    Quantity['speed'](Array(231.8, dtype=float64), unit='km / s')
+
+    The same query is served from the cache:
+
+    >>> gp.radial_profiles(pot, u.Quantity([4.0, 8, 16], "kpc"),
+    ...                    u.Quantity(0, "Gyr")) is prof
+    True
+
+    """
+    usys = pot.units
+    if isinstance(r, u.AbstractQuantity):
+        r = u.ustrip(usys["length"], r)
+    if isinstance(t, u.AbstractQuantity):
+        t = u.ustrip(usys["time"], t)
+    directions = np.array([[1.0, 0, 0]] if directions is None else directions)
+    directions = directions / np.linalg.norm(directions, axis=-1, keepdims=True)
+
+    key = _cache_key(pot, r, t, directions)
+    if key is not None and key in _cache:
+        ref, out = _cache[key]
+        if ref() is pot:
+            _cache.move_to_end(key)
+            return out
+
+    r = jnp.asarray(r, dtype=float)
+    G = u.ustrip(
+        usys["length"] ** 3 / usys["mass"] / usys["time"] ** 2, pot.constants["G"]
+    )
+    vc, m, rho, Omega, kappa, nu = _radial_profiles(pot, r, t, directions, G)
+    out = RadialProfiles(
+        r=u.Quantity(r, usys["length"]),
+        circular_velocity=u.Quantity(vc, usys["speed"]),
+        mass_enclosed=u.Quantity(m, usys["mass"]),
+        density=u.Quantity(rho, usys["mass density"]),
+        Omega=u.Quantity(Omega, usys["frequency"]),
+        kappa=u.Quantity(kappa, usys["frequency"]),
+        nu=u.Quantity(nu, usys["frequency"]),
+    )
+
+    if key is not None:
+        _cache[key] = (weakref.ref(pot), out)
+        if len(_cache) > _MAXSIZE:
+            _cache.popitem(last=False)
+    return out
+
+
+def _cache_key(
+    pot: AbstractPotential, r: Any, t: Any, directions: np.ndarray, /
+) -> tuple[Any, ...] | None:
+    """Return the memoization key, or `None` for traced inputs."""
+    try:
+        r, t = np.asarray(r, dtype=float), np.asarray(t, dtype=float)
+    except jax.errors.TracerArrayConversionError:
+        return None
+    if any(isinstance(x, jax.core.Tracer) for x in jax.tree.leaves(pot)):
+        return None
+    return (id(pot), r.shape, r.tobytes(), t.tobytes(), directions.tobytes())
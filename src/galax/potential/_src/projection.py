@@ -0,0 +1,147 @@
+"""Density grids and projections of potentials."""
+
+__all__ = ["density_grid", "surface_density"]
+
+
+from typing import Any
+
+import jax
+import numpy as np
+from jaxtyping import Array, Float
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.typing as gt
+from . import raw
+from .base import AbstractPotential
+
+
+def _strip(unit: Any, x: Any, /) -> Array:
+    """Strip the units of a quantity, or interpret an array in ``unit``."""
+    x = u.ustrip(unit, x) if isinstance(x, u.AbstractQuantity) else x
+    return jnp.asarray(x, dtype=float)
+
+
+def density_grid(
+    pot: AbstractPotential, x: Any, y: Any, z: Any, t: Any, /
+) -> Float[u.Quantity["mass density"], "X Y Z"]:
+    """Compute the density on the Cartesian grid ``x`` by ``y`` by ``z``.
+
+    The whole grid is evaluated in one jitted call.
+
+    Parameters
+    ----------
+    pot : AbstractPotential
+        The potential.
+    x, y, z : Quantity[float, (N,), "length"] | Array[float, (N,)]
+        The coordinates of the grid along each axis. Arrays are interpreted in
+        the length unit of the potential.
+    t : Quantity[float, (), "time"] | Array[float, ()]
+        The time. Arrays are interpreted in the time unit of the potential.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> pot = gp.MilkyWayPotential()
+    >>> x = u.Quantity(jnp.linspace(-10, 10, 21), "kpc")
+    >>> rho = gp.density_grid(pot, x, x, u.Quantity([-1.0, 0, 1], "kpc"),
+    ...                       u.Quantity(0, "Gyr"))
+    >>> rho.shape
+    (21, 21, 3)
+
+    """
+    usys = pot.units
+    xyz = [_strip(usys["length"], c) for c in (x, y, z)]
+    q = jnp.stack(jnp.meshgrid(*xyz, indexing="ij"), axis=-1)
+    rho = raw.density(pot, q, _strip(usys["time"], t))
+    return u.Quantity(rho, usys["mass density"])
+
+
+@jax.jit
+def _surface_density(
+    pot: AbstractPotential,
+    x: Float[Array, "*batch"],
+    y: Float[Array, "*batch"],
+    t: gt.FloatSz0,
+    z: Float[Array, "Z"],
+    w: Float[Array, "Z"],
+) -> Float[Array, "*batch"]:
+    shape = jnp.broadcast_shapes(x.shape, y.shape)
+    x, y = jnp.broadcast_to(x, shape), jnp.broadcast_to(y, shape)
+    q = jnp.stack(
+        [
+            jnp.broadcast_to(x[..., None], (*shape, len(z))),
+            jnp.broadcast_to(y[..., None], (*shape, len(z))),
+            jnp.broadcast_to(z, (*shape, len(z))),
+        ],
+        axis=-1,
+    )
+    return jnp.sum(raw.density(pot, q, t) * w, axis=-1)
+
+
+def surface_density(
+    pot: AbstractPotential,
+    x: Any,
+    y: Any,
+    t: Any,
+    /,
+    *,
+    z_scale: Any = 1.0,
+    n_z: int = 128,
+) -> Float[u.Quantity["surface mass density"], "*batch"]:
+    r"""Compute the surface density, projected along the :math:`z`-axis.
+
+    The density is integrated along the line of sight from :math:`-\infty` to
+    :math:`\infty` with ``n_z``-point Gauss-Legendre quadrature in
+    :math:`u \in (-1, 1)`, where :math:`z = z_s u / (1 - u^2)`. Half of the
+    nodes are within :math:`|z| < z_s`, so ``z_scale`` should be comparable to
+    the scale height of the density. To project along another line of sight,
+    rotate the potential, e.g. with a
+    :class:`~galax.potential.TransformedPotential`.
+
+    Parameters
+    ----------
+    pot : AbstractPotential
+        The potential.
+    x, y : Quantity[float, (*batch,), "length"] | Array[float, (*batch,)]
+        The projected positions. Arrays are interpreted in the length unit of
+        the potential.
+    t : Quantity[float, (), "time"] | Array[float, ()]
+        The time. Arrays are interpreted in the time unit of the potential.
+    z_scale : Quantity[float, (), "length"] | float, optional
+        The scale :math:`z_s` of the quadrature. Floats are interpreted in the
+        length unit of the potential.
+    n_z : int, optional
+        The number of quadrature nodes along the line of sight.
+
+    Examples
+    --------
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    The surface density of a Plummer sphere is
+    :math:`\Sigma(R) = M b^2 / \pi (R^2 + b^2)^2`:
+
+    >>> pot = gp.PlummerPotential(m_tot=u.Quantity(1e10, "Msun"),
+    ...                           b=u.Quantity(1, "kpc"), units="galactic")
+    >>> R = u.Quantity([0.0, 1, 2], "kpc")
+    >>> gp.surface_density(pot, R, u.Quantity(0, "kpc"), u.Quantity(0, "Gyr"))
+    Quantity['surface mass density'](Array([3.18309886e+09, 7.95774715e+08,
+                                            1.27323954e+08], dtype=float64),
+                                     unit='solMass / kpc2')
+
+    """
+    usys = pot.units
+    x, y = _strip(usys["length"], x), _strip(usys["length"], y)
+    z_s = _strip(usys["length"], z_scale)
+
+    nodes, weights = np.polynomial.legendre.leggauss(n_z)
+    z = z_s * nodes / (1 - nodes**2)
+    w = z_s * weights * (1 + nodes**2) / (1 - nodes**2) ** 2
+
+    sigma = _surface_density(pot, x, y, _strip(usys["time"], t), z, w)
+    return u.Quantity(sigma, usys["mass"] / usys["area"])
@@ -0,0 +1,201 @@
+"""Unitless functional API for galax potentials.
+
+These functions take and return bare arrays in the unit system of the
+potential. They skip the multiple dispatch and the wrapping of the inputs into
+`coordinax` vectors and `unxt.Quantity` objects of the functional API in
+:mod:`galax.potential`, which dominates the cost of evaluating small batches.
+The inputs are not checked: positions must be Cartesian, with a trailing axis
+of length 3, in the length unit of the potential, and times in its time unit.
+
+"""
+
+__all__ = [
+    "potential",
+    "gradient",
+    "potential_and_gradient",
+    "laplacian",
+    "density",
+    "hessian",
+    "acceleration",
+]
+
+import jax
+from jaxtyping import Array, Float
+
+import unxt as u
+from unxt.quantity import BareQuantity
+
+import galax.typing as gt
+from .base import AbstractPotential
+
+
+def _parse(
+    pot: AbstractPotential, q: gt.BtSz3, t: gt.BBtRealSz0 | gt.RealScalarLike
+) -> tuple[BareQuantity, BareQuantity]:
+    usys = pot.units
+    return BareQuantity(q, usys["length"]), BareQuantity(t, usys["time"])
+
+
+@jax.jit
+def potential(
+    pot: AbstractPotential,
+    q: gt.BtSz3,
+    t: gt.BBtRealSz0 | gt.RealScalarLike,
+    /,
+) -> gt.BtFloatSz0:
+    """Compute the potential energy, in the unit system of the potential.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import galax.potential as gp
+
+    >>> pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    >>> gp.raw.potential(pot, jnp.array([1.0, 2, 3]), 0.0)
+    Array(-1.20227527, dtype=float64)
+
+    """
+    out = pot._potential(*_parse(pot, q, t))  # noqa: SLF001
+    return u.ustrip(pot.units["specific energy"], out)
+
+
+@jax.jit
+def gradient(
+    pot: AbstractPotential,
+    q: gt.BtSz3,
+    t: gt.BBtRealSz0 | gt.RealScalarLike,
+    /,
+) -> gt.BtSz3:
+    """Compute the gradient, in the unit system of the potential.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import galax.potential as gp
+
+    >>> pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    >>> gp.raw.gradient(pot, jnp.array([[1.0, 2, 3], [4, 5, 6]]), 0.0)
+    Array([[0.08587681, 0.17175361, 0.25763042],
+           [0.02663127, 0.03328908, 0.0399469 ]], dtype=float64)
+
+    """
+    out = pot._gradient(*_parse(pot, q, t))  # noqa: SLF001
+    return u.ustrip(pot.units["acceleration"], out)
+
+
+@jax.jit
+def potential_and_gradient(
+    pot: AbstractPotential,
+    q: gt.BtSz3,
+    t: gt.BBtRealSz0 | gt.RealScalarLike,
+    /,
+) -> tuple[gt.BtFloatSz0, gt.BtSz3]:
+    """Compute the potential energy and gradient, in the potential's units.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import galax.potential as gp
+
+    >>> pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    >>> gp.raw.potential_and_gradient(pot, jnp.array([1.0, 2, 3]), 0.0)
+    (Array(-1.20227527, dtype=float64),
+     Array([0.08587681, 0.17175361, 0.25763042], dtype=float64))
+
+    """
+    phi, grad = pot._potential_and_gradient(*_parse(pot, q, t))  # noqa: SLF001
+    usys = pot.units
+    return u.ustrip(usys["specific energy"], phi), u.ustrip(usys["acceleration"], grad)
+
+
+@jax.jit
+def laplacian(
+    pot: AbstractPotential,
+    q: gt.BtSz3,
+    t: gt.BBtRealSz0 | gt.RealScalarLike,
+    /,
+) -> gt.BtFloatSz0:
+    """Compute the laplacian, in the unit system of the potential.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import galax.potential as gp
+
+    >>> pot = gp.HernquistPotential(m_tot=1e12, r_s=5, units="galactic")
+    >>> gp.raw.laplacian(pot, jnp.array([1.0, 2, 3]), 0.0)
+    Array(0.01799793, dtype=float64)
+
+    """
+    out = pot._laplacian(*_parse(pot, q, t))  # noqa: SLF001
+    return u.ustrip(pot.units["frequency drift"], out)
+
+
+@jax.jit
+def density(
+    pot: AbstractPotential,
+    q: gt.BtSz3,
+    t: gt.BBtRealSz0 | gt.RealScalarLike,
+    /,
+) -> gt.BtFloatSz0:
+    """Compute the density, in the unit system of the potential.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import galax.potential as gp
+
+    >>> pot = gp.HernquistPotential(m_tot=1e12, r_s=5, units="galactic")
+    >>> gp.raw.density(pot, jnp.array([1.0, 2, 3]), 0.0)
+    Array(3.18379264e+08, dtype=float64)
+
+    """
+    out = pot._density(*_parse(pot, q, t))  # noqa: SLF001
+    return u.ustrip(pot.units["mass density"], out)
+
+
+@jax.jit
+def hessian(
+    pot: AbstractPotential,
+    q: gt.BtSz3,
+    t: gt.BBtRealSz0 | gt.RealScalarLike,
+    /,
+) -> Float[Array, "*batch 3 3"]:
+    """Compute the hessian, in the unit system of the potential.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import galax.potential as gp
+
+    >>> pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    >>> gp.raw.hessian(pot, jnp.array([1.0, 2, 3]), 0.0)
+    Array([[ 0.06747463, -0.03680435, -0.05520652],
+           [-0.03680435,  0.01226812, -0.11041304],
+           [-0.05520652, -0.11041304, -0.07974275]], dtype=float64)
+
+    """
+    out = pot._hessian(*_parse(pot, q, t))  # noqa: SLF001
+    return u.ustrip(pot.units["frequency drift"], out)
+
+
+@jax.jit
+def acceleration(
+    pot: AbstractPotential,
+    q: gt.BtSz3,
+    t: gt.BBtRealSz0 | gt.RealScalarLike,
+    /,
+) -> gt.BtSz3:
+    """Compute the acceleration, in the unit system of the potential.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import galax.potential as gp
+
+    >>> pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    >>> gp.raw.acceleration(pot, jnp.array([1.0, 2, 3]), 0.0)
+    Array([-0.08587681, -0.17175361, -0.25763042], dtype=float64)
+
+    """
+    return -gradient(pot, q, t)
@@ -125,6 +125,54 @@ def gradient(pot: AbstractPotential, q: Any, /, *, t: Any) -> cx.vecs.CartesianA
     return api.gradient(pot, q, t)
 
 
+# =============================================================================
+# Potential and Gradient
+
+
+@dispatch
+def potential_and_gradient(
+    pot: AbstractPotential,
+    wt: gc.AbstractPhaseSpaceCoordinate | cx.FourVector,
+    /,
+) -> tuple[u.Quantity["specific energy"], cx.vecs.CartesianAcc3D]:
+    """Compute the potential and its gradient at the given coordinate(s)."""
+    q = parse_to_quantity(wt, dtype=float, units=pot.units["length"])
+    phi, grad = pot._potential_and_gradient(q, wt.t)  # noqa: SLF001
+    return phi, cx.vecs.CartesianAcc3D.from_(grad)
+
+
+@dispatch
+def potential_and_gradient(
+    pot: AbstractPotential, q: Any, t: Any, /
+) -> tuple[u.Quantity["specific energy"], cx.vecs.CartesianAcc3D]:
+    """Compute the potential and its gradient at the given position(s).
+
+    Parameters
+    ----------
+    pot : `~galax.potential.AbstractPotential`
+        The potential to evaluate.
+    q : Any
+        The position at which to evaluate the potential. See
+        `parse_to_quantity` for more details.
+    t : Any
+        The time at which to evaluate the potential. See
+        :meth:`unxt.Quantity.from_` for more details.
+
+    """
+    q = parse_to_quantity(q, dtype=float, unit=pot.units["length"])
+    t = u.Quantity.from_(t, pot.units["time"])
+    phi, grad = pot._potential_and_gradient(q, t)  # noqa: SLF001
+    return phi, cx.vecs.CartesianAcc3D.from_(grad)
+
+
+@dispatch
+def potential_and_gradient(
+    pot: AbstractPotential, q: Any, /, *, t: Any
+) -> tuple[u.Quantity["specific energy"], cx.vecs.CartesianAcc3D]:
+    """Compute the potential and its gradient when `t` is keyword-only."""
+    return api.potential_and_gradient(pot, q, t)
+
+
 # =============================================================================
 # Laplacian
 
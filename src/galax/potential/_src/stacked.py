@@ -0,0 +1,162 @@
+"""Stacked potential of same-type components."""
+
+__all__ = ["StackedPotential", "stack_potentials"]
+
+
+from collections.abc import Sequence
+from functools import partial
+from typing import final
+
+import jax
+
+import quaxed.numpy as jnp
+import unxt as u
+from unxt.quantity import AbstractQuantity
+from xmmutablemap import ImmutableMap
+
+import galax.typing as gt
+from .base import AbstractPotential
+
+
+@final
+class StackedPotential(AbstractPotential):
+    """Sum of many potentials of the same type, evaluated together.
+
+    The parameters of the components are stored as arrays with a leading
+    component axis, and each evaluation is a single `jax.vmap` over the
+    components followed by a sum. Unlike a
+    :class:`~galax.potential.CompositePotential`, whose components are unrolled
+    into the trace one by one, the size of the traced program (and so the
+    compile time) does not grow with the number of components. This is the
+    representation to use for e.g. a population of subhalos.
+
+    All components must be instances of the same class, with the same unit
+    system, constants, parameter types and parameter shapes. A stacked
+    potential can itself be a component of a
+    :class:`~galax.potential.CompositePotential`.
+
+    Parameters
+    ----------
+    potentials : Sequence[AbstractPotential]
+        The components. They are stacked on construction.
+
+    Examples
+    --------
+    >>> import jax.numpy as jnp
+    >>> import unxt as u
+    >>> import galax.potential as gp
+
+    >>> subhalos = [
+    ...     gp.PlummerPotential(m_tot=u.Quantity(m, "Msun"), b=u.Quantity(b, "kpc"),
+    ...                         units="galactic")
+    ...     for m, b in zip([1e8, 2e8, 5e8], [0.1, 0.2, 0.3])
+    ... ]
+    >>> pot = gp.StackedPotential(subhalos)
+    >>> len(pot)
+    3
+
+    >>> pot.stacked.m_tot.value.shape
+    (3,)
+
+    The potential is the sum of the components:
+
+    >>> q = u.Quantity([1.0, 2, 3], "kpc")
+    >>> t = u.Quantity(0, "Gyr")
+    >>> total = sum(p.potential(q, t).value for p in subhalos)
+    >>> bool(jnp.isclose(pot.potential(q, t).value, total))
+    True
+
+    Components can be recovered by index:
+
+    >>> pot[1].m_tot.value
+    Quantity['mass'](Array(2.e+08, dtype=float64, ...), unit='solMass')
+
+    """
+
+    stacked: AbstractPotential
+    """The components, with their array leaves stacked along a leading axis."""
+
+    def __init__(self, potentials: Sequence[AbstractPotential], /) -> None:
+        self.stacked = stack_potentials(potentials, name="StackedPotential")
+
+    # ==========================================================================
+
+    @property
+    def units(self) -> u.AbstractUnitSystem:  # type: ignore[override]
+        """The unit system of the components."""
+        return self.stacked.units
+
+    @property
+    def constants(self) -> ImmutableMap[str, AbstractQuantity]:  # type: ignore[override]
+        """The constants of the first component."""
+        return ImmutableMap({k: v[0] for k, v in self.stacked.constants.items()})
+
+    def __len__(self) -> int:
+        return len(jax.tree.leaves(self.stacked)[0])
+
+    def __getitem__(self, index: int) -> AbstractPotential:
+        """Return the ``index``-th component."""
+        return jax.tree.map(lambda x: x[index], self.stacked)
+
+    # ==========================================================================
+
+    @partial(jax.jit, inline=True)
+    def _potential(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> gt.SpecificEnergyBtSz0:
+        phis = jax.vmap(lambda p: p._potential(q, t))(self.stacked)  # noqa: SLF001
+        return jnp.sum(phis, axis=0)
+
+    @partial(jax.jit, inline=True)
+    def _gradient(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz3:
+        grads = jax.vmap(lambda p: p._gradient(q, t))(self.stacked)  # noqa: SLF001
+        return jnp.sum(grads, axis=0)
+
+    @partial(jax.jit, inline=True)
+    def _potential_and_gradient(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> tuple[gt.SpecificEnergyBtSz0, gt.BtQuSz3]:
+        phis, grads = jax.vmap(lambda p: p._potential_and_gradient(q, t))(  # noqa: SLF001
+            self.stacked
+        )
+        return jnp.sum(phis, axis=0), jnp.sum(grads, axis=0)
+
+    @partial(jax.jit, inline=True)
+    def _density(
+        self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
+    ) -> gt.BtFloatQuSz0:
+        rhos = jax.vmap(lambda p: p._density(q, t))(self.stacked)  # noqa: SLF001
+        return jnp.sum(rhos, axis=0)
+
+    @partial(jax.jit, inline=True)
+    def _hessian(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz33:
+        hessians = jax.vmap(lambda p: p._hessian(q, t))(self.stacked)  # noqa: SLF001
+        return jnp.sum(hessians, axis=0)
+
+
+def stack_potentials(
+    potentials: Sequence[AbstractPotential], /, *, name: str
+) -> AbstractPotential:
+    """Stack same-type potentials along a leading axis of their array leaves.
+
+    ``name`` is the class requesting the stack, for the error messages.
+    """
+    potentials = tuple(potentials)
+    if len(potentials) == 0:
+        msg = f"{name} requires at least one component."
+        raise ValueError(msg)
+
+    treedef = jax.tree.structure(potentials[0])
+    for p in potentials[1:]:
+        if jax.tree.structure(p) != treedef:
+            msg = (
+                f"all components of a {name} must have the same type, "
+                "unit system, and parameter types. "
+                f"Got {type(potentials[0]).__name__} and {type(p).__name__}."
+            )
+            raise ValueError(msg)
+    try:
+        return jax.tree.map(lambda *xs: jnp.stack(xs), *potentials)
+    except (TypeError, ValueError) as e:
+        msg = f"all components of a {name} must have the same shapes."
+        raise ValueError(msg) from e
@@ -6,6 +6,7 @@ from functools import partial
 
 import jax
 
+import quaxed.numpy as jnp
 import unxt as u
 
 import galax.typing as gt
@@ -78,13 +79,36 @@ class TriaxialInThePotential(AbstractTransformedPotential):
         default=u.Quantity(1, ""), dimensions="dimensionless"
     )
 
+    def _scale(self, t: gt.BBtRealQuSz0, /) -> gt.BBtQuSz3:
+        """Return the factors ``(1, 1 / y_over_x, 1 / z_over_x)`` scaling ``q``."""
+        inv_y, inv_z = 1 / self.y_over_x(t), 1 / self.z_over_x(t)
+        return jnp.stack([jnp.ones_like(inv_y), inv_y, inv_z], axis=-1)
+
     @partial(jax.jit)
     def _potential(
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
-        # Transform the position
-        q = q.astype(float).at[..., 1].set(q[..., 1] / self.y_over_x(t))
-        q = q.astype(float).at[..., 2].set(q[..., 2] / self.z_over_x(t))
-
         # Evaluate the potential energy at the transformed position, time.
-        return self.original_potential._potential(q, t)  # noqa: SLF001
+        return self.original_potential._potential(q * self._scale(t), t)  # noqa: SLF001
+
+    @partial(jax.jit, inline=True)
+    def _gradient(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz3:
+        # The chain rule through the diagonal scaling.
+        scale = self._scale(t)
+        return scale * self.original_potential._gradient(q * scale, t)  # noqa: SLF001
+
+    @partial(jax.jit, inline=True)
+    def _potential_and_gradient(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> tuple[gt.SpecificEnergyBtSz0, gt.BtQuSz3]:
+        scale = self._scale(t)
+        phi, grad = self.original_potential._potential_and_gradient(  # noqa: SLF001
+            q * scale, t
+        )
+        return phi, scale * grad
+
+    @partial(jax.jit, inline=True)
+    def _hessian(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz33:
+        scale = self._scale(t)
+        hess = self.original_potential._hessian(q * scale, t)  # noqa: SLF001
+        return scale[..., :, None] * hess * scale[..., None, :]
@@ -4,12 +4,16 @@ __all__ = ["TransformedPotential"]
 
 
 from dataclasses import replace
+from functools import partial
 from typing import final
 
 import equinox as eqx
-from plum import dispatch
+import jax
+from plum import convert, dispatch
 
 import coordinax.ops as cxo
+import quaxed.numpy as jnp
+import unxt as u
 
 import galax.typing as gt
 from .base import AbstractTransformedPotential
@@ -187,6 +191,23 @@ class TransformedPotential(AbstractTransformedPotential):
     'simulation' frame.
     """
 
+    _inverse: cxo.AbstractOperator = eqx.field(init=False, repr=False)
+    """The inverse of ``xop``, built once at construction."""
+
+    _affine: tuple[gt.QuSz33, gt.QuSz3] | None = eqx.field(init=False, repr=False)
+    r"""``(R, b)`` with :math:`q' = R q + b`, or `None`.
+
+    Set when the inverse operator is a chain of rotations and spatial
+    translations, which collapses into a single affine map. Gradients and
+    hessians are then rotated back with :math:`R` rather than differentiated
+    through the operator.
+    """
+
+    def __post_init__(self) -> None:
+        inv = self.xop.inverse
+        object.__setattr__(self, "_inverse", inv)
+        object.__setattr__(self, "_affine", _fold_affine(inv, self.units["length"]))
+
     def _potential(
         self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
     ) -> gt.SpecificEnergyBtSz0:
@@ -207,13 +228,77 @@ class TransformedPotential(AbstractTransformedPotential):
         Array[float, (...)]
             The potential energy at the given position(s).
         """
-        # Make inverse operator  # TODO: pre-compute and cache
-        inv = self.xop.inverse
         # Transform the position, time.
-        qp, tp = inv(q, t)
+        if self._affine is None:
+            qp, tp = self._inverse(q, t)
+        else:
+            rot, shift = self._affine
+            qp, tp = q @ rot.T + shift, t
         # Evaluate the potential energy at the transformed position, time.
         return self.original_potential._potential(qp, tp)  # noqa: SLF001
 
+    @partial(jax.jit, inline=True)
+    def _gradient(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz3:
+        if self._affine is None:
+            return super()._gradient(q, t)
+        rot, shift = self._affine
+        grad = self.original_potential._gradient(q @ rot.T + shift, t)  # noqa: SLF001
+        return grad @ rot
+
+    @partial(jax.jit, inline=True)
+    def _potential_and_gradient(
+        self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /
+    ) -> tuple[gt.SpecificEnergyBtSz0, gt.BtQuSz3]:
+        if self._affine is None:
+            return super()._potential_and_gradient(q, t)
+        rot, shift = self._affine
+        phi, grad = self.original_potential._potential_and_gradient(  # noqa: SLF001
+            q @ rot.T + shift, t
+        )
+        return phi, grad @ rot
+
+    @partial(jax.jit, inline=True)
+    def _density(
+        self, q: gt.BtQuSz3, t: gt.BtRealQuSz0 | gt.RealQuSz0, /
+    ) -> gt.BtFloatQuSz0:
+        if self._affine is None:
+            return super()._density(q, t)
+        # Rigid motions leave the density unchanged.
+        rot, shift = self._affine
+        return self.original_potential._density(q @ rot.T + shift, t)  # noqa: SLF001
+
+    @partial(jax.jit, inline=True)
+    def _hessian(self, q: gt.BtQuSz3, t: gt.BBtRealQuSz0, /) -> gt.BtQuSz33:
+        if self._affine is None:
+            return super()._hessian(q, t)
+        rot, shift = self._affine
+        hess = self.original_potential._hessian(q @ rot.T + shift, t)  # noqa: SLF001
+        return jnp.einsum("ji,...jk,kl->...il", rot, hess, rot)
+
+
+def _fold_affine(
+    op: cxo.AbstractOperator, unit: gt.Unit, /
+) -> tuple[gt.QuSz33, gt.QuSz3] | None:
+    """Collapse rotations and spatial translations into ``q -> R q + b``.
+
+    Returns `None` if ``op`` contains any other operator, e.g. a boost or a
+    time-dependent rotation.
+    """
+    ops = op.operators if isinstance(op, cxo.Pipe) else (op,)
+    rot = u.Quantity(jnp.eye(3), "")
+    shift = u.Quantity(jnp.zeros(3), unit)
+    for o in ops:
+        if isinstance(o, cxo.Identity):
+            continue
+        if isinstance(o, cxo.GalileanRotation):
+            r = u.Quantity(jnp.asarray(o.rotation, dtype=float), "")
+            rot, shift = r @ rot, r @ shift
+        elif isinstance(o, cxo.GalileanSpatialTranslation):
+            shift = shift + u.uconvert(unit, convert(o.translation, u.Quantity))
+        else:
+            return None
+    return rot, shift
+
 
 #####################################################################
 
@@ -8,6 +8,7 @@ __all__ = [
     "AbstractParameter",
     "ConstantParameter",
     "LinearParameter",
+    "InterpolatedParameter",
     "UserParameter",
     "ParameterField",
 ]
@@ -21,6 +22,7 @@ from ._src.params.attr import (
 from ._src.params.core import (
     AbstractParameter,
     ConstantParameter,
+    InterpolatedParameter,
     LinearParameter,
     ParameterCallable,
     UserParameter,
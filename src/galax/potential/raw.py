@@ -0,0 +1,25 @@
+"""Unitless functional API for :mod:`galax.potential`.
+
+See :mod:`galax.potential._src.raw` for details.
+"""
+
+__all__ = [
+    "potential",
+    "gradient",
+    "potential_and_gradient",
+    "laplacian",
+    "density",
+    "hessian",
+    "acceleration",
+]
+
+
+from ._src.raw import (
+    acceleration,
+    density,
+    gradient,
+    hessian,
+    laplacian,
+    potential,
+    potential_and_gradient,
+)
@@ -10,6 +10,7 @@ def test_all() -> None:
         "fields",
         "solve",
         "cluster",
+        "parallel",
         "mockstream",
         "plot",
         # solve
@@ -18,6 +19,7 @@ def test_all() -> None:
         # orbit
         "Orbit",
         "compute_orbit",
+        "compute_orbit_chunks",
         # mockstream
         "MockStreamArm",
         "MockStream",
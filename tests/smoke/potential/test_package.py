@@ -6,7 +6,11 @@ from galax.potential._src import (
     base_single,
     builtin,
     composite,
+    ensemble,
+    frozen,
     params,
+    profiles,
+    projection,
     xfm,
 )
 
@@ -18,11 +22,17 @@ def test_all() -> None:
         "io",
         "params",
         "plot",
+        "raw",
         *base.__all__,
         *base_single.__all__,
         *base_multi.__all__,
         *builtin.__all__,
         *composite.__all__,
+        "StackedPotential",
+        *ensemble.__all__,
+        *frozen.__all__,
+        *profiles.__all__,
+        *projection.__all__,
         *params.__all__,
         *xfm.__all__,
         *api.__all__,
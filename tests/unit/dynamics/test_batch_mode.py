@@ -0,0 +1,72 @@
+"""Tests for the ``batch_mode`` of `galax.dynamics.DynamicsSolver.solve`."""
+
+import diffrax as dfx
+import pytest
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.dynamics as gd
+import galax.potential as gp
+
+pot = gp.HernquistPotential(m_tot=1e12, r_s=5, units="galactic")
+field = gd.fields.HamiltonianField(pot)
+solver = gd.DynamicsSolver(stepsize_controller=dfx.PIDController(rtol=1e-9, atol=1e-9))
+r = jnp.array([1.0, 4, 8, 16, 30, 60])
+q0 = u.Quantity(jnp.stack([r, 0 * r, 0 * r], axis=-1), "kpc")
+p0 = u.Quantity(jnp.stack([0 * r, 250 / jnp.sqrt(r / 4 + 1), 0 * r], axis=-1), "km/s")
+t0, t1 = u.Quantity(0.0, "Myr"), u.Quantity(500.0, "Myr")
+ts = u.Quantity(jnp.linspace(0, 500, 5), "Myr")
+
+
+def _reference() -> tuple[jnp.ndarray, jnp.ndarray]:
+    """Each orbit integrated on its own, in layout ([time], batch, 3)."""
+    solns = [
+        solver.solve(field, (q, p), t0, t1, saveat=ts)
+        for q, p in zip(q0, p0, strict=False)
+    ]
+    return tuple(jnp.stack([s.ys[i] for s in solns], axis=1) for i in range(2))
+
+
+@pytest.mark.parametrize("batch_mode", [None, "shared", "bucketed"])
+def test_batch_mode_agrees(batch_mode: str | None) -> None:
+    """The batch modes with scalar times agree with single-orbit solves."""
+    soln = solver.solve(
+        field, (q0, p0), t0, t1, saveat=ts, batch_mode=batch_mode, n_buckets=3
+    )
+    assert soln.ys[0].shape == (5, 6, 3)
+    for y, ref in zip(soln.ys, _reference(), strict=True):
+        assert jnp.allclose(y, ref, rtol=1e-6, atol=1e-6)
+
+
+def test_batch_mode_vectorize() -> None:
+    """Vectorizing puts the time dimension after the batch dimensions."""
+    soln = solver.solve(field, (q0, p0), t0, t1, saveat=ts, batch_mode="vectorize")
+    assert soln.ys[0].shape == (6, 5, 3)
+    for y, ref in zip(soln.ys, _reference(), strict=True):
+        assert jnp.allclose(jnp.moveaxis(y, 0, 1), ref, rtol=1e-6, atol=1e-6)
+
+
+def test_batch_mode_bucketed_shape() -> None:
+    """The bucketed solve restores the batch shape and the order of orbits."""
+    q, p = q0.reshape(2, 3, 3), p0.reshape(2, 3, 3)
+    soln = solver.solve(field, (q, p), t0, t1, batch_mode="bucketed", n_buckets=4)
+    shared = solver.solve(field, (q, p), t0, t1, batch_mode="shared")
+    assert soln.ys[0].shape == (1, 2, 3, 3)
+    assert soln.stats["num_steps"].shape == (4,)
+    assert jnp.allclose(soln.ys[0], shared.ys[0], rtol=1e-6, atol=1e-6)
+
+    soln = solver.solve(field, (q, p), t0, t1, batch_mode="bucketed", unbatch_time=True)
+    assert soln.ys[0].shape == (2, 3, 3)
+
+
+def test_batch_mode_errors() -> None:
+    """Invalid combinations raise errors."""
+    with pytest.raises(ValueError, match="unknown batch_mode"):
+        solver.solve(field, (q0, p0), t0, t1, batch_mode="other")
+    with pytest.raises(ValueError, match="dense output"):
+        solver.solve(field, (q0, p0), t0, t1, batch_mode="bucketed", dense=True)
+    with pytest.raises(ValueError, match="scalar t0 and t1"):
+        solver.solve(
+            field, (q0, p0), t0, jnp.broadcast_to(t1, (6,)), batch_mode="shared"
+        )
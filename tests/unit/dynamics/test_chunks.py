@@ -0,0 +1,67 @@
+"""Tests for the chunked integration of large batches of orbits."""
+
+import jax
+import pytest
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.coordinates as gc
+import galax.dynamics as gd
+import galax.potential as gp
+
+pot = gp.HernquistPotential(m_tot=1e12, r_s=5, units="galactic")
+x = jnp.linspace(4, 20, 10).reshape(2, 5)
+w0 = gc.PhaseSpaceCoordinate(
+    q=u.Quantity(jnp.stack([x, 0 * x, 0.1 * x], axis=-1), "kpc"),
+    p=u.Quantity([0, 200, 10], "km/s"),
+    t=u.Quantity(0, "Myr"),
+)
+ts = u.Quantity(jnp.linspace(0, 500, 6), "Myr")
+
+
+def test_compute_orbit_chunks() -> None:
+    """The chunks are the flattened orbits of `compute_orbit`."""
+    orbit = gd.compute_orbit(pot, w0, ts)
+    chunks = list(gd.compute_orbit_chunks(pot, w0, ts, chunk_size=4))
+    assert [c.shape for c in chunks] == [(4, 6), (4, 6), (2, 6)]
+
+    expect = orbit.q.x.reshape(10, 6)
+    got = jnp.concat([c.q.x for c in chunks])
+    assert jnp.allclose(got.value, expect.value, atol=1e-8)
+
+
+def test_compute_orbit_chunks_reduce() -> None:
+    """The reduction is applied to each chunk, compiled once per chunk size."""
+    ntraces = 0
+
+    def energy(orbit: gd.Orbit) -> jax.Array:
+        nonlocal ntraces
+        ntraces += 1
+        return orbit.total_energy()[:, -1].value
+
+    energies = list(gd.compute_orbit_chunks(pot, w0, ts, chunk_size=3, reduce=energy))
+    assert [e.shape for e in energies] == [(3,), (3,), (3,), (1,)]
+    assert ntraces == 2  # for the chunks of 3, and the last chunk
+
+    orbit = gd.compute_orbit(pot, w0, ts)
+    expect = orbit.total_energy()[..., -1].value.reshape(-1)
+    assert jnp.allclose(jnp.concat(energies), expect)
+
+
+def test_solve_chunks() -> None:
+    """`DynamicsSolver.solve_chunks` solves each chunk of the batch."""
+    solver = gd.DynamicsSolver()
+    field = gd.fields.HamiltonianField(pot)
+    q = u.Quantity(jnp.stack([x, 0 * x, 0.1 * x], axis=-1), "kpc")
+    p = u.Quantity([0, 200, 10], "km/s")
+    t1 = u.Quantity(500, "Myr")
+
+    soln = solver.solve(field, (q, p), ts[0], t1)
+    chunks = list(solver.solve_chunks(field, (q, p), ts[0], t1, chunk_size=6))
+    assert [c.ys[0].shape for c in chunks] == [(1, 6, 3), (1, 4, 3)]
+    got = jnp.concat([c.ys[0] for c in chunks], axis=1)
+    assert jnp.allclose(got, soln.ys[0].reshape(1, 10, 3), atol=1e-8)
+
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        next(solver.solve_chunks(field, (q, p), ts[0], t1, chunk_size=0))
@@ -0,0 +1,48 @@
+"""Tests for `galax.dynamics.parallel`."""
+
+import operator
+
+import jax
+import numpy as np
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.coordinates as gc
+import galax.dynamics as gd
+import galax.potential as gp
+from galax.dynamics._src.parallel import _dumps, _loads
+
+pots = [gp.NFWPotential(m=m, r_s=20, units="galactic") for m in (1e11, 1e12, 2e12)]
+w0 = gc.PhaseSpacePosition(
+    q=u.Quantity([[10.0, 0, 0], [0, 12, 0]], "kpc"),
+    p=u.Quantity([0.0, 200, 0], "km/s"),
+)
+ts = u.Quantity(jnp.linspace(0, 1, 5), "Gyr")
+
+
+def test_serialization() -> None:
+    """Jitted outputs and PRNG keys round-trip, with their arrays out of band."""
+    orbit = gd.compute_orbit(pots[0], w0, ts)
+    key = jax.random.key(0)
+
+    data, arrays = _dumps((orbit, key, np.arange(3)))
+    assert all(isinstance(arr, np.ndarray) for arr in arrays)
+    orbit2, key2, arr = _loads(data, arrays)
+
+    assert isinstance(orbit2.q.x.value, jax.Array)
+    assert jnp.array_equal(orbit2.q.x, orbit.q.x)
+    assert jnp.array_equal(jax.random.key_data(key2), jax.random.key_data(key))
+    assert isinstance(arr, np.ndarray)
+
+
+def test_compute_orbits() -> None:
+    """The jobs run in worker processes and are returned in order."""
+    reduce = operator.attrgetter("q")
+    got = list(
+        gd.parallel.compute_orbits(pots, [w0] * 3, ts, reduce=reduce, max_workers=2)
+    )
+    assert len(got) == 3
+    for pot, q in zip(pots, got, strict=True):
+        expect = gd.compute_orbit(pot, w0, ts).q
+        assert jnp.allclose(q.x.ustrip("kpc"), expect.x.ustrip("kpc"))
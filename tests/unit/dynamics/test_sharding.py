@@ -0,0 +1,104 @@
+"""Tests for sharding batches of orbits over devices."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import jax
+import pytest
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.coordinates as gc
+import galax.dynamics as gd
+import galax.potential as gp
+
+pot = gp.HernquistPotential(m_tot=1e12, r_s=5, units="galactic")
+field = gd.fields.HamiltonianField(pot)
+solver = gd.DynamicsSolver()
+x = jnp.linspace(4, 20, 10).reshape(2, 5)
+q = u.Quantity(jnp.stack([x, 0 * x, 0.1 * x], axis=-1), "kpc")
+p = u.Quantity([0, 200, 10], "km/s")
+t0, t1 = u.Quantity(0, "Myr"), u.Quantity(500, "Myr")
+ts = u.Quantity(jnp.linspace(0, 500, 6), "Myr")
+
+
+def test_solve_devices() -> None:
+    """Sharding over the available devices matches the unsharded solve."""
+    ref = solver.solve(field, (q, p), t0, t1, saveat=ts)
+    soln = solver.solve(field, (q, p), t0, t1, saveat=ts, devices=jax.device_count())
+    assert soln.ys[0].shape == ref.ys[0].shape
+    assert soln.stats["num_steps"].shape == (jax.device_count(),)
+    assert jnp.allclose(soln.ys[0], ref.ys[0], atol=1e-5)
+
+    # Batched times are sharded too.
+    t1s = u.Quantity(jnp.full((2, 5), 500.0), "Myr")
+    soln = solver.solve(
+        field, (q, p), t0, t1s, saveat=ts, mesh=jax.make_mesh((1,), ("orbits",))
+    )
+    assert soln.ys[0].shape == (2, 5, 6, 3)
+    assert jnp.allclose(jnp.moveaxis(soln.ys[0], -2, 0), ref.ys[0], atol=1e-5)
+
+
+def test_compute_orbit_devices() -> None:
+    """`compute_orbit` passes the devices to the solver."""
+    w0 = gc.PhaseSpaceCoordinate(q=q, p=p, t=u.Quantity(-100, "Myr"))
+    ref = gd.compute_orbit(pot, w0, ts)
+    orbit = gd.compute_orbit(pot, w0, ts, devices=1)
+    assert orbit.shape == (2, 5, 6)
+    assert jnp.allclose(orbit.q.x.value, ref.q.x.value, atol=1e-5)
+
+
+def test_devices_errors() -> None:
+    """Invalid devices raise errors."""
+    with pytest.raises(ValueError, match="cannot shard"):
+        solver.solve(field, (q, p), t0, t1, devices=jax.device_count() + 1)
+    with pytest.raises(ValueError, match="only one of"):
+        solver.solve(
+            field, (q, p), t0, t1, devices=1, mesh=jax.make_mesh((1,), ("orbits",))
+        )
+    with pytest.raises(ValueError, match="dense output"):
+        solver.solve(field, (q, p), t0, t1, devices=1, dense=True)
+
+
+def test_multiple_host_devices() -> None:
+    """The orbits are sharded over several forced host devices."""
+    code = textwrap.dedent(
+        """
+        import jax
+        import quaxed.numpy as jnp
+        import unxt as u
+        import galax.coordinates as gc
+        import galax.dynamics as gd
+        import galax.potential as gp
+
+        assert jax.device_count() == 4
+        pot = gp.HernquistPotential(m_tot=1e12, r_s=5, units="galactic")
+        x = jnp.linspace(4, 20, 10)
+        w0 = gc.PhaseSpacePosition(
+            q=u.Quantity(jnp.stack([x, 0 * x, 0.1 * x], axis=-1), "kpc"),
+            p=u.Quantity([0, 200, 10], "km/s"),
+        )
+        ts = u.Quantity(jnp.linspace(0, 500, 6), "Myr")
+        ref = gd.compute_orbit(pot, w0, ts)
+        orbit = gd.compute_orbit(pot, w0, ts, devices=4)
+        assert orbit.shape == (10, 6)
+        assert jnp.allclose(orbit.q.x.value, ref.q.x.value, atol=1e-5)
+
+        gen = gd.MockStreamGenerator(gd.FardalStreamDF(), pot)
+        prog_w0 = gc.PhaseSpaceCoordinate(
+            q=u.Quantity([15.0, 0, 0], "kpc"),
+            p=u.Quantity([0, 150.0, 0], "km/s"),
+            t=u.Quantity(0, "Myr"),
+        )
+        ts = u.Quantity(jnp.linspace(0, 500, 7), "Myr")
+        args = (jax.random.key(0), ts, prog_w0, u.Quantity(1e4, "Msun"))
+        ref, _ = gen.run(*args)
+        stream, _ = gen.run(*args, devices=4)
+        assert jnp.allclose(stream["lead"].q.x.value, ref["lead"].q.x.value)
+        """
+    )
+    env = os.environ | {"XLA_FLAGS": "--xla_force_host_platform_device_count=4"}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)  # noqa: S603
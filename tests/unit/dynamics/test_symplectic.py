@@ -0,0 +1,68 @@
+"""Tests for the symplectic solvers."""
+
+import diffrax as dfx
+import pytest
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.dynamics as gd
+import galax.potential as gp
+
+pot = gp.KeplerPotential(m_tot=1e11, units="galactic")
+field = gd.fields.HamiltonianField(pot)
+q0 = u.Quantity([8.0, 0, 0], "kpc")
+p0 = u.Quantity([0, 0.26, 0], "kpc/Myr")  # eccentric
+t0, t1 = u.Quantity(0.0, "Myr"), u.Quantity(300.0, "Myr")
+
+
+def _solver(cls: type[gd.solve.AbstractSymplecticSolver]) -> gd.DynamicsSolver:
+    return gd.DynamicsSolver(cls(), stepsize_controller=dfx.ConstantStepSize())
+
+
+@pytest.mark.parametrize(
+    ("cls", "order"),
+    [
+        (gd.solve.Leapfrog, 2),
+        (gd.solve.Ruth3, 3),
+        (gd.solve.Yoshida4, 4),
+        (gd.solve.Yoshida6, 6),
+        (gd.solve.Yoshida8, 8),
+    ],
+)
+def test_order(cls: type[gd.solve.AbstractSymplecticSolver], order: int) -> None:
+    """The error converges at least at the order of the integrator."""
+    ref = _solver(gd.solve.Yoshida8).solve(field, (q0, p0), t0, t1, dt0=0.2)
+    solver = _solver(cls)
+    errs = [
+        jnp.linalg.norm(solver.solve(field, (q0, p0), t0, t1, dt0=dt).ys[0] - ref.ys[0])
+        for dt in (4.0, 2.0)
+    ]
+    assert jnp.log2(errs[0] / errs[1]) > order - 0.3
+
+
+def test_scan_matches_diffeqsolve() -> None:
+    """The scan agrees with `diffrax.diffeqsolve`, used for dense output."""
+    solver = _solver(gd.solve.Yoshida4)
+    ts = u.Quantity(jnp.linspace(0, 300, 7), "Myr")
+    scan = solver.solve(field, (q0, p0), t0, t1, dt0=1.0, saveat=ts)
+    dense = solver.solve(field, (q0, p0), t0, t1, dt0=1.0, saveat=ts, dense=True)
+    assert scan.interpolation is None
+    assert dense.interpolation is not None
+    assert scan.ts.shape == (7,)
+    assert jnp.allclose(scan.ys[0], dense.ys[0], atol=1e-10)
+    assert jnp.allclose(scan.ys[1], dense.ys[1], atol=1e-10)
+
+
+def test_energy_conservation() -> None:
+    """The energy error is bounded over many orbits."""
+    ts = u.Quantity(jnp.linspace(0, 10_000, 101), "Myr")
+    soln = _solver(gd.solve.Leapfrog).solve(
+        field, (q0, p0), t0, ts[-1], dt0=1.0, saveat=ts
+    )
+    q, p = soln.ys
+    E = 0.5 * jnp.sum(p**2, axis=-1) + gp.raw.potential(pot, q, 0.0)
+    dE = jnp.abs(E / E[0] - 1)
+    assert jnp.max(dE) < 1e-2
+    # No secular drift: the late error is no larger than the early error.
+    assert jnp.max(dE[50:]) < 1.5 * jnp.max(dE[:50])
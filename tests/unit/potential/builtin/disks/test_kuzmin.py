@@ -49,7 +49,7 @@ class TestKuzminPotential(
         assert jnp.allclose(got, expect, atol=u.Quantity(1e-8, expect.unit))
 
     def test_density(self, pot: KuzminPotential, x: gt.QuSz3) -> None:
-        expect = u.Quantity(2.45494884e-07, "solMass / kpc3")
+        expect = u.Quantity(0.0, "solMass / kpc3")
         assert jnp.isclose(
             pot.density(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
         )
@@ -75,7 +75,7 @@ class TestHarmonicOscillatorPotential(
 
     def test_density(self, pot: gp.HarmonicOscillatorPotential, x: gt.QuSz3) -> None:
         got = pot.density(x, t=0)
-        expect = u.Quantity(1.76169263e37, unit="solMass / kpc3")
+        expect = u.Quantity(5.28507789e37, unit="solMass / kpc3")
         assert jnp.isclose(got, expect, atol=u.Quantity(1e-8, expect.unit))
 
     def test_hessian(self, pot: gp.HarmonicOscillatorPotential, x: gt.QuSz3) -> None:
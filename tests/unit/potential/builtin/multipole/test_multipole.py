@@ -4,6 +4,7 @@ import re
 from typing import Any
 from typing_extensions import override
 
+import numpy as np
 import pytest
 from jaxtyping import Array, Shaped
 from plum import convert
@@ -260,6 +261,112 @@ class TestMultipolePotential(
         with pytest.raises(ValueError, match=match):
             pot_cls(**fields_)
 
+    def test_from_particles(self, field_units: u.AbstractUnitSystem) -> None:
+        """Test `MultipolePotential.from_particles` against direct summation."""
+        rng = np.random.default_rng(42)
+        dirs = rng.normal(size=(500, 3))
+        dirs /= np.linalg.norm(dirs, axis=-1, keepdims=True)
+        # A clump inside 1 kpc and a shell between 5 and 6 kpc.
+        q = np.concat(
+            [dirs[:250] * rng.random((250, 1)), dirs[250:] * (5 + rng.random((250, 1)))]
+        )
+        m = rng.uniform(1e6, 1e7, size=500)
+
+        pot = gp.MultipolePotential.from_particles(
+            u.Quantity(q, "kpc"),
+            u.Quantity(m, "Msun"),
+            l_max=10,
+            r_s=u.Quantity(2, "kpc"),
+            r_split=u.Quantity(3, "kpc"),
+            units=field_units,
+        )
+        assert jnp.isclose(
+            pot.m_tot(0), u.Quantity(m.sum(), "Msun"), atol=u.Quantity(1, "Msun")
+        )
+
+        # Between the clump and the shell the expansion converges to the
+        # potential of the particles.
+        x = np.array([[2.0, 1.0, -1.5], [0.0, -3.0, 1.0]])
+        G = u.ustrip("kpc3 / (Msun Myr2)", pot.constants["G"])
+        dist = np.linalg.norm(x[:, None] - q[None], axis=-1)
+        expect = u.Quantity(-G * np.sum(m / dist, axis=-1), "kpc2 / Myr2")
+        got = pot.potential(u.Quantity(x, "kpc"), t=0)
+        assert jnp.allclose(got, expect, rtol=1e-5, atol=u.Quantity(0, expect.unit))
+
+        # The coefficients do not depend on the chunking.
+        chunked = gp.MultipolePotential.from_particles(
+            q, m, l_max=10, r_s=2, r_split=3, units=field_units, chunk_size=37
+        )
+        for name in ("ISlm", "ITlm", "OSlm", "OTlm"):
+            assert jnp.allclose(
+                getattr(chunked, name)(0), getattr(pot, name)(0), atol=1e-14
+            )
+
+    def test_from_density(self, field_units: u.AbstractUnitSystem) -> None:
+        """Test `MultipolePotential.from_density` against known potentials."""
+        r_s = u.Quantity(10, "kpc")
+        q = u.Quantity(np.random.default_rng(0).normal(size=(20, 3)) * 10, "kpc")
+
+        # A spherical density is captured by the monopole term alone. The
+        # truncation at r_max = 1e3 r_s removes 0.2% of the Hernquist mass.
+        hern = gp.HernquistPotential(
+            m_tot=u.Quantity(1e12, "Msun"), r_s=r_s, units=field_units
+        )
+        pot = gp.MultipolePotential.from_density(
+            hern, l_max=2, r_s=r_s, units=field_units
+        )
+        assert pot.ISlm(0).shape == (128, 3, 3)
+        assert jnp.isclose(
+            pot.m_tot(0),
+            u.Quantity(0.998e12, "Msun"),
+            rtol=1e-5,
+            atol=u.Quantity(0, "Msun"),
+        )
+        expect = hern.potential(q, 0)
+        assert jnp.allclose(
+            pot.potential(q, 0), expect, rtol=1e-5, atol=u.Quantity(0, expect.unit)
+        )
+
+        # The density can be any function of position.
+        func = gp.MultipolePotential.from_density(
+            lambda x: hern.density(x, 0), l_max=2, r_s=r_s, units=field_units
+        )
+        assert jnp.allclose(func.OSlm(0), pot.OSlm(0), atol=1e-14)
+
+        # A flattened density with no closed-form potential. The NFW mass
+        # outside r_max offsets the potential by a constant.
+        nfw = gp.TriaxialNFWPotential(
+            m=u.Quantity(1e12, "Msun"), r_s=r_s, q1=0.8, q2=0.6, units=field_units
+        )
+        pot = gp.MultipolePotential.from_density(
+            nfw, l_max=8, r_s=r_s, units=field_units
+        )
+        expect = convert(nfw.gradient(q, 0), u.Quantity)
+        got = convert(pot.gradient(q, 0), u.Quantity)
+        err = jnp.linalg.vector_norm(got - expect, axis=-1) / jnp.linalg.vector_norm(
+            expect, axis=-1
+        )
+        assert jnp.all(err < 1e-3)
+        phi = u.ustrip("kpc2/Myr2", nfw.potential(q, 0))
+        offset = u.ustrip("kpc2/Myr2", pot.potential(q, 0)) - phi
+        assert jnp.std(offset) < 1e-5 * jnp.max(jnp.abs(phi))
+
+    def test_check_init_s_knots(
+        self, pot_cls: type[gp.MultipolePotential], fields_: dict[str, Any]
+    ) -> None:
+        """Tabulated coefficients need one row per knot."""
+        l_max = fields_["l_max"]
+        coeffs = jnp.zeros((l_max + 1, l_max + 1))
+        fields_ = fields_ | dict.fromkeys(("ISlm", "ITlm", "OSlm", "OTlm"), coeffs)
+        fields_["s_knots"] = jnp.array([1.0, 2.0])
+        with pytest.raises(ValueError, match=re.escape("(len(s_knots), l_max + 1")):
+            pot_cls(**fields_)
+
+        fields_ |= dict.fromkeys(
+            ("ISlm", "ITlm", "OSlm", "OTlm"), coeffs[None, :].repeat(2, 0)
+        )
+        assert pot_cls(**fields_).ISlm(0).shape == (2, l_max + 1, l_max + 1)
+
     # ==========================================================================
 
     def test_potential(self, pot: gp.MultipolePotential, x: gt.QuSz3) -> None:
@@ -276,9 +383,11 @@ class TestMultipolePotential(
         assert jnp.allclose(got, expect, atol=u.Quantity(1e-8, expect.unit))
 
     def test_density(self, pot: gp.MultipolePotential, x: gt.QuSz3) -> None:
-        expect = u.Quantity(4.73805126e-05, pot.units["mass density"])
+        # The multipole terms are harmonic, so the density is zero up to the
+        # roundoff of the autodiff Laplacian (|trace| ~ 1e-15 / Myr^2).
+        expect = u.Quantity(0.0, pot.units["mass density"])
         assert jnp.isclose(
-            pot.density(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+            pot.density(x, t=0), expect, atol=u.Quantity(1e-4, expect.unit)
         )
 
     def test_hessian(self, pot: gp.MultipolePotential, x: gt.QuSz3) -> None:
@@ -55,6 +55,40 @@ class TestTriaxialNFWPotential(
 
     # ==========================================================================
 
+    def test_adaptive_order(self, fields: dict[str, Any]) -> None:
+        """Test choosing the quadrature order from a tolerance."""
+        coarse = TriaxialNFWPotential(**fields, integration_rtol=1e-4)
+        fine = TriaxialNFWPotential(**fields, integration_rtol=1e-12)
+        assert coarse.integration_order < fine.integration_order
+        assert coarse.error_report["integration"] < 1e-4
+        assert fine.error_report["integration"] < 1e-12
+
+    def test_tabulated(self, pot: TriaxialNFWPotential, fields: dict[str, Any]) -> None:
+        """Test the tabulated mode against the quadrature."""
+        tab = TriaxialNFWPotential(**fields, tabulate=True, table_n_r=128)
+        assert tab.error_report["table_max"] < 1e-4
+        assert tab.error_report["table_median"] < 1e-6
+
+        q = u.Quantity([[1.0, 2, 3], [-4.0, 0.5, 1], [20.0, -30, 10]], "kpc")
+        expect = pot.potential(q, t=0)
+        assert jnp.allclose(
+            tab.potential(q, t=0), expect, rtol=1e-5, atol=u.Quantity(0, expect.unit)
+        )
+        expect = convert(pot.gradient(q, t=0), u.Quantity)
+        got = convert(tab.gradient(q, t=0), u.Quantity)
+        assert jnp.allclose(got, expect, rtol=1e-3, atol=u.Quantity(0, expect.unit))
+
+        # The axis ratios must be constant.
+        fields["q1"] = gp.params.LinearParameter(
+            slope=u.Quantity(0.01, "1/Gyr"),
+            point_time=u.Quantity(0, "Gyr"),
+            point_value=u.Quantity(0.9, ""),
+        )
+        with pytest.raises(ValueError, match="constant q1 and q2"):
+            TriaxialNFWPotential(**fields, tabulate=True)
+
+    # ==========================================================================
+
     def test_potential(self, pot: TriaxialNFWPotential, x: gt.QuSz3) -> None:
         expect = u.Quantity(-1.06475915, unit="kpc2 / Myr2")
         assert jnp.isclose(
@@ -0,0 +1,116 @@
+"""Parity of the closed-form derivatives with the autodiff ones.
+
+Many built-in potentials override ``_gradient``, ``_hessian``, and
+``_density`` with hand-derived expressions. The autodiff implementations on
+`galax.potential.AbstractPotential` are the reference.
+"""
+
+import pytest
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+
+POTENTIALS = {
+    "burkert": lambda: gp.BurkertPotential(m=1e11, r_s=5, units="galactic"),
+    "hernquist": lambda: gp.HernquistPotential(m_tot=1e11, r_s=2, units="galactic"),
+    "isochrone": lambda: gp.IsochronePotential(m_tot=1e11, b=3, units="galactic"),
+    "jaffe": lambda: gp.JaffePotential(m=1e11, r_s=2, units="galactic"),
+    "kepler": lambda: gp.KeplerPotential(m_tot=1e11, units="galactic"),
+    "plummer": lambda: gp.PlummerPotential(m_tot=1e11, b=2, units="galactic"),
+    "powerlawcutoff": lambda: gp.PowerLawCutoffPotential(
+        m_tot=1e11, alpha=1.8, r_c=10, units="galactic"
+    ),
+    "stoneostriker15": lambda: gp.StoneOstriker15Potential(
+        m_tot=1e11, r_c=1, r_h=20, units="galactic"
+    ),
+    "triaxialhernquist": lambda: gp.TriaxialHernquistPotential(
+        m_tot=1e11, r_s=2, q1=0.8, q2=0.6, units="galactic"
+    ),
+    "nfw": lambda: gp.NFWPotential(m=1e12, r_s=15, units="galactic"),
+    "kuzmin": lambda: gp.KuzminPotential(m_tot=1e11, a=3, units="galactic"),
+    "miyamotonagai": lambda: gp.MiyamotoNagaiPotential(
+        m_tot=1e11, a=3, b=0.3, units="galactic"
+    ),
+    "mn3exponential": lambda: gp.MN3ExponentialPotential(
+        m_tot=1e11, h_R=3, h_z=0.3, units="galactic"
+    ),
+    "mn3sech2": lambda: gp.MN3Sech2Potential(
+        m_tot=1e11, h_R=3, h_z=0.3, positive_density=True, units="galactic"
+    ),
+    "satoh": lambda: gp.SatohPotential(m_tot=1e11, a=3, b=0.5, units="galactic"),
+    "logarithmic": lambda: gp.LogarithmicPotential(
+        v_c=u.Quantity(220, "km/s"), r_s=8, units="galactic"
+    ),
+    "lmj09logarithmic": lambda: gp.LMJ09LogarithmicPotential(
+        v_c=u.Quantity(220, "km/s"),
+        r_s=8,
+        q1=1.4,
+        q2=1.0,
+        q3=1.2,
+        phi=u.Quantity(30, "deg"),
+        units="galactic",
+    ),
+    "harmonicoscillator": lambda: gp.HarmonicOscillatorPotential(
+        omega=u.Quantity(0.1, "1/Myr"), units="galactic"
+    ),
+    "henonheiles": lambda: gp.HenonHeilesPotential(
+        coeff=u.Quantity(0.3, "1/kpc"), timescale=u.Quantity(5, "Myr"), units="galactic"
+    ),
+}
+
+
+@pytest.fixture(params=list(POTENTIALS))
+def pot(request: pytest.FixtureRequest) -> gp.AbstractPotential:
+    return POTENTIALS[request.param]()
+
+
+@pytest.fixture
+def q() -> u.Quantity["length"]:
+    return u.Quantity(
+        [[1.0, 2.0, 3.0], [-4.0, 0.5, -0.2], [7.0, -8.0, 1.5], [0.3, 0.1, 0.05]],
+        "kpc",
+    )
+
+
+@pytest.fixture
+def t() -> u.Quantity["time"]:
+    return u.Quantity([0.0, 10.0, 200.0, 1_000.0], "Myr")
+
+
+def test_gradient(pot: gp.AbstractPotential, q, t) -> None:
+    """Test the closed-form gradient against autodiff."""
+    got = pot._gradient(q, t)
+    exp = gp.AbstractPotential._gradient(pot, q, t)
+    unit = pot.units["acceleration"]
+    assert got.shape == exp.shape
+    assert jnp.allclose(got.ustrip(unit), exp.ustrip(unit), rtol=1e-10, atol=1e-14)
+
+
+def test_gradient_broadcast(pot: gp.AbstractPotential, q) -> None:
+    """Test the gradient broadcasts a scalar time against a batch of positions."""
+    t0 = u.Quantity(0.0, "Myr")
+    got = pot._gradient(q, t0)
+    exp = gp.AbstractPotential._gradient(pot, q, t0)
+    unit = pot.units["acceleration"]
+    assert jnp.allclose(got.ustrip(unit), exp.ustrip(unit), rtol=1e-10, atol=1e-14)
+
+
+def test_hessian(pot: gp.AbstractPotential, q, t) -> None:
+    """Test the closed-form Hessian against autodiff."""
+    got = pot._hessian(q, t)
+    exp = gp.AbstractPotential._hessian(pot, q, t)
+    unit = pot.units["frequency drift"]
+    assert got.shape == exp.shape
+    assert jnp.allclose(got.ustrip(unit), exp.ustrip(unit), rtol=1e-8, atol=1e-12)
+
+
+def test_density(pot: gp.AbstractPotential, q, t) -> None:
+    """Test the closed-form density against the autodiff Laplacian."""
+    got = pot._density(q, t)
+    exp = gp.AbstractPotential._density(pot, q, t)
+    unit = pot.units["mass density"]
+    assert got.shape == exp.shape
+    # The Laplacian of the discs is a small difference of large numbers.
+    assert jnp.allclose(got.ustrip(unit), exp.ustrip(unit), rtol=1e-6, atol=1e-3)
@@ -0,0 +1,178 @@
+"""Tests for `galax.potential.CylSplinePotential`."""
+
+from typing import Any, ClassVar
+
+import pytest
+from plum import convert
+
+import quaxed.numpy as jnp
+import unxt as u
+import unxt.unitsystems as usx
+
+import galax.potential as gp
+from ..test_core import AbstractSinglePotential_Test
+
+
+class TestCylSplinePotential(AbstractSinglePotential_Test):
+    """Test the `galax.potential.CylSplinePotential` class."""
+
+    HAS_GALA_COUNTERPART: ClassVar[bool] = False
+
+    @pytest.fixture(scope="class")
+    def pot_cls(self) -> type[gp.CylSplinePotential]:
+        return gp.CylSplinePotential
+
+    @pytest.fixture(scope="class")
+    def original(
+        self, field_units: usx.AbstractUnitSystem
+    ) -> gp.MiyamotoNagaiPotential:
+        return gp.MiyamotoNagaiPotential(
+            m_tot=u.Quantity(6e10, "Msun"),
+            a=u.Quantity(3, "kpc"),
+            b=u.Quantity(0.5, "kpc"),
+            units=field_units,
+        )
+
+    @pytest.fixture(scope="class")
+    def fields_(
+        self, original: gp.MiyamotoNagaiPotential, field_units: usx.AbstractUnitSystem
+    ) -> dict[str, Any]:
+        cpot = gp.CylSplinePotential.from_potential(
+            original, R_max=100, z_max=100, R_scale=3, z_scale=0.5, check=False
+        )
+        return {
+            "R": cpot.R,
+            "z": cpot.z,
+            "values": cpot.values,
+            "R_scale": cpot.R_scale,
+            "z_scale": cpot.z_scale,
+            "units": field_units,
+        }
+
+    # ==========================================================================
+
+    def test_init_shape_check(self, fields: dict[str, Any]) -> None:
+        """Test that the table must match the grid."""
+        fields["values"] = fields["values"][..., :-1]
+        with pytest.raises(ValueError, match="values must have shape"):
+            gp.CylSplinePotential(**fields)
+
+    def test_from_potential_error_report(
+        self, original: gp.MiyamotoNagaiPotential
+    ) -> None:
+        """Test the error report saved by `from_potential`."""
+        cpot = gp.CylSplinePotential.from_potential(
+            original, R_max=100, z_max=100, R_scale=3, z_scale=0.5
+        )
+        assert cpot.error_report["potential_median"] < 1e-6
+        assert cpot.error_report["gradient_median"] < 1e-5
+
+    def test_axis_and_extrapolation(
+        self, pot: gp.CylSplinePotential, original: gp.MiyamotoNagaiPotential
+    ) -> None:
+        """Test the potential on the axis and outside the grid."""
+        q = u.Quantity([[0.0, 0.0, 0.0], [0.0, 0.0, 2.0], [300.0, 0.0, 0.0]], "kpc")
+        expect = original.potential(q, t=0)
+        assert jnp.allclose(
+            pot.potential(q, t=0), expect, rtol=1e-3, atol=u.Quantity(0, expect.unit)
+        )
+        # The force on the axis is finite and along it.
+        acc = convert(pot.acceleration(q[:2], t=0), u.Quantity)
+        assert jnp.all(jnp.isfinite(acc.value))
+        assert jnp.allclose(
+            acc[:, :2], u.Quantity(0, acc.unit), atol=u.Quantity(1e-14, acc.unit)
+        )
+
+    def test_non_axisymmetric(self, field_units: usx.AbstractUnitSystem) -> None:
+        """Test a bar with azimuthal harmonics."""
+        bar = gp.LongMuraliBarPotential(
+            m_tot=u.Quantity(1e10, "Msun"),
+            a=u.Quantity(4, "kpc"),
+            b=u.Quantity(1, "kpc"),
+            c=u.Quantity(1, "kpc"),
+            alpha=u.Quantity(0.3, "rad"),
+            units=field_units,
+        )
+        cpot = gp.CylSplinePotential.from_potential(
+            bar, R_max=100, z_max=100, R_scale=2, z_scale=1, m_max=8, check=False
+        )
+        assert cpot.m_max == 8
+        q = u.Quantity([[1.0, 2.0, 0.5], [-3.0, 1.0, -1.0], [5.0, -6.0, 2.0]], "kpc")
+        expect = bar.potential(q, t=0)
+        assert jnp.allclose(
+            cpot.potential(q, t=0), expect, rtol=1e-3, atol=u.Quantity(0, expect.unit)
+        )
+
+    def test_from_density(
+        self,
+        original: gp.MiyamotoNagaiPotential,
+        field_units: usx.AbstractUnitSystem,
+    ) -> None:
+        """Test solving for the potential of a density."""
+        cpot = gp.CylSplinePotential.from_density(
+            original,
+            R_max=200,
+            z_max=200,
+            R_scale=3,
+            z_scale=0.5,
+            n_R=33,
+            n_z=65,
+            units=field_units,
+        )
+        q = u.Quantity([[1.3, 2.2, 0.7], [8.0, 0.0, 0.1], [0.0, 0.0, 3.0]], "kpc")
+        expect = original.potential(q, t=0)
+        assert jnp.allclose(
+            cpot.potential(q, t=0), expect, rtol=5e-3, atol=u.Quantity(0, expect.unit)
+        )
+        expect = convert(original.gradient(q, t=0), u.Quantity)
+        got = convert(cpot.gradient(q, t=0), u.Quantity)
+        assert jnp.allclose(got, expect, rtol=5e-3, atol=u.Quantity(1e-6, expect.unit))
+
+    # ==========================================================================
+
+    def test_potential(
+        self, pot: gp.CylSplinePotential, original: gp.MiyamotoNagaiPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 0.7], "kpc")
+        expect = original.potential(q, t=0)
+        assert jnp.isclose(
+            pot.potential(q, t=0), expect, rtol=1e-6, atol=u.Quantity(0, expect.unit)
+        )
+
+    def test_gradient(
+        self, pot: gp.CylSplinePotential, original: gp.MiyamotoNagaiPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 0.7], "kpc")
+        expect = convert(original.gradient(q, t=0), u.Quantity)
+        got = convert(pot.gradient(q, t=0), u.Quantity)
+        assert jnp.allclose(got, expect, rtol=1e-5, atol=u.Quantity(0, expect.unit))
+
+    def test_density(
+        self, pot: gp.CylSplinePotential, original: gp.MiyamotoNagaiPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 0.7], "kpc")
+        expect = original.density(q, t=0)
+        assert jnp.isclose(
+            pot.density(q, t=0), expect, rtol=1e-2, atol=u.Quantity(0, expect.unit)
+        )
+
+    def test_hessian(
+        self, pot: gp.CylSplinePotential, original: gp.MiyamotoNagaiPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 0.7], "kpc")
+        expect = original.hessian(q, t=0)
+        assert jnp.allclose(
+            pot.hessian(q, t=0), expect, atol=u.Quantity(1e-5, expect.unit)
+        )
+
+    # ---------------------------------
+    # Convenience methods
+
+    def test_tidal_tensor(
+        self, pot: gp.CylSplinePotential, original: gp.MiyamotoNagaiPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 0.7], "kpc")
+        expect = original.tidal_tensor(q, t=0)
+        assert jnp.allclose(
+            pot.tidal_tensor(q, t=0), expect, atol=u.Quantity(1e-5, expect.unit)
+        )
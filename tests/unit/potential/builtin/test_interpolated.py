@@ -0,0 +1,134 @@
+"""Tests for `galax.potential.InterpolatedPotential`."""
+
+from typing import Any, ClassVar
+
+import pytest
+from plum import convert
+
+import quaxed.numpy as jnp
+import unxt as u
+import unxt.unitsystems as usx
+
+import galax.potential as gp
+from ..test_core import AbstractSinglePotential_Test
+
+
+class TestInterpolatedPotential(AbstractSinglePotential_Test):
+    """Test the `galax.potential.InterpolatedPotential` class."""
+
+    HAS_GALA_COUNTERPART: ClassVar[bool] = False
+
+    @pytest.fixture(scope="class")
+    def pot_cls(self) -> type[gp.InterpolatedPotential]:
+        return gp.InterpolatedPotential
+
+    @pytest.fixture(scope="class")
+    def original(self, field_units: usx.AbstractUnitSystem) -> gp.HernquistPotential:
+        return gp.HernquistPotential(
+            m_tot=u.Quantity(1e12, "Msun"), r_s=u.Quantity(5, "kpc"), units=field_units
+        )
+
+    @pytest.fixture(scope="class")
+    def fields_(
+        self, original: gp.HernquistPotential, field_units: usx.AbstractUnitSystem
+    ) -> dict[str, Any]:
+        nodes = u.Quantity(jnp.linspace(-12, 12, 25), "kpc")
+        ipot = gp.InterpolatedPotential.from_potential(original, nodes, check=False)
+        return {
+            "x": ipot.x,
+            "y": ipot.y,
+            "z": ipot.z,
+            "derivs": ipot.derivs,
+            "units": field_units,
+        }
+
+    # ==========================================================================
+
+    def test_init_shape_check(self, fields: dict[str, Any]) -> None:
+        """Test that the derivative table must match the grid."""
+        fields["derivs"] = fields["derivs"][:-1]
+        with pytest.raises(ValueError, match="derivs must have shape"):
+            gp.InterpolatedPotential(**fields)
+
+    def test_from_potential_error_report(self, original: gp.HernquistPotential) -> None:
+        """Test the error report saved by `from_potential`."""
+        nodes = u.Quantity(jnp.linspace(-12, 12, 25), "kpc")
+        ipot = gp.InterpolatedPotential.from_potential(original, nodes)
+        assert set(ipot.error_report) == {
+            "potential_max",
+            "potential_median",
+            "gradient_max",
+            "gradient_median",
+        }
+        assert ipot.error_report["potential_median"] < 1e-6
+        assert ipot.error_report["gradient_median"] < 1e-4
+
+        # Refining the grid reduces the error.
+        fine = u.Quantity(jnp.linspace(-12, 12, 49), "kpc")
+        fpot = gp.InterpolatedPotential.from_potential(original, fine)
+        assert fpot.error_report["potential_max"] < ipot.error_report["potential_max"]
+
+    def test_nodes_exact(
+        self, pot: gp.InterpolatedPotential, original: gp.HernquistPotential
+    ) -> None:
+        """Test the interpolant reproduces the tabulated values at the nodes."""
+        q = u.Quantity([[1.0, -2.0, 3.0], [11.0, 0.0, -5.0]], "kpc")
+        assert jnp.allclose(
+            pot.potential(q, t=0),
+            original.potential(q, t=0),
+            atol=u.Quantity(1e-12, "kpc2/Myr2"),
+        )
+        assert jnp.allclose(
+            convert(pot.gradient(q, t=0), u.Quantity),
+            convert(original.gradient(q, t=0), u.Quantity),
+            atol=u.Quantity(1e-12, "kpc/Myr2"),
+        )
+
+    # ==========================================================================
+
+    def test_potential(
+        self, pot: gp.InterpolatedPotential, original: gp.HernquistPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 3.7], "kpc")
+        expect = original.potential(q, t=0)
+        assert jnp.isclose(
+            pot.potential(q, t=0), expect, rtol=1e-4, atol=u.Quantity(0, expect.unit)
+        )
+
+    def test_gradient(
+        self, pot: gp.InterpolatedPotential, original: gp.HernquistPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 3.7], "kpc")
+        expect = convert(original.gradient(q, t=0), u.Quantity)
+        got = convert(pot.gradient(q, t=0), u.Quantity)
+        assert jnp.allclose(got, expect, rtol=1e-3, atol=u.Quantity(0, expect.unit))
+
+    def test_density(
+        self, pot: gp.InterpolatedPotential, original: gp.HernquistPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 3.7], "kpc")
+        expect = original.density(q, t=0)
+        assert jnp.isclose(
+            pot.density(q, t=0), expect, rtol=3e-2, atol=u.Quantity(0, expect.unit)
+        )
+
+    def test_hessian(
+        self, pot: gp.InterpolatedPotential, original: gp.HernquistPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 3.7], "kpc")
+        expect = original.hessian(q, t=0)
+        assert jnp.allclose(
+            pot.hessian(q, t=0), expect, atol=u.Quantity(1e-4, expect.unit)
+        )
+
+    # ---------------------------------
+    # Convenience methods
+
+    def test_tidal_tensor(
+        self, pot: gp.InterpolatedPotential, original: gp.HernquistPotential
+    ) -> None:
+        q = u.Quantity([1.3, 2.2, 3.7], "kpc")
+        expect = original.tidal_tensor(q, t=0)
+        assert jnp.allclose(
+            pot.tidal_tensor(q, t=0), expect, atol=u.Quantity(1e-4, expect.unit)
+        )
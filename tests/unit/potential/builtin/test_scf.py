@@ -0,0 +1,193 @@
+"""Tests for `galax.potential.SCFPotential`."""
+
+import re
+from typing import Any, ClassVar
+from typing_extensions import override
+
+import numpy as np
+import pytest
+from jaxtyping import Array, Shaped
+from plum import convert
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+import galax.typing as gt
+from ..test_core import AbstractSinglePotential_Test
+from .test_common import ParameterMTotMixin, ParameterScaleRadiusMixin
+
+
+class TestSCFPotential(
+    AbstractSinglePotential_Test,
+    # Parameters
+    ParameterMTotMixin,
+    ParameterScaleRadiusMixin,
+):
+    """Test the `galax.potential.SCFPotential` class."""
+
+    HAS_GALA_COUNTERPART: ClassVar[bool] = False
+
+    @pytest.fixture(scope="class")
+    @override
+    def pot_cls(self) -> type[gp.SCFPotential]:
+        return gp.SCFPotential
+
+    @pytest.fixture(scope="class")
+    def field_Snlm(self) -> Shaped[Array, "3 3 3"]:
+        """Snlm parameter: a Hernquist sphere plus a quadrupole."""
+        Snlm = jnp.zeros((3, 3, 3)).at[0, 0, 0].set(jnp.sqrt(4 * jnp.pi))
+        return Snlm.at[1, 2, 1].set(0.3)
+
+    @pytest.fixture(scope="class")
+    def field_Tnlm(self) -> Shaped[Array, "3 3 3"]:
+        """Tnlm parameter."""
+        return jnp.zeros((3, 3, 3)).at[2, 1, 1].set(-0.2)
+
+    @pytest.fixture(scope="class")
+    @override
+    def fields_(
+        self,
+        field_m_tot: u.Quantity,
+        field_r_s: u.Quantity,
+        field_Snlm: Shaped[Array, "3 3 3"],
+        field_Tnlm: Shaped[Array, "3 3 3"],
+        field_units: u.AbstractUnitSystem,
+    ) -> dict[str, Any]:
+        return {
+            "m_tot": field_m_tot,
+            "r_s": field_r_s,
+            "Snlm": field_Snlm,
+            "Tnlm": field_Tnlm,
+            "n_max": 2,
+            "l_max": 2,
+            "units": field_units,
+        }
+
+    # ==========================================================================
+
+    def test_check_init(
+        self, pot_cls: type[gp.SCFPotential], fields: dict[str, Any]
+    ) -> None:
+        """Test the `SCFPotential.__check_init__` method."""
+        fields["Snlm"] = fields["Snlm"][:, ::2]  # make it the wrong shape
+        match = re.escape("Snlm and Tnlm must have the shape")
+        with pytest.raises(ValueError, match=match):
+            pot_cls(**fields)
+
+    def test_density_closed_form(
+        self, pot: gp.SCFPotential, batchx: gt.BtQuSz3
+    ) -> None:
+        """Test the basis density against the Laplacian of the potential."""
+        expect = gp.AbstractPotential._density(pot, batchx, u.Quantity(0.0, "Myr"))
+        assert jnp.allclose(
+            pot.density(batchx, t=0),
+            expect,
+            rtol=1e-10,
+            atol=u.Quantity(0, expect.unit),
+        )
+
+    def test_from_density(self, field_units: u.AbstractUnitSystem) -> None:
+        """Test fitting an analytic density."""
+        plummer = gp.PlummerPotential(
+            m_tot=u.Quantity(1e11, "Msun"), b=u.Quantity(2, "kpc"), units=field_units
+        )
+        pot = gp.SCFPotential.from_density(
+            plummer, n_max=10, l_max=0, r_s=u.Quantity(2, "kpc"), units=field_units
+        )
+        assert jnp.isclose(
+            pot.m_tot(0),
+            u.Quantity(1e11, "Msun"),
+            rtol=1e-3,
+            atol=u.Quantity(0, "Msun"),
+        )
+
+        q = u.Quantity([[0.5, 0.0, 0.0], [1.0, 2.0, 3.0], [10.0, -5.0, 20.0]], "kpc")
+        expect = plummer.potential(q, t=0)
+        assert jnp.allclose(
+            pot.potential(q, t=0), expect, rtol=1e-4, atol=u.Quantity(0, expect.unit)
+        )
+
+    def test_from_particles(self, field_units: u.AbstractUnitSystem) -> None:
+        """Test fitting an N-body snapshot."""
+        rng = np.random.default_rng(0)
+        x = np.sqrt(rng.uniform(size=50_000))
+        r = x / (1 - x)  # Hernquist sphere with a = 1 kpc
+        d = rng.normal(size=(50_000, 3))
+        q = r[:, None] * d / np.linalg.norm(d, axis=-1, keepdims=True)
+        q = q * np.array([1.0, 0.8, 0.6])  # squash it
+        m = np.full(50_000, 2e7)
+
+        pot = gp.SCFPotential.from_particles(
+            u.Quantity(q, "kpc"),
+            u.Quantity(m, "Msun"),
+            n_max=6,
+            l_max=4,
+            r_s=u.Quantity(1, "kpc"),
+            units=field_units,
+        )
+        assert jnp.isclose(
+            pot.m_tot(0), u.Quantity(1e12, "Msun"), atol=u.Quantity(1, "Msun")
+        )
+
+        # The flattening shows up in the quadrupole terms.
+        Snlm = pot.Snlm(0)
+        assert Snlm[0, 2, 0] < 0  # flattened along z
+        assert Snlm[0, 2, 2] > 0  # elongated along x
+
+        # The coefficients do not depend on the chunking.
+        chunked = gp.SCFPotential.from_particles(
+            q, m, n_max=6, l_max=4, r_s=1, units=field_units, chunk_size=7_777
+        )
+        assert jnp.allclose(chunked.Snlm(0), Snlm, atol=1e-12)
+
+    # ==========================================================================
+
+    def test_potential(self, pot: gp.SCFPotential, x: gt.QuSz3) -> None:
+        expect = u.Quantity(-0.98142174, "kpc2 / Myr2")
+        assert jnp.isclose(
+            pot.potential(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+        )
+
+    def test_gradient(self, pot: gp.SCFPotential, x: gt.QuSz3) -> None:
+        expect = u.Quantity(
+            [0.06165901, 0.08621764, 0.16284456], pot.units["acceleration"]
+        )
+        got = convert(pot.gradient(x, t=0), u.Quantity)
+        assert jnp.allclose(got, expect, atol=u.Quantity(1e-8, expect.unit))
+
+    def test_density(self, pot: gp.SCFPotential, x: gt.QuSz3) -> None:
+        expect = u.Quantity(5.84349899e08, "Msun / kpc3")
+        assert jnp.isclose(
+            pot.density(x, t=0), expect, atol=u.Quantity(1e-2, expect.unit)
+        )
+
+    def test_hessian(self, pot: gp.SCFPotential, x: gt.QuSz3) -> None:
+        expect = u.Quantity(
+            [
+                [0.04059094, -0.02059972, -0.0302112],
+                [-0.02059972, 0.02203399, -0.05114436],
+                [-0.0302112, -0.05114436, -0.02959173],
+            ],
+            "1/Myr2",
+        )
+        assert jnp.allclose(
+            pot.hessian(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+        )
+
+    # ---------------------------------
+    # Convenience methods
+
+    def test_tidal_tensor(self, pot: gp.AbstractPotential, x: gt.QuSz3) -> None:
+        """Test the `AbstractPotential.tidal_tensor` method."""
+        expect = u.Quantity(
+            [
+                [0.02957984, -0.02059972, -0.0302112],
+                [-0.02059972, 0.01102289, -0.05114436],
+                [-0.0302112, -0.05114436, -0.04060283],
+            ],
+            "1/Myr2",
+        )
+        assert jnp.allclose(
+            pot.tidal_tensor(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+        )
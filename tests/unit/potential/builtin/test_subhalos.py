@@ -0,0 +1,212 @@
+"""Tests for `galax.potential.SubhaloPopulationPotential`."""
+
+import dataclasses
+import functools
+import operator
+from typing import Any, ClassVar
+
+import numpy as np
+import pytest
+from plum import convert
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+import galax.typing as gt
+from ..test_core import AbstractSinglePotential_Test
+
+
+def _sum(xs: Any) -> Any:
+    return functools.reduce(operator.add, xs)
+
+
+class TestSubhaloPopulationPotential(AbstractSinglePotential_Test):
+    """Test the `galax.potential.SubhaloPopulationPotential` class."""
+
+    HAS_GALA_COUNTERPART: ClassVar[bool] = False
+
+    @pytest.fixture(scope="class")
+    def pot_cls(self) -> type[gp.SubhaloPopulationPotential]:
+        return gp.SubhaloPopulationPotential
+
+    @pytest.fixture(scope="class")
+    def profiles(self, field_units: u.AbstractUnitSystem) -> list[gp.PlummerPotential]:
+        rng = np.random.default_rng(1)
+        return [
+            gp.PlummerPotential(
+                m_tot=u.Quantity(m, "Msun"), b=u.Quantity(b, "kpc"), units=field_units
+            )
+            for m, b in zip(
+                rng.uniform(1e8, 1e9, 20), rng.uniform(0.2, 1.0, 20), strict=True
+            )
+        ]
+
+    @pytest.fixture(scope="class")
+    def times(self) -> u.Quantity["time"]:
+        return u.Quantity([-10.0, 0.0, 10.0], "Myr")
+
+    @pytest.fixture(scope="class")
+    def orbits(self, times: u.Quantity["time"]) -> u.Quantity["length"]:
+        rng = np.random.default_rng(2)
+        x0 = rng.uniform(-5, 5, size=(20, 3))
+        v = rng.normal(0, 0.03, size=(20, 3))
+        return u.Quantity(x0[:, None] + v[:, None] * times.value[:, None], "kpc")
+
+    @pytest.fixture(scope="class")
+    def fields_(
+        self,
+        profiles: list[gp.PlummerPotential],
+        times: u.Quantity["time"],
+        orbits: u.Quantity["length"],
+    ) -> dict[str, Any]:
+        # Cells larger than the population, so every subhalo is summed exactly.
+        pot = gp.SubhaloPopulationPotential.from_trajectories(
+            profiles, times, orbits, cell_size=u.Quantity(20, "kpc")
+        )
+        return {f.name: getattr(pot, f.name) for f in dataclasses.fields(pot)}
+
+    def direct(
+        self,
+        method: str,
+        profiles: list[gp.PlummerPotential],
+        orbits: u.Quantity["length"],
+        q: gt.QuSz3,
+        t: u.Quantity["time"],
+    ) -> Any:
+        """Sum ``method`` over the subhalos at time ``t`` in [-10, 0] Myr."""
+        frac = u.ustrip("", (t - u.Quantity(-10, "Myr")) / u.Quantity(10, "Myr"))
+        pos = orbits[:, 0] + frac * (orbits[:, 1] - orbits[:, 0])
+        return _sum(
+            convert(getattr(p, method)(q - x, t), u.Quantity)
+            for p, x in zip(profiles, pos, strict=True)
+        )
+
+    # ==========================================================================
+
+    def test_from_trajectories_errors(
+        self,
+        profiles: list[gp.PlummerPotential],
+        times: u.Quantity["time"],
+        orbits: u.Quantity["length"],
+    ) -> None:
+        """Test the input checks of `from_trajectories`."""
+        with pytest.raises(ValueError, match="must have shape"):
+            gp.SubhaloPopulationPotential.from_trajectories(
+                profiles[:-1], times, orbits, cell_size=u.Quantity(20, "kpc")
+            )
+        with pytest.raises(ValueError, match="Add knots or increase"):
+            gp.SubhaloPopulationPotential.from_trajectories(
+                profiles, times, orbits, cell_size=u.Quantity(0.1, "kpc")
+            )
+
+    def test_moving(
+        self,
+        pot: gp.SubhaloPopulationPotential,
+        profiles: list[gp.PlummerPotential],
+        orbits: u.Quantity["length"],
+        batchx: gt.BtQuSz3,
+    ) -> None:
+        """Test the subhalos follow their trajectories between knots."""
+        t = u.Quantity(-3.0, "Myr")
+        expect = self.direct("potential", profiles, orbits, batchx, t)
+        assert jnp.allclose(
+            pot.potential(batchx, t), expect, atol=u.Quantity(1e-14, expect.unit)
+        )
+
+    def test_culling(
+        self,
+        profiles: list[gp.PlummerPotential],
+        times: u.Quantity["time"],
+        orbits: u.Quantity["length"],
+    ) -> None:
+        """Test the far field with cells smaller than the population."""
+        q = u.Quantity([[0.5, -1.0, 2.0], [4.0, 4.0, -4.0], [20.0, 0.0, 0.0]], "kpc")
+        t = u.Quantity(-3.0, "Myr")
+        expect = self.direct("potential", profiles, orbits, q, t)
+
+        pot = gp.SubhaloPopulationPotential.from_trajectories(
+            profiles, times, orbits, cell_size=u.Quantity(3, "kpc")
+        )
+        assert pot.n_cells != (1, 1, 1)
+        assert jnp.allclose(
+            pot.potential(q, t), expect, rtol=1e-2, atol=u.Quantity(0, expect.unit)
+        )
+
+        # Without the far field, the distant subhalos are neglected.
+        near = gp.SubhaloPopulationPotential.from_trajectories(
+            profiles, times, orbits, cell_size=u.Quantity(3, "kpc"), far_field=False
+        )
+        phi = near.potential(q, t)
+        assert jnp.all(phi > expect)
+        assert phi[-1] == u.Quantity(0, expect.unit)  # outside the grid
+
+    # ==========================================================================
+
+    def test_potential(
+        self,
+        pot: gp.SubhaloPopulationPotential,
+        profiles: list[gp.PlummerPotential],
+        orbits: u.Quantity["length"],
+        x: gt.QuSz3,
+    ) -> None:
+        t = u.Quantity(0.0, "Myr")
+        expect = self.direct("potential", profiles, orbits, x, t)
+        assert jnp.isclose(
+            pot.potential(x, t), expect, atol=u.Quantity(1e-14, expect.unit)
+        )
+
+    def test_gradient(
+        self,
+        pot: gp.SubhaloPopulationPotential,
+        profiles: list[gp.PlummerPotential],
+        orbits: u.Quantity["length"],
+        x: gt.QuSz3,
+    ) -> None:
+        t = u.Quantity(0.0, "Myr")
+        expect = self.direct("gradient", profiles, orbits, x, t)
+        got = convert(pot.gradient(x, t), u.Quantity)
+        assert jnp.allclose(got, expect, atol=u.Quantity(1e-14, expect.unit))
+
+    def test_density(
+        self,
+        pot: gp.SubhaloPopulationPotential,
+        profiles: list[gp.PlummerPotential],
+        orbits: u.Quantity["length"],
+        x: gt.QuSz3,
+    ) -> None:
+        t = u.Quantity(0.0, "Myr")
+        expect = self.direct("density", profiles, orbits, x, t)
+        assert jnp.isclose(
+            pot.density(x, t), expect, rtol=1e-8, atol=u.Quantity(0, expect.unit)
+        )
+
+    def test_hessian(
+        self,
+        pot: gp.SubhaloPopulationPotential,
+        profiles: list[gp.PlummerPotential],
+        orbits: u.Quantity["length"],
+        x: gt.QuSz3,
+    ) -> None:
+        t = u.Quantity(0.0, "Myr")
+        expect = self.direct("hessian", profiles, orbits, x, t)
+        assert jnp.allclose(
+            pot.hessian(x, t), expect, atol=u.Quantity(1e-14, expect.unit)
+        )
+
+    # ---------------------------------
+    # Convenience methods
+
+    def test_tidal_tensor(
+        self,
+        pot: gp.SubhaloPopulationPotential,
+        profiles: list[gp.PlummerPotential],
+        orbits: u.Quantity["length"],
+        x: gt.QuSz3,
+    ) -> None:
+        """Test the `AbstractPotential.tidal_tensor` method."""
+        t = u.Quantity(0.0, "Myr")
+        expect = self.direct("tidal_tensor", profiles, orbits, x, t)
+        assert jnp.allclose(
+            pot.tidal_tensor(x, t), expect, atol=u.Quantity(1e-14, expect.unit)
+        )
@@ -2,13 +2,20 @@
 
 from typing import Any, Generic, TypeVar
 
+import jax
 import pytest
 
 import quaxed.numpy as jnp
 import unxt as u
 
+import galax.potential as gp
 from galax.potential._src.params.core import ParameterCallable
-from galax.potential.params import AbstractParameter, ConstantParameter, UserParameter
+from galax.potential.params import (
+    AbstractParameter,
+    ConstantParameter,
+    InterpolatedParameter,
+    UserParameter,
+)
 from galax.typing import Unit
 
 T = TypeVar("T", bound=AbstractParameter)
@@ -88,6 +95,87 @@ class TestConstantParameter(TestAbstractParameter[ConstantParameter]):
 ##############################################################################
 
 
+class TestInterpolatedParameter(TestAbstractParameter[InterpolatedParameter]):
+    """Test the `galax.potential.InterpolatedParameter` class."""
+
+    @pytest.fixture(scope="class")
+    def param_cls(self) -> type[T]:
+        return InterpolatedParameter
+
+    @pytest.fixture(scope="class")
+    def field_times(self) -> u.Quantity["time"]:
+        return u.Quantity([0.0, 1.0, 1.5, 3.0, 4.0], "Gyr")
+
+    @pytest.fixture(scope="class")
+    def field_values(self, field_times: u.Quantity, field_unit: Unit) -> u.Quantity:
+        t = field_times.value
+        return u.Quantity(jnp.stack([t, t**3], axis=-1), field_unit)
+
+    @pytest.fixture(scope="class")
+    def param(
+        self, param_cls: type[T], field_times: u.Quantity, field_values: u.Quantity
+    ) -> T:
+        return param_cls(field_times, field_values)
+
+    # ===============================================================
+
+    def test_init_errors(self, param_cls: type[T], field_times, field_values) -> None:
+        """Test the shape and method checks."""
+        with pytest.raises(ValueError, match="times must have shape"):
+            param_cls(field_times, field_values[:-1])
+        with pytest.raises(ValueError, match="method must be"):
+            param_cls(field_times, field_values, method="quintic")
+
+    def test_call(self, param: T, field_times, field_values) -> None:
+        """Test `galax.potential.InterpolatedParameter` call method."""
+        # The knots are reproduced.
+        assert jnp.allclose(
+            param(field_times), field_values, atol=u.Quantity(1e-12, "km")
+        )
+        # Output shape is the batch shape followed by the value shape.
+        assert param(u.Quantity(2.0, "Gyr")).shape == (2,)
+        assert param(u.Quantity([[0.5, 2.0]], "Gyr")).shape == (1, 2, 2)
+        # The linear component is interpolated exactly.
+        assert jnp.allclose(
+            param(u.Quantity(2_500.0, "Myr"))[0],
+            u.Quantity(2.5, "km"),
+            atol=u.Quantity(1e-12, "km"),
+        )
+        # Outside the knots the values are held constant.
+        assert jnp.array_equal(param(u.Quantity(10.0, "Gyr")), field_values[-1])
+
+    def test_call_linear(self, param_cls: type[T], field_times, field_values) -> None:
+        """Test linear interpolation."""
+        param = param_cls(field_times, field_values, method="linear")
+        got = param(u.Quantity(2.0, "Gyr"))
+        expect = u.Quantity([2.0, 3.375 + (27 - 3.375) / 3], "km")
+        assert jnp.allclose(got, expect, atol=u.Quantity(1e-12, "km"))
+
+    def test_continuity(self, param: T) -> None:
+        """Test the cubic spline is C2 at an interior knot."""
+        d2 = jax.hessian(lambda t: param(u.Quantity(t, "Gyr")).value[1])
+        assert jnp.allclose(d2(1.5 - 1e-9), d2(1.5 + 1e-9), atol=1e-6)
+
+    def test_in_potential(self, field_times: u.Quantity) -> None:
+        """Test time-dependent expansion coefficients in a potential."""
+        Slm = jnp.zeros((5, 3, 3)).at[:, 0, 0].set(jnp.linspace(1, 2, 5))
+        pot = gp.MultipoleInnerPotential(
+            m_tot=u.Quantity(1e11, "Msun"),
+            r_s=u.Quantity(1, "kpc"),
+            l_max=2,
+            Slm=InterpolatedParameter(field_times, u.Quantity(Slm, "")),
+            Tlm=jnp.zeros((3, 3)),
+            units="galactic",
+        )
+        q = u.Quantity([1.0, 2.0, 3.0], "kpc")
+        phi0 = pot.potential(q, u.Quantity(0.0, "Gyr"))
+        phi1 = pot.potential(q, u.Quantity(4.0, "Gyr"))
+        assert jnp.allclose(phi1, 2 * phi0, atol=u.Quantity(1e-12, phi0.unit))
+
+
+##############################################################################
+
+
 class TestParameterCallable:
     """Test the `galax.potential.ParameterCallable` class."""
 
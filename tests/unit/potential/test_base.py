@@ -157,6 +157,18 @@ class AbstractPotential_Test(GalaIOMixin, metaclass=ABCMeta):
         grad = convert(pot.gradient(x, t=0), u.Quantity)
         assert jnp.array_equal(acc, -grad)
 
+    def test_potential_and_gradient(
+        self, pot: gp.AbstractPotential, x: gt.QuSz3
+    ) -> None:
+        """Test the `AbstractPotential.potential_and_gradient` method."""
+        phi, grad = pot.potential_and_gradient(x, t=0)
+        exp_phi = pot.potential(x, t=0)
+        exp_grad = convert(pot.gradient(x, t=0), u.Quantity)
+        assert jnp.allclose(phi, exp_phi, atol=u.Quantity(1e-10, exp_phi.unit))
+        assert jnp.allclose(
+            convert(grad, u.Quantity), exp_grad, atol=u.Quantity(1e-10, exp_grad.unit)
+        )
+
     # ---------------------------------
     # Convenience methods
 
@@ -138,3 +138,31 @@ class TestAbstractSinglePotential(AbstractSinglePotential_Test):
         assert jnp.allclose(
             pot.tidal_tensor(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
         )
+
+
+def test_from_values() -> None:
+    """The trusted constructor builds the same pytree as the regular one."""
+    ref = gp.NFWPotential(m=1e12, r_s=15.0, units="galactic")
+    pot = gp.NFWPotential.from_values("galactic", m=1e12, r_s=15.0)  # fills cache
+    pot = gp.NFWPotential.from_values("galactic", m=1e12, r_s=15.0)
+    assert jax.tree.structure(pot) == jax.tree.structure(ref)
+    assert all(
+        a.dtype == b.dtype and a.weak_type == b.weak_type and jnp.array_equal(a, b)
+        for a, b in zip(jax.tree.leaves(pot), jax.tree.leaves(ref), strict=True)
+    )
+
+    # So they share a compiled function.
+    func = jax.jit(lambda p, q, t: p.potential(q, t))
+    q, t = u.Quantity([8.0, 0, 0], "kpc"), u.Quantity(0, "Gyr")
+    func(ref, q, t)
+    pot = gp.NFWPotential.from_values("galactic", m=jnp.asarray(2e12), r_s=10.0)
+    assert func(pot, q, t) == gp.NFWPotential.potential(
+        gp.NFWPotential(m=2e12, r_s=10.0, units="galactic"), q, t
+    )
+    assert func._cache_size() == 1
+
+    # Potentials with derived state use the regular constructor.
+    tri = gp.TriaxialNFWPotential.from_values(
+        "galactic", m=1e12, r_s=15.0, q1=0.8, q2=0.6
+    )
+    assert isinstance(tri, gp.TriaxialNFWPotential)
@@ -2,8 +2,10 @@
 
 from dataclasses import replace
 
+import numpy as np
 from plum import convert
 
+import coordinax as cx
 import quaxed.numpy as jnp
 import unxt as u
 
@@ -74,3 +76,66 @@ def test_bar_means_of_rotation() -> None:
     # TODO: move this test to a more appropriate location
     # Test that the frame's constants are the same as the base potential's
     assert xpot.constants is base_pot.constants
+
+
+def test_transformed_affine() -> None:
+    """Rotations and translations collapse into one cached affine map."""
+    pot = gp.TriaxialHernquistPotential(
+        m_tot=u.Quantity(1e12, "Msun"),
+        r_s=u.Quantity(1, "kpc"),
+        q1=0.8,
+        q2=0.5,
+        units="galactic",
+    )
+    rot = cx.ops.GalileanRotation.from_euler("zyx", u.Quantity([30, 40, 50], "deg"))
+    shift = cx.ops.GalileanSpatialTranslation.from_([3, 1, 0], "kpc")
+    xpot = gp.TransformedPotential(pot, rot | shift | rot)
+    assert xpot._affine is not None
+
+    q = u.Quantity(np.random.default_rng(0).normal(size=(5, 3)), "kpc")
+    t = u.Quantity(0.0, "Myr")
+    qp, _ = xpot.xop.inverse(q, t)
+    assert jnp.allclose(
+        xpot.potential(q, t),
+        pot.potential(qp, t),
+        atol=u.Quantity(1e-14, "kpc2/Myr2"),
+    )
+    assert jnp.allclose(
+        xpot.density(q, t), pot.density(qp, t), atol=u.Quantity(1e-6, "Msun/kpc3")
+    )
+
+    # The rotated-back gradient and hessian match autodiff through the operator.
+    assert jnp.allclose(
+        convert(xpot.gradient(q, t), u.Quantity),
+        gp.AbstractPotential._gradient(xpot, q, t),
+        atol=u.Quantity(1e-14, "kpc/Myr2"),
+    )
+    assert jnp.allclose(
+        xpot.hessian(q, t),
+        gp.AbstractPotential._hessian(xpot, q, t),
+        atol=u.Quantity(1e-14, "1/Myr2"),
+    )
+
+    # Time-dependent operators are not collapsed.
+    op = gc.ops.ConstantRotationZOperator(Omega_z=u.Quantity(90, "deg/Gyr"))
+    assert gp.TransformedPotential(pot, op)._affine is None
+
+
+def test_triaxial_in_the_potential_gradient() -> None:
+    """The scaled gradient and hessian match autodiff."""
+    opot = gp.HernquistPotential(
+        m_tot=u.Quantity(1e12, "Msun"), r_s=u.Quantity(1, "kpc"), units="galactic"
+    )
+    xpot = gp.TriaxialInThePotential(opot, y_over_x=2.0, z_over_x=0.7)
+    q = u.Quantity(np.random.default_rng(0).normal(size=(5, 3)), "kpc")
+    t = u.Quantity(0.0, "Myr")
+    assert jnp.allclose(
+        convert(xpot.gradient(q, t), u.Quantity),
+        gp.AbstractPotential._gradient(xpot, q, t),
+        atol=u.Quantity(1e-14, "kpc/Myr2"),
+    )
+    assert jnp.allclose(
+        xpot.hessian(q, t),
+        gp.AbstractPotential._hessian(xpot, q, t),
+        atol=u.Quantity(1e-14, "1/Myr2"),
+    )
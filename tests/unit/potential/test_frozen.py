@@ -0,0 +1,53 @@
+"""Tests for `galax.potential.freeze`."""
+
+import jax
+import numpy as np
+import pytest
+from plum import convert
+
+import coordinax as cx
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+
+
+@pytest.mark.parametrize(
+    "pot",
+    [
+        gp.MilkyWayPotential(),
+        gp.BovyMWPotential2014(),
+        gp.CompositePotential(
+            disk=gp.MiyamotoNagaiPotential(m_tot=1e11, a=6.5, b=0.26, units="galactic"),
+            halo=gp.NFWPotential(m=1e12, r_s=20, units="galactic"),
+        ),
+        gp.TransformedPotential(
+            gp.TriaxialHernquistPotential(
+                m_tot=1e12, r_s=1, q1=0.8, q2=0.5, units="galactic"
+            ),
+            cx.ops.GalileanSpatialTranslation.from_([3, 1, 0], "kpc"),
+        ),
+    ],
+)
+def test_freeze(pot: gp.AbstractPotential) -> None:
+    """The frozen potential matches the original and has no array leaves."""
+    frozen = gp.freeze(pot)
+    assert isinstance(frozen, gp.AbstractPotential)
+    assert jax.tree.leaves(frozen) == []
+    assert gp.freeze(frozen) is frozen
+
+    q = u.Quantity(np.random.default_rng(0).normal(size=(4, 3)) * 5, "kpc")
+    t = u.Quantity(0.0, "Gyr")
+    for method in ("potential", "density", "hessian"):
+        got, expect = getattr(frozen, method)(q, t), getattr(pot, method)(q, t)
+        assert jnp.allclose(got, expect, rtol=1e-12, atol=0 * expect)
+    got = convert(frozen.acceleration(q, t), u.Quantity)
+    expect = convert(pot.acceleration(q, t), u.Quantity)
+    assert jnp.allclose(got, expect, rtol=1e-12, atol=0 * expect)
+
+
+def test_freeze_traced() -> None:
+    """Traced potentials cannot be frozen."""
+    pot = gp.KeplerPotential(m_tot=1e11, units="galactic")
+    with pytest.raises(ValueError, match="traced"):
+        jax.jit(gp.freeze)(pot)
@@ -0,0 +1,62 @@
+"""Tests for `galax.potential.radial_profiles`."""
+
+import numpy as np
+
+import coordinax as cx
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+
+
+def test_radial_profiles_hernquist() -> None:
+    """The profiles of a Hernquist potential match the closed forms."""
+    m, a = 1e12, 5.0
+    pot = gp.HernquistPotential(m_tot=m, r_s=a, units="galactic")
+    r = jnp.array([1.0, 5, 20])
+    t = u.Quantity(0, "Gyr")
+    prof = pot.radial_profiles(u.Quantity(r, "kpc"), t)
+
+    G = pot.constants["G"].value
+    assert jnp.allclose(prof.mass_enclosed.value, m * r**2 / (r + a) ** 2)
+    assert jnp.allclose(
+        prof.density.value, m * a / (2 * jnp.pi * r * (r + a) ** 3), rtol=1e-10
+    )
+    assert jnp.allclose(prof.circular_velocity.value, jnp.sqrt(G * m * r) / (r + a))
+    expect = gp.local_circular_velocity(pot, u.Quantity([5.0, 0, 0], "kpc"), t)
+    assert jnp.allclose(
+        prof.circular_velocity[1], expect, atol=u.Quantity(0, "kpc/Myr")
+    )
+    # Spherical: the epicyclic and vertical frequencies follow from Omega.
+    Omega2 = prof.Omega.value**2
+    dOmega2 = G * m * (-1 / r**2 / (r + a) ** 2 - 2 / r / (r + a) ** 3)
+    assert jnp.allclose(prof.kappa.value**2, 4 * Omega2 + r * dOmega2)
+    assert jnp.allclose(prof.nu, prof.Omega, atol=u.Quantity(0, "1/Myr"))
+
+
+def test_radial_profiles_directions() -> None:
+    """Averaging over directions gives the spherical enclosed mass."""
+    # An off-centre point mass: by Gauss's theorem the flux through any sphere
+    # around the origin that contains the mass gives the mass.
+    pot = gp.TransformedPotential(
+        gp.KeplerPotential(m_tot=1e12, units="galactic"),
+        cx.ops.GalileanSpatialTranslation.from_([1, 0, 0], "kpc"),
+    )
+    directions = np.random.default_rng(0).normal(size=(8192, 3))
+    prof = gp.radial_profiles(pot, [2.0, 10.0], 0.0, directions=directions)
+    assert jnp.allclose(prof.mass_enclosed.value, 1e12, rtol=0.02)
+
+    # Along the x-axis alone it is not.
+    prof = gp.radial_profiles(pot, [2.0, 10.0], 0.0)
+    assert jnp.allclose(prof.mass_enclosed.value, 1e12 * jnp.array([4, 100 / 81]))
+
+
+def test_radial_profiles_memoized() -> None:
+    """Repeated queries are served from the cache, per potential."""
+    pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    prof = gp.radial_profiles(pot, [1.0, 2.0], 0.0)
+    assert gp.radial_profiles(pot, [1.0, 2.0], 0.0) is prof
+    assert gp.radial_profiles(pot, [1.0, 3.0], 0.0) is not prof
+
+    other = gp.KeplerPotential(m_tot=2e12, units="galactic")
+    assert gp.radial_profiles(other, [1.0, 2.0], 0.0) is not prof
@@ -0,0 +1,66 @@
+"""Tests for the density grids and projections of potentials."""
+
+import jax
+import pytest
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+from galax.potential._src.base import AbstractPotential
+
+
+def test_density_grid() -> None:
+    """The density grid matches the density at the grid points."""
+    pot = gp.MilkyWayPotential()
+    x = jnp.linspace(-10, 10, 5)
+    z = jnp.array([-1.0, 0, 1])
+    rho = gp.density_grid(pot, x, x, z, 0.0)
+    assert rho.shape == (5, 5, 3)
+
+    q = u.Quantity([x[1], x[3], z[2]], "kpc")
+    expect = pot.density(q, u.Quantity(0, "Gyr"))
+    assert jnp.allclose(rho[1, 3, 2].value, u.ustrip(pot.units["mass density"], expect))
+
+
+def test_surface_density_plummer() -> None:
+    """The projected Plummer sphere matches the closed form."""
+    m, b = 1e10, 1.0
+    pot = gp.PlummerPotential(m_tot=m, b=b, units="galactic")
+    R = jnp.array([0.0, 0.5, 2, 10])
+    sigma = gp.surface_density(pot, R, 0.0, 0.0)
+    assert sigma.unit == u.unit("Msun / kpc2")
+    assert jnp.allclose(sigma.value, m * b**2 / (jnp.pi * (R**2 + b**2) ** 2))
+
+
+def test_composite_density() -> None:
+    """The density of a composite potential is the sum of its components."""
+    pot = gp.MilkyWayPotential()
+    q = u.Quantity([[1.0, 2, 0.3], [8, 0, 0.1]], "kpc")
+    t = u.Quantity(0, "Gyr")
+    usys = pot.units
+    total = sum(u.ustrip(usys["mass density"], p.density(q, t)) for p in pot.values())
+    assert jnp.allclose(u.ustrip(usys["mass density"], pot.density(q, t)), total)
+
+
+@pytest.mark.parametrize(
+    "pot",
+    [
+        gp.TriaxialHernquistPotential(
+            m_tot=1e12, r_s=8, q1=0.9, q2=0.7, units="galactic"
+        ),
+        gp.SatohPotential(m_tot=1e11, a=3, b=1, units="galactic"),
+        gp.HenonHeilesPotential(coeff=1, timescale=1, units="galactic"),
+    ],
+)
+def test_density_closed_form(pot: AbstractPotential) -> None:
+    """The closed-form densities match the autodiff laplacian."""
+    q = jnp.array([[1.0, 2, 3], [0.5, -0.2, 0.1]])
+    usys = pot.units
+    G = u.ustrip(
+        usys["length"] ** 3 / usys["mass"] / usys["time"] ** 2, pot.constants["G"]
+    )
+    lapl = jax.vmap(
+        lambda x: jnp.trace(jax.hessian(lambda y: gp.raw.potential(pot, y, 0.0))(x))
+    )(q)
+    assert jnp.allclose(gp.raw.density(pot, q, 0.0), lapl / (4 * jnp.pi * G))
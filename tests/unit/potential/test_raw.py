@@ -0,0 +1,42 @@
+"""Tests for `galax.potential.raw`."""
+
+import jax
+import numpy as np
+import pytest
+from plum import convert
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+
+
+@pytest.mark.parametrize(
+    "pot", [gp.MilkyWayPotential(), gp.freeze(gp.MilkyWayPotential())]
+)
+def test_raw_matches_functional_api(pot: gp.AbstractPotential) -> None:
+    """The raw functions return the stripped values of the functional API."""
+    usys = pot.units
+    q = np.random.default_rng(0).normal(size=(5, 3)) * 5
+    t = 10.0
+    qq, tq = u.Quantity(q, usys["length"]), u.Quantity(t, usys["time"])
+
+    for name, dim in (
+        ("potential", "specific energy"),
+        ("laplacian", "frequency drift"),
+        ("density", "mass density"),
+        ("hessian", "frequency drift"),
+    ):
+        got = getattr(gp.raw, name)(pot, q, t)
+        expect = getattr(gp, name)(pot, qq, tq)
+        assert isinstance(got, jax.Array)
+        assert jnp.allclose(got, u.ustrip(usys[dim], expect), rtol=1e-12)
+
+    for name in ("gradient", "acceleration"):
+        got = getattr(gp.raw, name)(pot, q, t)
+        expect = convert(getattr(gp, name)(pot, qq, tq), u.Quantity)
+        assert jnp.allclose(got, u.ustrip(usys["acceleration"], expect), rtol=1e-12)
+
+    phi, grad = gp.raw.potential_and_gradient(pot, q, t)
+    assert jnp.allclose(phi, gp.raw.potential(pot, q, t), rtol=1e-12)
+    assert jnp.allclose(grad, gp.raw.gradient(pot, q, t), rtol=1e-12)
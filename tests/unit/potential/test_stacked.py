@@ -0,0 +1,129 @@
+"""Tests for the `galax.potential.StackedPotential` class."""
+
+import functools
+import operator
+from typing import Any, ClassVar
+
+import jax
+import pytest
+from plum import convert
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.potential as gp
+import galax.typing as gt
+from .test_base import AbstractPotential_Test
+
+
+def _sum(xs: Any) -> Any:
+    return functools.reduce(operator.add, xs)
+
+
+class TestStackedPotential(AbstractPotential_Test):
+    """Test the `galax.potential.StackedPotential` class."""
+
+    HAS_GALA_COUNTERPART: ClassVar[bool] = False
+
+    @pytest.fixture(scope="class")
+    def pot_cls(self) -> type[gp.StackedPotential]:
+        return gp.StackedPotential
+
+    @pytest.fixture(scope="class")
+    def components(self, units: u.AbstractUnitSystem) -> list[gp.PlummerPotential]:
+        return [
+            gp.PlummerPotential(
+                m_tot=u.Quantity(m, "Msun"), b=u.Quantity(b, "kpc"), units=units
+            )
+            for m, b in [(1e9, 0.5), (2e9, 1.0), (5e9, 1.5), (1e10, 2.0)]
+        ]
+
+    @pytest.fixture(scope="class")
+    def pot(
+        self,
+        pot_cls: type[gp.StackedPotential],
+        components: list[gp.PlummerPotential],
+    ) -> gp.StackedPotential:
+        return pot_cls(components)
+
+    # ==========================================================================
+
+    def test_init(self, pot_cls, components) -> None:
+        """Test the construction checks."""
+        pot = pot_cls(components)
+        assert len(pot) == len(components)
+        assert pot.units == components[0].units
+        assert pot[2].m_tot(0) == components[2].m_tot(0)
+
+        with pytest.raises(ValueError, match="at least one component"):
+            pot_cls([])
+
+        kepler = gp.KeplerPotential(m_tot=u.Quantity(1e9, "Msun"), units="galactic")
+        with pytest.raises(ValueError, match="same type"):
+            pot_cls([components[0], kepler])
+
+    def test_trace_size(self, units: u.AbstractUnitSystem) -> None:
+        """Test the traced program does not grow with the number of components."""
+
+        def n_eqns(n: int) -> int:
+            pot = gp.StackedPotential(
+                [
+                    gp.PlummerPotential(m_tot=1e9 * (i + 1), b=1.0, units=units)
+                    for i in range(n)
+                ]
+            )
+            q = u.Quantity(jnp.ones((10, 3)), "kpc")
+            t = u.Quantity(0.0, "Myr")
+            f = lambda pot: pot._gradient(q, t)
+            return len(jax.make_jaxpr(f)(pot).eqns)
+
+        assert n_eqns(2) == n_eqns(200)
+
+    def test_in_composite(self, pot, components, x: gt.QuSz3) -> None:
+        """Test a stacked potential as a component of a composite."""
+        kepler = gp.KeplerPotential(m_tot=u.Quantity(1e11, "Msun"), units="galactic")
+        comp = gp.CompositePotential(subhalos=pot, host=kepler)
+        expect = _sum(p.potential(x, t=0) for p in components)
+        expect = expect + kepler.potential(x, t=0)
+        assert jnp.allclose(
+            comp.potential(x, t=0), expect, atol=u.Quantity(1e-12, expect.unit)
+        )
+
+    # ==========================================================================
+
+    def test_potential(self, pot, components, x: gt.QuSz3) -> None:
+        """Test the `StackedPotential.potential` method."""
+        expect = _sum(p.potential(x, t=0) for p in components)
+        assert jnp.allclose(
+            pot.potential(x, t=0), expect, atol=u.Quantity(1e-12, expect.unit)
+        )
+
+    def test_gradient(self, pot, components, batchx: gt.BtQuSz3) -> None:
+        """Test the `StackedPotential.gradient` method."""
+        expect = _sum(convert(p.gradient(batchx, t=0), u.Quantity) for p in components)
+        got = convert(pot.gradient(batchx, t=0), u.Quantity)
+        assert jnp.allclose(got, expect, atol=u.Quantity(1e-12, expect.unit))
+
+    def test_density(self, pot, components, batchx: gt.BtQuSz3) -> None:
+        """Test the `StackedPotential.density` method."""
+        expect = _sum(p.density(batchx, t=0) for p in components)
+        assert jnp.allclose(
+            pot.density(batchx, t=0), expect, atol=u.Quantity(1e-6, expect.unit)
+        )
+
+    def test_hessian(self, pot, components, x: gt.QuSz3) -> None:
+        """Test the `StackedPotential.hessian` method."""
+        expect = _sum(p.hessian(x, t=0) for p in components)
+        assert jnp.allclose(
+            pot.hessian(x, t=0), expect, atol=u.Quantity(1e-12, expect.unit)
+        )
+
+    # ---------------------------------
+    # Convenience methods
+
+    def test_tidal_tensor(self, pot, components, x: gt.QuSz3) -> None:
+        """Test the `StackedPotential.tidal_tensor` method."""
+        expect = _sum(p.tidal_tensor(x, t=0) for p in components)
+        assert jnp.allclose(
+            pot.tidal_tensor(x, t=0), expect, atol=u.Quantity(1e-12, expect.unit)
+        )
@@ -0,0 +1,49 @@
+"""Tests for `galax.compile_cache`."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import jax
+import pytest
+
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.compile_cache
+import galax.potential as gp
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    """Enable the cache in a temporary directory for the test."""
+    yield galax.compile_cache.enable(tmp_path)
+    galax.compile_cache.disable()
+
+
+def test_enable(cache_dir: Path) -> None:
+    """Compiled programs are written to, and read from, the cache."""
+    assert cache_dir.parent.exists()
+    assert cache_dir.name == f"galax-{galax.__version__}"
+
+    @jax.jit
+    def f(x: jax.Array) -> jax.Array:
+        return jnp.sin(x) * 31.0
+
+    x = jnp.ones(3)
+    galax.compile_cache.reset_stats()
+    f(x)
+    assert galax.compile_cache.stats() == (0, 1)
+    assert any(cache_dir.iterdir())
+
+    jax.clear_caches()  # forget the in-memory program
+    f(x)
+    assert galax.compile_cache.stats() == (1, 1)
+
+
+def test_warmup() -> None:
+    """Warming up compiles the integration for each batch shape."""
+    pot = gp.KeplerPotential(m_tot=1e12, units="galactic")
+    ts = u.Quantity(jnp.linspace(0, 1, 5), "Gyr")
+    timings = galax.compile_cache.warmup(pot, [(), (3,)], ts=ts)
+    assert list(timings) == [(), (3,)]
+    assert all(t > 0 for t in timings.values())